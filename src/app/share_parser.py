@@ -35,7 +35,7 @@ class ShareParser:
     def __init__(self, f_config: str) -> None:
         # parsing the configuration
         self._f_config = f_config
-        self._config = ConfigEnv(f_config)
+        self._config = ConfigEnv.get_instance(f_config)
         self._p_share_infos = self._config.get_ref(CONFIG_PATH_DEPOTHISTORIE)
         self._file_analyzer = FileAnalyzer(self._p_share_infos)
         # prepare file list
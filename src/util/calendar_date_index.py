@@ -0,0 +1,135 @@
+"""Date Index (day bitmap) for fast date membership and date range queries"""
+
+import logging
+from datetime import date as Date
+from datetime import datetime as DateTime
+from typing import Iterable, List
+
+from cli.bootstrap_env import CLI_LOG_LEVEL
+
+logger = logging.getLogger(__name__)
+# get log level from environment if given
+logger.setLevel(CLI_LOG_LEVEL)
+
+
+class DateIndex:
+    """Set of calendar days stored as bitmap (one byte per day, offset by the first day ordinal).
+    membership is checked by day (time of a datetime is ignored)
+    """
+
+    def __init__(self, dates: Iterable[Date] = None, date_ranges: Iterable[list] = None):
+        """constructor, dates as list of dates, date_ranges as list of [date_from,date_to]"""
+        self._offset: int = 0
+        self._bitmap: bytearray = bytearray()
+        _ordinal_ranges = []
+        if dates is not None:
+            _ordinal_ranges.extend([(_date.toordinal(), _date.toordinal()) for _date in dates])
+        if date_ranges is not None:
+            for _date_from, _date_to in date_ranges:
+                # same number of days as iterating from date_from in steps of 1 day
+                _num_days = (_date_to - _date_from).days
+                if _num_days < 0:
+                    continue
+                _ordinal_from = _date_from.toordinal()
+                _ordinal_ranges.append((_ordinal_from, _ordinal_from + _num_days))
+        if len(_ordinal_ranges) == 0:
+            return
+        self._offset = min([_ordinal_from for _ordinal_from, _ in _ordinal_ranges])
+        _max_ordinal = max([_ordinal_to for _, _ordinal_to in _ordinal_ranges])
+        self._bitmap = bytearray(_max_ordinal - self._offset + 1)
+        for _ordinal_from, _ordinal_to in _ordinal_ranges:
+            _idx_from = _ordinal_from - self._offset
+            _idx_to = _ordinal_to - self._offset + 1
+            self._bitmap[_idx_from:_idx_to] = b"\x01" * (_idx_to - _idx_from)
+
+    @classmethod
+    def _from_bitmap(cls, offset: int, bitmap: bytearray) -> "DateIndex":
+        """creates an index from a bitmap"""
+        out = cls()
+        out._offset = offset
+        out._bitmap = bitmap
+        return out
+
+    def _get_idx(self, date: Date) -> int | None:
+        """returns the bitmap index or None if out of bitmap"""
+        _idx = date.toordinal() - self._offset
+        if _idx < 0 or _idx >= len(self._bitmap):
+            return None
+        return _idx
+
+    def __contains__(self, date: Date) -> bool:
+        """checks whether the day is in the index"""
+        if not isinstance(date, Date):
+            return False
+        _idx = self._get_idx(date)
+        return _idx is not None and self._bitmap[_idx] == 1
+
+    def __len__(self) -> int:
+        """number of days in index"""
+        return self._bitmap.count(1)
+
+    def _combine(self, other: "DateIndex", is_and: bool) -> "DateIndex":
+        """combines two bitmaps on the common range (and) or the overall range (or)"""
+        if is_and:
+            _offset = max(self._offset, other._offset)
+            _end = min(self._offset + len(self._bitmap), other._offset + len(other._bitmap))
+        else:
+            _offset = min(self._offset, other._offset)
+            _end = max(self._offset + len(self._bitmap), other._offset + len(other._bitmap))
+        if _end <= _offset:
+            return DateIndex()
+        _num_days = _end - _offset
+        # align both bitmaps to the same range and combine them as integers
+        _bitmaps = []
+        for _index in [self, other]:
+            _bitmap = bytearray(_num_days)
+            _idx_from = max(_index._offset - _offset, 0)
+            _idx_to = min(_index._offset + len(_index._bitmap) - _offset, _num_days)
+            if _idx_to > _idx_from:
+                _src_from = _offset + _idx_from - _index._offset
+                _bitmap[_idx_from:_idx_to] = _index._bitmap[_src_from : _src_from + _idx_to - _idx_from]
+            _bitmaps.append(int.from_bytes(_bitmap, "big"))
+        _combined = _bitmaps[0] & _bitmaps[1] if is_and else _bitmaps[0] | _bitmaps[1]
+        return DateIndex._from_bitmap(_offset, bytearray(_combined.to_bytes(_num_days, "big")))
+
+    def intersection(self, other: "DateIndex") -> "DateIndex":
+        """returns the days contained in both indices"""
+        return self._combine(other, is_and=True)
+
+    def union(self, other: "DateIndex") -> "DateIndex":
+        """returns the days contained in any of the indices"""
+        return self._combine(other, is_and=False)
+
+    def __and__(self, other: "DateIndex") -> "DateIndex":
+        return self.intersection(other)
+
+    def __or__(self, other: "DateIndex") -> "DateIndex":
+        return self.union(other)
+
+    def _get_range(self, date_from: Date = None, date_to: Date = None) -> tuple:
+        """returns the bitmap index range [from,to) for the date range (None: open interval)"""
+        _idx_from = 0
+        _idx_to = len(self._bitmap)
+        if date_from is not None:
+            _idx_from = min(max(date_from.toordinal() - self._offset, 0), _idx_to)
+        if date_to is not None:
+            _idx_to = max(min(date_to.toordinal() - self._offset + 1, _idx_to), _idx_from)
+        return (_idx_from, _idx_to)
+
+    def dates(self, date_from: Date = None, date_to: Date = None) -> List[DateTime]:
+        """returns the sorted list of dates (as datetime) in the index, optionally for a date range"""
+        out = []
+        _idx, _idx_to = self._get_range(date_from, date_to)
+        _find = self._bitmap.find
+        while True:
+            _idx = _find(1, _idx, _idx_to)
+            if _idx == -1:
+                break
+            out.append(DateTime.fromordinal(self._offset + _idx))
+            _idx += 1
+        return out
+
+    def count(self, date_from: Date = None, date_to: Date = None) -> int:
+        """returns number of days in the index, optionally for a date range"""
+        _idx_from, _idx_to = self._get_range(date_from, date_to)
+        return self._bitmap.count(1, _idx_from, _idx_to)
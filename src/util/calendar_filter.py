@@ -13,6 +13,7 @@ from model.model_calendar import (
 
 # regex to extract todo_txt string matching signature @(...)
 from util import constants as C
+from util.calendar_date_index import DateIndex
 from util.datetime_util import WEEKDAY_NUM, WEEKDAY, DateTimeUtil
 from cli.bootstrap_env import CLI_LOG_LEVEL
 
@@ -44,6 +45,7 @@ class CalendarFilter:
         # track the origin of found dateranges
         self._daterange_origin: dict = {}
         self._daterange_list: list = []
+        self._date_index: DateIndex = None
 
         # information only storing artifacts
         self._parsed_infos: dict = {}
@@ -64,6 +66,13 @@ class CalendarFilter:
                 _date += timedelta(days=1)
         return sorted(list(set(date_list)))
 
+    @property
+    def date_index(self) -> DateIndex:
+        """returns the filtered days as date index (day bitmap)"""
+        if self._date_index is None:
+            self._date_index = DateIndex(date_ranges=self._daterange_list)
+        return self._date_index
+
     def _add_filter_list(self, date_list=List[List[DateTime] | DateTime]) -> None:
         """adding datefrom dateto lists to attribute"""
         if date_list is None:
@@ -11,8 +11,9 @@ from model.model_calendar import (
 )
 
 # regex to extract todo_txt string matching signature @(...)
-from util.calendar_constants import REGEX_YYYYMMDD, WEEK_INDEX_NEXT_YEAR, WEEK_INDEX_PREVIOUS_YEAR
+from util.calendar_constants import REGEX_YYYYMMDD, WEEK_INDEX_NEXT_YEAR
 from util.calendar_filter import CalendarFilter
+from util.calendar_table import CalendarTable, CalendarYearTable
 from util.datetime_util import DAYS_IN_MONTH, DateTimeUtil
 from util.utils import Utils
 from cli.bootstrap_env import CLI_LOG_LEVEL
@@ -31,19 +32,24 @@ class CalendarIndex:
             year = DateTime.now().year
         self._year: int = year
         self._index_type: IndexType = index_type
-        self._year_index: Dict[int, CalendarIndexType] = DateTimeUtil.year_index(year)
+        # process wide cached day attributes of the year
+        self._year_table: CalendarYearTable = CalendarTable.get_year(year)
+        self._year_index: Dict[int, CalendarIndexType] = self._year_table.get_year_index()
         self._indices: dict = {
             IndexType.INDEX_DATETIME: [],
             IndexType.INDEX_DAY_IN_YEAR: [],
             IndexType.INDEX_MONTH_DAY: [],
         }
+        # lookup of list index by datetime and by (month,day)
+        self._idx_by_datetime: Dict[DateTime, int] = {}
+        self._idx_by_month_day: Dict[tuple, int] = {}
         self._create_indices()
-        _isoweek_year: dict = DateTimeUtil.get_isoweekyear(year)
+        _isoweek_year: dict = self._year_table.get_isoweekyear()
         self._first_monday: DateTime = _isoweek_year["first_monday"]
         self._last_monday: DateTime = _isoweek_year["last_monday"]
         self._last_sunday: DateTime = _isoweek_year["last_day"]
         self._num_weeks: int = _isoweek_year["weeks"]
-        self._is_leap_year: bool = self._year_index[1].is_leap_year
+        self._is_leap_year: bool = DateTimeUtil.is_leap_year(year)
         self._days_in_year = 365
         if self._is_leap_year:
             self._days_in_year += 1
@@ -52,6 +58,8 @@ class CalendarIndex:
         self._month_indices: list = None
         self._calc_indices()
         self._calendar_filter = None
+        # month / week maps by index type (see _get_maps)
+        self._maps: Dict[IndexType, dict] = {}
 
     @property
     def calendar_filter(self):
@@ -98,6 +106,8 @@ class CalendarIndex:
             self._indices[IndexType.INDEX_DATETIME].append(_idx_info.datetime)
             self._indices[IndexType.INDEX_DAY_IN_YEAR].append(_idx)
             self._indices[IndexType.INDEX_MONTH_DAY].append([_idx_info.month, _idx_info.day])
+            self._idx_by_datetime[_idx_info.datetime] = _idx - 1
+            self._idx_by_month_day[(_idx_info.month, _idx_info.day)] = _idx - 1
 
     def set_filter(self, filter_s: str = None, date_list: List[List[DateTime] | DateTime] = None) -> None:
         """setting a calendar filter"""
@@ -134,29 +144,26 @@ class CalendarIndex:
         if self._calendar_filter is None:
             return self.index_map(key_index, value_index)
 
-        # create a date index
-        _date_index = self._indices[IndexType.INDEX_DATETIME]
         _key_index = self._indices[key_index]
         _value_index = self._indices[value_index]
-        _dates = self.calendar_filter.datelist
+        # only items for current year will be selected
+        _dates = self._get_filtered_dates()
         # create a mask
         if as_mask:
             out = dict(zip(_key_index, len(_key_index) * [None]))
 
         for _date in _dates:
-            # get the index from date index
-            try:
-                _idx = _date_index.index(_date)
-            # only items for current year will be selected
-            except ValueError:
-                logger.debug(f"[CalendarIndex] Date [{_date}] is out of index of year {self._year}")
-                continue
+            _idx = self._idx_by_datetime[_date]
             _key = _key_index[_idx]
             _value = _value_index[_idx]
             out[_key] = _value
 
         return out
 
+    def _get_filtered_dates(self) -> List[DateTime]:
+        """returns the filtered dates of the index year"""
+        return self._calendar_filter.date_index.dates(DateTime(self._year, 1, 1), DateTime(self._year, 12, 31))
+
     def month_week_filter_map(
         self, key_index: IndexType = None, value_index: IndexType = None, short: bool = False
     ) -> Dict[int, Dict[int, Any]]:
@@ -168,13 +175,10 @@ class CalendarIndex:
         out = {}
         _, _value_index = self._default_key_value_index(key_index, value_index)
         _weeknum_map_datetime = self.weeknum_map(index_type=IndexType.INDEX_DATETIME)
-        _date_index = self._indices[IndexType.INDEX_DATETIME]
         _value_index = self._indices[_value_index]
 
-        for _date in self._calendar_filter.datelist:
-            if not _date.year == self._year:
-                continue
-            _idx = _date_index.index(_date)
+        for _date in self._get_filtered_dates():
+            _idx = self._idx_by_datetime[_date]
             _m = _date.month
             _w = _weeknum_map_datetime.get(_date)
             if _w is None:
@@ -215,9 +219,9 @@ class CalendarIndex:
             if isinstance(key, int):
                 _index = key - 1
             elif Utils.is_list_or_tuple(key):
-                _index = self._indices[IndexType.INDEX_MONTH_DAY].index(list(key))
+                _index = self._idx_by_month_day[tuple(key)]
             elif isinstance(key, DateTime):
-                _index = self._indices[IndexType.INDEX_DATETIME].index(key)
+                _index = self._idx_by_datetime[key]
 
             _info = self._year_index[_index + 1]
 
@@ -235,91 +239,66 @@ class CalendarIndex:
 
         return _info
 
-    def month_map(self, index_type: IndexType = None) -> Dict[int, List[Any]]:
-        """returns index keys by month"""
+    def _get_values(self, index_type: IndexType) -> list:
+        """returns the index values of all days for an index type (calendar index info if there is no index)"""
+        _values = self._indices.get(index_type)
+        if _values is None:
+            _values = list(self._year_index.values())
+        return _values
+
+    def _get_maps(self, index_type: IndexType = None) -> dict:
+        """returns month, week, monthweek and weeknum maps of an index type,
+        all maps are created in one pass over the year table and are cached per index type
+        """
         if index_type is None:
             index_type = self._index_type
-        _map = self.index_map(value_index=index_type)
-        _values = list(_map.values())
-        _month_indices = self._month_indices
-        out = {_m: [] for _m in range(1, 13)}
-        for _m in range(12):
-            # adjust indices
-            try:
-                _idx_from = max(_month_indices[_m] - 1, 0)
-                _idx_to = min(_month_indices[_m + 1] - 1, self._days_in_year)
-                out[_m + 1] = _values[_idx_from:_idx_to]
-            except IndexError:
-                pass
+        _maps = self._maps.get(index_type)
+        if _maps is not None:
+            return _maps
 
-        return out
-
-    def week_map(self, index_type: IndexType = None) -> Dict[int, List[Any]]:
-        """returns index keys by week"""
-        if index_type is None:
-            index_type = self._index_type
-        _map = self.index_map(value_index=index_type)
-        _values = list(_map.values())
-        _week_indices = self._week_indices
-        _num_weeks = self._num_weeks
+        _month_map = {_m: [] for _m in range(1, 13)}
         # 0 and 99 are items reserved for previous year and follow up year
-        out = {_w: [] for _w in range(0, _num_weeks + 1)}
-        out[WEEK_INDEX_NEXT_YEAR] = []
-        for _w in range(_num_weeks):
-            # adjust indices
-            try:
-                _idx_from = max(_week_indices[_w] - 1, 0)
-                _idx_to = min(_week_indices[_w + 1] - 1, self._days_in_year)
-                out[_w + 1] = _values[_idx_from:_idx_to]
-            except IndexError:
-                pass
-        # add edge case for lower end (=last week of previous calender year)
-        if _week_indices[0] > 1:
-            out[WEEK_INDEX_PREVIOUS_YEAR] = _values[: _week_indices[0] - 1]
-        # add items to the last bucket, if the new calendar week 1 already begins in the old year
-        if self._last_sunday.year == self._year:
-            _num_remaining_days = -1 * (DateTime(self._year, 12, 31) - self._last_sunday).days
-            if _num_remaining_days < 0:
-                out[WEEK_INDEX_NEXT_YEAR] = _values[_num_remaining_days:]
+        _week_map = {_w: [] for _w in range(0, self._num_weeks + 1)}
+        _week_map[WEEK_INDEX_NEXT_YEAR] = []
+        _monthweek_map = {_m: {} for _m in range(1, 13)}
+        _weeknum_map = {}
+        _months = self._year_table.month
+        _days = self._year_table.day
+        _week_keys = self._year_table.get_week_keys()
+        for _idx, _value in enumerate(self._get_values(index_type)):
+            _m = _months[_idx]
+            _w = _week_keys[_idx]
+            _month_map[_m].append(_value)
+            _week_map[_w].append(_value)
+            _m_dict = _monthweek_map[_m]
+            _w_dict = _m_dict.get(_w)
+            if _w_dict is None:
+                _w_dict = {}
+                _m_dict[_w] = _w_dict
+            _w_dict[_days[_idx]] = _value
+            # convert key so it can be used as dict key
+            if index_type == IndexType.INDEX_MONTH_DAY:
+                _value = tuple(_value)
+            _weeknum_map[_value] = _w
+
+        _maps = {"month": _month_map, "week": _week_map, "monthweek": _monthweek_map, "weeknum": _weeknum_map}
+        self._maps[index_type] = _maps
+        return _maps
 
-        return out
+    def month_map(self, index_type: IndexType = None) -> Dict[int, List[Any]]:
+        """returns index keys by month (cached, don't modify the returned dict)"""
+        return self._get_maps(index_type)["month"]
+
+    def week_map(self, index_type: IndexType = None) -> Dict[int, List[Any]]:
+        """returns index keys by week (cached, don't modify the returned dict)"""
+        return self._get_maps(index_type)["week"]
 
     def monthweek_map(self, index_type: IndexType = None) -> Dict[int, Dict[int, Dict[int, Any]]]:
-        """Returns a Month Week Map (Month,Calendar,Week,Day)"""
-        if index_type is None:
-            index_type = self._index_type
-        out = {_m: {} for _m in range(1, 13)}
-        # brute force assignment loop over all items
-        _weekmap = self.week_map(IndexType.INDEX_MONTH_DAY)
-        for _w, _md_list in _weekmap.items():
-            for _md in _md_list:
-                _m = _md[0]
-                _d = _md[1]
-                _m_dict = out[_m]
-                _w_dict = _m_dict.get(_w)
-                if _w_dict is None:
-                    _w_dict = {}
-                    _m_dict[_w] = _w_dict
-                _value = self.info(_md, index_type)
-                _w_dict[_d] = _value
-        return out
+        """Returns a Month Week Map (Month,Calendar,Week,Day) (cached, don't modify the returned dict)"""
+        return self._get_maps(index_type)["monthweek"]
 
     def weeknum_map(self, index_type: IndexType = None) -> Dict[Any, int]:
-        """Returns a lookup dict with index type as key, returning Calendar week"""
-        out = {}
-
-        if index_type is None:
-            index_type = self._index_type
-
-        _monthweek_map = self.monthweek_map(index_type)
-        for _m in range(1, 13):
-            _month_dict = _monthweek_map[_m]
-            for _w, _day_info in _month_dict.items():
-                _day_list = list(_day_info.values())
-                # convert key so it can be used as dict key
-                if index_type == IndexType.INDEX_MONTH_DAY:
-                    _day_list = [tuple(_d) for _d in _day_list]
-
-                _week_list = [_w] * len(_day_list)
-                out.update(dict(zip(_day_list, _week_list)))
-        return out
+        """Returns a lookup dict with index type as key, returning Calendar week
+        (cached, don't modify the returned dict)
+        """
+        return self._get_maps(index_type)["weeknum"]
@@ -0,0 +1,281 @@
+"""Calendar Table: process wide precomputed day attributes (ISO weeks, holidays) per calendar year"""
+
+import logging
+import os
+import sys
+from array import array
+from datetime import datetime as DateTime
+from datetime import timedelta
+from typing import Dict, List
+
+from cli.bootstrap_env import CLI_LOG_LEVEL
+from model.model_calendar import CalendarIndexType
+from util.calendar_constants import WEEK_INDEX_NEXT_YEAR, WEEK_INDEX_PREVIOUS_YEAR
+from util.datetime_util import DateTimeUtil
+from util.persistence import Persistence
+
+logger = logging.getLogger(__name__)
+# get log level from environment if given
+logger.setLevel(CLI_LOG_LEVEL)
+
+
+class CalendarYearTable:
+    """day attributes of a calendar year stored as arrays (0-based day index)"""
+
+    def __init__(self, year: int) -> None:
+        """constructor, calculates all days in one pass"""
+        self._year: int = year
+        self._first_ordinal: int = DateTime(year, 1, 1).toordinal()
+        self._num_days: int = DateTime(year + 1, 1, 1).toordinal() - self._first_ordinal
+        self._month = array("b")
+        self._day = array("b")
+        self._weekday = array("b")
+        self._calendar_week = array("b")
+        self._iso_year = array("h")
+        # day index > holiday name
+        self._holidays: Dict[int, str] = {}
+        # first mondays of isoweek years year-1, year and year+1
+        self._first_mondays: list = []
+        self._calc_days()
+
+    def _calc_days(self) -> None:
+        """calculates month, day, weekday and isoweek of each day"""
+        self._first_mondays = [DateTimeUtil.get_1st_isoweek_date(_y) for _y in range(self._year - 1, self._year + 2)]
+        _monday_ordinals = [_d.toordinal() for _d in self._first_mondays]
+        for _idx in range(self._num_days):
+            _ordinal = self._first_ordinal + _idx
+            _date = DateTime.fromordinal(_ordinal)
+            # isoweek year the day belongs to: the last isoweek year started before the day
+            _iso_idx = 0
+            while _iso_idx < 2 and _ordinal >= _monday_ordinals[_iso_idx + 1]:
+                _iso_idx += 1
+            self._month.append(_date.month)
+            self._day.append(_date.day)
+            # ordinal 1 (0001-01-01) is a monday
+            self._weekday.append((_ordinal - 1) % 7 + 1)
+            self._calendar_week.append((_ordinal - _monday_ordinals[_iso_idx]) // 7 + 1)
+            self._iso_year.append(self._year - 1 + _iso_idx)
+        for _date, _holiday in DateTimeUtil.get_holiday_dates(self._year).items():
+            self._holidays[_date.toordinal() - self._first_ordinal] = _holiday["name"]
+
+    @property
+    def year(self) -> int:
+        """calendar year"""
+        return self._year
+
+    @property
+    def num_days(self) -> int:
+        """number of days in year"""
+        return self._num_days
+
+    @property
+    def month(self) -> array:
+        """months of days"""
+        return self._month
+
+    @property
+    def day(self) -> array:
+        """days of month of days"""
+        return self._day
+
+    @property
+    def weekday(self) -> array:
+        """isoweekdays of days (1:monday)"""
+        return self._weekday
+
+    @property
+    def calendar_week(self) -> array:
+        """isoweek numbers of days (isoweek of the isoweek year of the day)"""
+        return self._calendar_week
+
+    @property
+    def iso_year(self) -> array:
+        """isoweek years of days"""
+        return self._iso_year
+
+    @property
+    def holidays(self) -> Dict[int, str]:
+        """holiday names by day index"""
+        return self._holidays
+
+    def get_datetime(self, idx: int) -> DateTime:
+        """returns the datetime of a day index"""
+        return DateTime.fromordinal(self._first_ordinal + idx)
+
+    def get_isoweekyear(self) -> dict:
+        """returns isoweek properties of the calendar year, same as DateTimeUtil.get_isoweekyear"""
+        _first_monday = self._first_mondays[1]
+        _last_monday = self._first_mondays[2] - timedelta(days=7)
+        return {
+            "first_monday": _first_monday,
+            "last_monday": _last_monday,
+            "last_day": _last_monday + timedelta(days=6),
+            "weeks": (self._first_mondays[2] - _first_monday).days // 7,
+            "year": self._year,
+        }
+
+    def get_week_keys(self) -> List[int]:
+        """returns the calendar week of each day, days of the last isoweek of the previous year
+        get WEEK_INDEX_PREVIOUS_YEAR and days of the first isoweek of the next year WEEK_INDEX_NEXT_YEAR
+        """
+        out = []
+        for _calendar_week, _iso_year in zip(self._calendar_week, self._iso_year):
+            if _iso_year < self._year:
+                out.append(WEEK_INDEX_PREVIOUS_YEAR)
+            elif _iso_year > self._year:
+                out.append(WEEK_INDEX_NEXT_YEAR)
+            else:
+                out.append(_calendar_week)
+        return out
+
+    def get_ranges(self, keys: list) -> Dict[int, tuple]:
+        """returns index ranges (from,to) of consecutive keys"""
+        out = {}
+        _idx_from = 0
+        for _idx in range(1, len(keys) + 1):
+            if _idx == len(keys) or keys[_idx] != keys[_idx_from]:
+                out[keys[_idx_from]] = (_idx_from, _idx)
+                _idx_from = _idx
+        return out
+
+    def get_month_ranges(self) -> Dict[int, tuple]:
+        """returns index ranges (from,to) of each month"""
+        return self.get_ranges(self._month)
+
+    def get_week_ranges(self) -> Dict[int, tuple]:
+        """returns index ranges (from,to) of each calendar week"""
+        return self.get_ranges(self.get_week_keys())
+
+    def get_year_index(self) -> Dict[int, CalendarIndexType]:
+        """creates a year index (1-based day in year > CalendarIndexType), same as DateTimeUtil.year_index"""
+        out = {}
+        for _idx in range(self._num_days):
+            _weekday = self._weekday[_idx]
+            _iso_year = self._iso_year[_idx]
+            _month = self._month[_idx]
+            _day = self._day[_idx]
+            _holiday = self._holidays.get(_idx)
+            # created without validation, all values are of the field types
+            out[_idx + 1] = CalendarIndexType.model_construct(
+                datetime=self.get_datetime(_idx),
+                year=_iso_year,
+                month=_month,
+                day=_day,
+                day_in_year=_idx + 1,
+                calendar_week=self._calendar_week[_idx],
+                month_day=[_month, _day],
+                weekday=_weekday,
+                holiday=_holiday,
+                is_leap_year=DateTimeUtil.is_leap_year(_iso_year),
+                is_holiday=_holiday is not None,
+                is_weekend=_weekday > 5,
+                is_workday=_weekday <= 5,
+            )
+        return out
+
+    def to_dict(self) -> dict:
+        """returns the table as dict (can be saved as json)"""
+        return {
+            "year": self._year,
+            "month": self._month.tolist(),
+            "day": self._day.tolist(),
+            "weekday": self._weekday.tolist(),
+            "calendar_week": self._calendar_week.tolist(),
+            "iso_year": self._iso_year.tolist(),
+            "holidays": {str(_idx): _name for _idx, _name in self._holidays.items()},
+            "first_mondays": [_d.strftime("%Y%m%d") for _d in self._first_mondays],
+        }
+
+    @classmethod
+    def from_dict(cls, table_dict: dict) -> "CalendarYearTable":
+        """creates the table from a dict created by to_dict"""
+        out = cls.__new__(cls)
+        out._year = table_dict["year"]
+        out._first_ordinal = DateTime(out._year, 1, 1).toordinal()
+        out._num_days = DateTime(out._year + 1, 1, 1).toordinal() - out._first_ordinal
+        out._month = array("b", table_dict["month"])
+        out._day = array("b", table_dict["day"])
+        out._weekday = array("b", table_dict["weekday"])
+        out._calendar_week = array("b", table_dict["calendar_week"])
+        out._iso_year = array("h", table_dict["iso_year"])
+        out._holidays = {int(_idx): _name for _idx, _name in table_dict["holidays"].items()}
+        out._first_mondays = [DateTime.strptime(_d, "%Y%m%d") for _d in table_dict["first_mondays"]]
+        if len(out._month) != out._num_days:
+            raise ValueError(f"Calendar table for year [{out._year}] has [{len(out._month)}] days")
+        return out
+
+
+class CalendarTable:
+    """process wide cache of calendar year tables, can be persisted as json file"""
+
+    _years: Dict[int, CalendarYearTable] = {}
+
+    @staticmethod
+    def get_year(year: int = None) -> CalendarYearTable:
+        """returns the (cached) table of a calendar year"""
+        if year is None:
+            year = DateTime.now().year
+        _table = CalendarTable._years.get(year)
+        if _table is None:
+            _table = CalendarYearTable(year)
+            CalendarTable._years[year] = _table
+        return _table
+
+    @staticmethod
+    def get_years(year_from: int, year_to: int, f_cache: str = None) -> Dict[int, CalendarYearTable]:
+        """returns the tables of a year range (including year_to), if a cache file path is supplied
+        the tables will be read from / new tables will be added to the file
+        """
+        _save = False
+        if f_cache is not None:
+            _save = not os.path.isfile(f_cache)
+            CalendarTable.load(f_cache)
+        _num_years = len(CalendarTable._years)
+        out = {_year: CalendarTable.get_year(_year) for _year in range(year_from, year_to + 1)}
+        if f_cache is not None and (_save or len(CalendarTable._years) > _num_years):
+            CalendarTable.save(f_cache)
+        return out
+
+    @staticmethod
+    def load(f_cache: str) -> int:
+        """loads the tables from a json file into the cache, returns number of loaded tables"""
+        if not os.path.isfile(f_cache):
+            return 0
+        _tables = Persistence.read_json(f_cache)
+        if not isinstance(_tables, dict):
+            logger.warning(f"[CalendarTable] Invalid calendar cache file [{f_cache}]")
+            return 0
+        _num_loaded = 0
+        for _year_s, _table_dict in _tables.items():
+            if int(_year_s) in CalendarTable._years:
+                continue
+            try:
+                CalendarTable._years[int(_year_s)] = CalendarYearTable.from_dict(_table_dict)
+                _num_loaded += 1
+            except (KeyError, TypeError, ValueError, OverflowError) as e:
+                logger.warning(f"[CalendarTable] Couldn't load year [{_year_s}] from [{f_cache}], {e}")
+        logger.debug(f"[CalendarTable] Loaded [{_num_loaded}] years from [{f_cache}]")
+        return _num_loaded
+
+    @staticmethod
+    def save(f_cache: str) -> None:
+        """saves all cached tables as json file"""
+        _tables = {str(_year): _table.to_dict() for _year, _table in sorted(CalendarTable._years.items())}
+        Persistence.save_json(f_cache, _tables)
+        logger.debug(f"[CalendarTable] Saved [{len(_tables)}] years to [{f_cache}]")
+
+    @staticmethod
+    def clear() -> None:
+        """clears the cache"""
+        CalendarTable._years = {}
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        format="%(asctime)s %(levelname)s %(module)s:[%(name)s.%(funcName)s(%(lineno)d)]: %(message)s",
+        level=CLI_LOG_LEVEL,
+        stream=sys.stdout,
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    _tables = CalendarTable.get_years(2020, 2030)
+    print(_tables[2025].get_week_ranges())
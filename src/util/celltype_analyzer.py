@@ -15,6 +15,7 @@ from model.model_celltype import (
     CellTypeMetaStatsDictAdapter,
 )
 from cli.bootstrap_env import CLI_LOG_LEVEL
+from util.sketch import FieldSketch
 
 logger = logging.getLogger(__name__)
 # get log level from environment if given
@@ -24,14 +25,16 @@ logger.setLevel(CLI_LOG_LEVEL)
 class CellTypeAnalyzer:
     """Analyzing Data Columns"""
 
-    def __init__(self, celltype_meta: List[CellTypeMeta] = None):
-        """constructor"""
+    def __init__(self, celltype_meta: List[CellTypeMeta] = None, sketches: bool = False):
+        """constructor, sketches activates streaming quantile, histogram and distinct count sketches per field"""
         self._object_type: CellType = None
         self._object: object = None
         self._field_stats: CellTypeMetaDictType = {}
         self._celltype_meta: Dict[str, CellTypeMeta] = {}
         self.set_celltype_meta(celltype_meta)
         self._is_active: bool = True
+        self._sketches: bool = sketches
+        self._field_sketches: Dict[str, FieldSketch] = {}
 
     # https://www.perplexity.ai/search/pydantic-root-model-get-fields-1mrSGwXASqG8new9aAmJhw
 
@@ -180,6 +183,15 @@ class CellTypeAnalyzer:
         self._field_stats[field_name] = _cell_meta
         return _cell_meta
 
+    def _add_to_sketch(self, field_name: str, values: list) -> None:
+        """adds values to the sketches of a field"""
+        _field_sketch = self._field_sketches.get(field_name)
+        if _field_sketch is None:
+            _field_sketch = FieldSketch()
+            self._field_sketches[field_name] = _field_sketch
+        for _value in values:
+            _field_sketch.add(_value)
+
     def _analyze_primitive(
         self, obj: object, field_name: str = None, description: str = None, objkey: object = None
     ) -> None:
@@ -189,6 +201,8 @@ class CellTypeAnalyzer:
         # no field given assume it's a primitive field
         if _field_name is None:
             _field_name = CellType.PRIMITIVE
+        if self._sketches:
+            self._add_to_sketch(_field_name, [obj])
         _field_meta_stats = self._field_stats.get(_field_name)
         # initialize field meta data
         if _field_meta_stats is None:
@@ -237,6 +251,136 @@ class CellTypeAnalyzer:
             logger.warning(f"[CellTypeAnalyzer] object [{obj}] is of type [{type(obj)}] and not supported")
             return
 
+    def _analyze_column(self, field_name: str, values: list, objkeys: list, description: str = None) -> None:
+        """analyze all values of a field in one pass, results are the same as analyzing value by value"""
+        if len(values) == 0:
+            return
+        if self._sketches:
+            self._add_to_sketch(field_name, values)
+        _field_meta_stats = self._field_stats.get(field_name)
+        # initialize field meta data with first value
+        if _field_meta_stats is None:
+            _field_meta_stats = self._init_field_meta(values[0], field_name, description, objkeys[0])
+            values = values[1:]
+            objkeys = objkeys[1:]
+            if len(values) == 0:
+                return
+
+        _expected_cell_type = _field_meta_stats.expected_cell_type
+        _field_meta_stats.num = _field_meta_stats.num + len(values)
+        if _expected_cell_type is None:
+            _field_meta_stats.last_seen_cell_type = CellTypeAnalyzer.get_object_type(values[-1])
+        else:
+            _field_meta_stats.last_seen_cell_type = None
+
+        _num_invalid = 0
+        if _expected_cell_type in [None, CellType.INT, CellType.FLOAT, CellType.NUMERICAL]:
+            _idx_numbers = [_idx for _idx, _value in enumerate(values) if isinstance(_value, (float, int))]
+            if _expected_cell_type is None:
+                _field_meta_stats.num_str = _field_meta_stats.num_str + sum(
+                    [1 for _value in values if isinstance(_value, str)]
+                )
+                _field_meta_stats.num_none = _field_meta_stats.num_none + sum(
+                    [1 for _value in values if _value is None]
+                )
+            else:
+                _num_invalid = len(values) - len(_idx_numbers)
+            if len(_idx_numbers) > 0:
+                _numbers = [values[_idx] for _idx in _idx_numbers]
+                _field_meta_stats.num_number = _field_meta_stats.num_number + len(_numbers)
+                _field_meta_stats.total = sum(_numbers, _field_meta_stats.total)
+                # first occurence of min and max value
+                _idx_min = min(range(len(_numbers)), key=_numbers.__getitem__)
+                _idx_max = max(range(len(_numbers)), key=lambda _idx: (_numbers[_idx], -_idx))
+                _min_value = _field_meta_stats.min_value
+                _max_value = _field_meta_stats.max_value
+                if _min_value is None or _max_value is None:
+                    _min_value = _max_value = None
+                if _min_value is None or _numbers[_idx_min] < _min_value:
+                    _field_meta_stats.min_value = _numbers[_idx_min]
+                    _field_meta_stats.key_min = objkeys[_idx_numbers[_idx_min]]
+                if _max_value is None or _numbers[_idx_max] > _max_value:
+                    _field_meta_stats.max_value = _numbers[_idx_max]
+                    _field_meta_stats.key_max = objkeys[_idx_numbers[_idx_max]]
+        elif _expected_cell_type == CellType.STRING:
+            _num_str = sum([1 for _value in values if isinstance(_value, str)])
+            _field_meta_stats.num_str = _field_meta_stats.num_str + _num_str
+            _num_invalid = len(values) - _num_str
+        elif _expected_cell_type == CellType.BOOL:
+            _num_bool = sum([1 for _value in values if isinstance(_value, bool)])
+            _field_meta_stats.num_bool = _field_meta_stats.num_bool + _num_bool
+            _num_invalid = len(values) - _num_bool
+        else:
+            _field_meta_stats.num_none = _field_meta_stats.num_none + sum([1 for _value in values if _value is None])
+
+        if _num_invalid > 0:
+            logger.info(
+                f"[CellTypeAnalyzer] Field [{field_name}], [{_num_invalid}] objects have not expected type of [{_expected_cell_type}]"
+            )
+
+    def analyze_columns(
+        self, columns: Dict[str, list], objkeys: list = None, description: str = None
+    ) -> CellTypeMetaDictType:
+        """analyze a column mapping {field_name: [values]}, objkeys are the row keys (default: row index)"""
+        if not self._is_active:
+            return self._field_stats
+        for _field_name, _values in columns.items():
+            _objkeys = objkeys
+            if _objkeys is None:
+                _objkeys = list(range(len(_values)))
+            self._analyze_column(_field_name, list(_values), list(_objkeys), description)
+        return self._field_stats
+
+    def analyze_batch(self, objs: list | dict, objkeys: list = None, description: str = None) -> CellTypeMetaDictType:
+        """analyze a list of objects (or a dict {objkey: obj}) column by column, same as calling
+        analyze for each object. objkeys are the object keys (default: list index)
+        """
+        if not self._is_active:
+            return self._field_stats
+        if isinstance(objs, dict):
+            objkeys = list(objs.keys())
+            objs = list(objs.values())
+        elif objkeys is None:
+            objkeys = list(range(len(objs)))
+        if len(objs) == 0:
+            return self._field_stats
+
+        _obj_type = self._object_type
+        if _obj_type is None:
+            _obj_type = CellTypeAnalyzer.get_object_type(objs[0])
+            self._object_type = _obj_type
+
+        # primitive types
+        if _obj_type in [CellType.STRING, CellType.INT, CellType.FLOAT, CellType.NONE, CellType.BOOL]:
+            self._analyze_column(CellType.PRIMITIVE, list(objs), list(objkeys), description)
+            return self._field_stats
+
+        if _obj_type == CellType.DICT:
+            _rows = objs
+        elif _obj_type == CellType.ROOT_MODEL:
+            _rows = [_obj.model_dump() for _obj in objs]
+        elif _obj_type == CellType.BASE_MODEL:
+            # iterating over a model returns the field values without converting them
+            _rows = [dict(_obj) for _obj in objs]
+        else:
+            logger.warning(f"[CellTypeAnalyzer] objects of type [{_obj_type}] are not supported")
+            return self._field_stats
+
+        # transpose rows into columns of values and keys
+        _columns: Dict[str, tuple] = {}
+        for _objkey, _row in zip(objkeys, _rows):
+            for _field_name, _value in _row.items():
+                _column = _columns.get(_field_name)
+                if _column is None:
+                    _column = ([], [])
+                    _columns[_field_name] = _column
+                _column[0].append(_value)
+                _column[1].append(_objkey)
+
+        for _field_name, (_values, _objkeys) in _columns.items():
+            self._analyze_column(_field_name, _values, _objkeys)
+        return self._field_stats
+
     @staticmethod
     def get_object_type(obj: object) -> CellType:
         """analyzes an object returns the object type"""
@@ -259,6 +403,14 @@ class CellTypeAnalyzer:
             object_type = CellType.OBJECT
         return object_type
 
+    def get_sketch(self, field_name: str = CellType.PRIMITIVE) -> FieldSketch | None:
+        """returns the sketches (quantiles, histogram, distinct count) of a field if sketches are active"""
+        return self._field_sketches.get(field_name)
+
+    def get_sketch_stats(self, quantiles: list = None) -> dict:
+        """returns the sketch stats for all fields as dict {field_name: stats}"""
+        return {_key: _sketch.get_stats(quantiles) for _key, _sketch in self._field_sketches.items()}
+
     def get_stats(self, as_dict: bool = True) -> dict | CellTypeMetaDictType:
         """returns collected statistics as dict or as original pydantic model"""
         if as_dict:
@@ -5,12 +5,15 @@ import os
 import re
 import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
 from pathlib import Path
 from typing import Dict, List
 
+from pydantic import BaseModel, ValidationError
+
 # from typer import progressbar as t_progressbar
-from rich.progress import Progress, TaskID
+from rich.progress import Progress
 
 from cli.bootstrap_config import config_env, console
 from cli.bootstrap_env import CLI_LOG_LEVEL
@@ -52,14 +55,110 @@ ARTIFACT_INPUT_TEMPLATE = {"p_root": None, "max_path_depth": 3, "artifact_type":
 REGEX_BRANCH = re.compile('"(.+)"', re.IGNORECASE)
 
 
+class ArtifactMetaCache:
+    """persistent cache of artifact metadata, entries are keyed by artifact type and artifact path and are
+    valid as long as modification time and size of the files the metadata was read from didn't change
+    """
+
+    def __init__(self, f_cache: str = None) -> None:
+        """constructor, loads the cache file if supplied"""
+        self._f_cache: str = f_cache
+        # key > {"signature": [[file,mtime,size],...], "meta": meta model as dict}
+        self._entries: Dict[str, dict] = {}
+        self._changed: bool = False
+        self._hits: int = 0
+        self._misses: int = 0
+        if f_cache is not None:
+            self.load()
+
+    @property
+    def stats(self) -> dict:
+        """cache statistics"""
+        return {"size": len(self._entries), "hits": self._hits, "misses": self._misses}
+
+    @staticmethod
+    def get_signature(files: List[str]) -> list:
+        """returns [file, modification time (ns), size] of each file, [file, None, None] if it doesn't exist"""
+        out = []
+        for _f in files:
+            try:
+                _stat = os.stat(_f)
+                out.append([str(_f), _stat.st_mtime_ns, _stat.st_size])
+            except OSError:
+                out.append([str(_f), None, None])
+        return out
+
+    @staticmethod
+    def _get_key(artifact_type: ARTIFACT, key: str) -> str:
+        """cache key"""
+        return f"{artifact_type.value}:{key}"
+
+    def get(self, artifact_type: ARTIFACT, key: str, signature: list, meta_cls: type[BaseModel]) -> tuple:
+        """returns (True, cached meta model) if the signature is unchanged, (False, None) otherwise"""
+        _entry = self._entries.get(ArtifactMetaCache._get_key(artifact_type, key))
+        if _entry is None or _entry.get("signature") != signature:
+            self._misses += 1
+            return (False, None)
+        _meta = _entry.get("meta")
+        if _meta is None:
+            self._hits += 1
+            return (True, None)
+        try:
+            _meta = meta_cls.model_validate(_meta)
+        except ValidationError as e:
+            logger.warning(f"[ArtifactMetaCache] Invalid cache entry [{key}], {e}")
+            self._misses += 1
+            return (False, None)
+        self._hits += 1
+        return (True, _meta)
+
+    def put(self, artifact_type: ARTIFACT, key: str, signature: list, meta: BaseModel | None) -> None:
+        """adds the meta model read from files with given signature"""
+        _meta = None if meta is None else meta.model_dump()
+        self._entries[ArtifactMetaCache._get_key(artifact_type, key)] = {"signature": signature, "meta": _meta}
+        self._changed = True
+
+    def load(self, f_cache: str = None) -> int:
+        """loads the cache file, returns number of entries"""
+        if f_cache is not None:
+            self._f_cache = f_cache
+        if self._f_cache is None or not os.path.isfile(self._f_cache):
+            return 0
+        _entries = Persistence.read_json(self._f_cache)
+        if not isinstance(_entries, dict):
+            logger.warning(f"[ArtifactMetaCache] Invalid cache file [{self._f_cache}]")
+            return 0
+        self._entries = _entries
+        self._changed = False
+        logger.debug(f"[ArtifactMetaCache] Loaded [{len(_entries)}] entries from [{self._f_cache}]")
+        return len(_entries)
+
+    def save(self, f_cache: str = None) -> None:
+        """saves the cache file if there were changes"""
+        if f_cache is not None:
+            self._f_cache = f_cache
+        if self._f_cache is None:
+            return
+        if not self._changed and os.path.isfile(self._f_cache):
+            return
+        Persistence.save_json(self._f_cache, self._entries)
+        self._changed = False
+        logger.debug(f"[ArtifactMetaCache] Saved [{len(self._entries)}] entries to [{self._f_cache}]")
+
+
 class CodeArtifact(ABC):
     """Reading Code Artifacts from environment or files such as git, venv,..."""
 
-    def __init__(self, artifact_meta: ArtifactMeta = ArtifactMeta()):
+    # metadata model, set in subclasses
+    META_CLASS: type[BaseModel] = None
+
+    def __init__(self, artifact_meta: ArtifactMeta = ArtifactMeta(), read_artifacts: bool = True):
         """_summary_
 
         Args:
             artifact_meta (ArtifactMeta, optional): Constructor. Defaults to ArtifactMeta().
+            read_artifacts (bool, optional): search artifacts in constructor, otherwise the artifacts
+            need to be set (eg using a shared search in CodeArtifacts). Defaults to True.
             Params Infos
             p_root (str|list): Entry Path (single or list) containing all entry paths. If initial,
             it will default to current directory
@@ -97,6 +196,10 @@ class CodeArtifact(ABC):
         self._p_root_list = _path_refs
         # initialize filter
         self._artifact_type = artifact_type
+        self._artifact_filter = None
+        self._f_artifacts = {}
+        self._info_dict = {}
+        self._meta_cache: ArtifactMetaCache = None
         if artifact_type is not None:
             self._artifact_filter = deepcopy(ARTIFACT_FILTER[artifact_type])
         elif isinstance(artifact_filter, dict):
@@ -114,9 +217,8 @@ class CodeArtifact(ABC):
             _flt["max_path_depth"] = self._max_path_depth
         self._artifact_filter["show_progress"] = _flt.get("show_progress", self._show_progress)
         self._artifact_filter["paths_only"] = _flt.get("paths_only", self._paths_only)
-        self._f_artifacts = {}
-        self._info_dict = {}
-        self._read_artifacts()
+        if read_artifacts:
+            self._read_artifacts()
 
     def _read_artifacts(self) -> dict:
         """reads the artifact files according to filter"""
@@ -128,6 +230,26 @@ class CodeArtifact(ABC):
         """returns read artifacts file names"""
         return self._f_artifacts
 
+    @f_artifacts.setter
+    def f_artifacts(self, f_artifacts: dict):
+        """sets the artifacts file names (as found with the artifact filter)"""
+        self._f_artifacts = f_artifacts
+
+    @property
+    def artifact_filter(self) -> dict | None:
+        """returns the filter (params of Persistence.find) of the artifact"""
+        return self._artifact_filter
+
+    @property
+    def meta_cache(self) -> ArtifactMetaCache | None:
+        """returns the metadata cache"""
+        return self._meta_cache
+
+    @meta_cache.setter
+    def meta_cache(self, meta_cache: ArtifactMetaCache | None):
+        """sets the metadata cache, unchanged artifacts are read from the cache"""
+        self._meta_cache = meta_cache
+
     @property
     def artifact_type(self):
         """returns artifact type"""
@@ -138,8 +260,62 @@ class CodeArtifact(ABC):
         """returns the content per artifact type"""
         return self._info_dict
 
+    @staticmethod
+    def get_meta_key(f_artifact: str) -> str:
+        """returns the info dict key of an artifact reference, can be overwritten in subclasses"""
+        return f_artifact
+
+    @staticmethod
+    def get_meta_files(f_artifact: str) -> List[str]:
+        """returns the files metadata is read from (to detect changes), can be overwritten in subclasses"""
+        return [f_artifact]
+
+    @staticmethod
     @abstractmethod
-    def read_content(self) -> None:
+    def read_meta(f_artifact: str) -> BaseModel | None:
+        """abstract method to read the metadata of an artifact reference"""
+        pass
+
+    def _read_metas(self, f_artifacts: List[str], description: str, max_workers: int = None) -> None:
+        """reads the metadata of artifact references into the info dict: unchanged artifacts are taken from
+        the meta cache, all others are read in a thread pool of max_workers threads
+        """
+        _metas = {}
+        # signatures of artifacts to be read
+        _signatures = {}
+        for _f_artifact in f_artifacts:
+            if self._meta_cache is None:
+                _signatures[_f_artifact] = None
+                continue
+            _signature = ArtifactMetaCache.get_signature(self.get_meta_files(_f_artifact))
+            _key = self.get_meta_key(_f_artifact)
+            _is_cached, _meta = self._meta_cache.get(self._artifact_type, _key, _signature, self.META_CLASS)
+            if _is_cached:
+                _metas[_f_artifact] = _meta
+            else:
+                _signatures[_f_artifact] = _signature
+        logger.debug(f"[CodeArtifact] Reading [{len(_signatures)}] of [{len(f_artifacts)}] [{self._artifact_type}]")
+
+        with Progress(disable=(not self._show_progress), console=console) as progress:
+            task = progress.add_task(description, total=len(f_artifacts))
+            progress.update(task, advance=len(_metas))
+            if len(_signatures) > 0:
+                with ThreadPoolExecutor(max_workers=max_workers) as _executor:
+                    _futures = {_executor.submit(self.read_meta, _f): _f for _f in _signatures.keys()}
+                    for _future in as_completed(_futures):
+                        _metas[_futures[_future]] = _future.result()
+                        progress.update(task, advance=1)
+
+        # same order as the artifact references
+        for _f_artifact in f_artifacts:
+            _key = self.get_meta_key(_f_artifact)
+            _meta = _metas[_f_artifact]
+            self._info_dict[_key] = _meta
+            if self._meta_cache is not None and _f_artifact in _signatures:
+                self._meta_cache.put(self._artifact_type, _key, _signatures[_f_artifact], _meta)
+
+    @abstractmethod
+    def read_content(self, max_workers: int = None) -> None:
         """abstract method to read content from subclasses"""
         pass
 
@@ -147,8 +323,10 @@ class CodeArtifact(ABC):
 class GitArtifact(CodeArtifact):
     """Git Code Artifact Parsing"""
 
-    def __init__(self, artifact_meta: ArtifactMeta = ArtifactMeta()) -> None:
-        super().__init__(artifact_meta)
+    META_CLASS = GitMeta
+
+    def __init__(self, artifact_meta: ArtifactMeta = ArtifactMeta(), read_artifacts: bool = True) -> None:
+        super().__init__(artifact_meta, read_artifacts)
         self._artifact_type = ARTIFACT.GIT
 
     @staticmethod
@@ -199,25 +377,23 @@ class GitArtifact(CodeArtifact):
         )
         return git_meta
 
+    @staticmethod
+    def get_meta_key(f_artifact: str) -> str:
+        """git metadata is referenced by the repo path"""
+        return str(Path(f_artifact).parent)
+
+    @staticmethod
+    def get_meta_files(f_artifact: str) -> List[str]:
+        """git metadata is read from config and HEAD"""
+        return [os.path.join(f_artifact, "config"), os.path.join(f_artifact, "HEAD")]
+
     def get_git_meta(self, f_git: str) -> GitMeta:
         """gets the GitMeta for a given file reference"""
         return self._info_dict.get(f_git)
 
-    def read_content(self) -> None:
+    def read_content(self, max_workers: int = None) -> None:
         """reading content: configuration and current branch"""
-        num_artifacts = len(self._f_artifacts)
-
-        def _read_git_metadata(task_id: TaskID, progress: Progress) -> None:
-            """reads the content of git files"""
-            for _f_artifact in list(self._f_artifacts.keys()):
-                _git_meta = GitArtifact.read_meta(_f_artifact)
-                _f_repo = str(Path(_f_artifact).parent)
-                self._info_dict[_f_repo] = _git_meta
-                progress.update(task_id, advance=1)
-
-        with Progress(disable=(not self._show_progress), console=console) as progress:
-            task = progress.add_task("[out_path]Parsing Git Files", total=num_artifacts)
-            _read_git_metadata(task, progress)
+        self._read_metas(list(self._f_artifacts.keys()), "[out_path]Parsing Git Files", max_workers)
 
     def get_repo_refs(self) -> Dict[str, GitMeta]:
         """returns the git repo references (read_content needs to be called prior to use this method)"""
@@ -230,8 +406,10 @@ class GitArtifact(CodeArtifact):
 class VenvArtifact(CodeArtifact):
     """Virtual Environment Code Artifact Parsing"""
 
-    def __init__(self, artifact_meta: ArtifactMeta = ArtifactMeta()) -> None:
-        super().__init__(artifact_meta)
+    META_CLASS = VenvMeta
+
+    def __init__(self, artifact_meta: ArtifactMeta = ArtifactMeta(), read_artifacts: bool = True) -> None:
+        super().__init__(artifact_meta, read_artifacts)
         self._artifact_type = ARTIFACT.VENV
 
     @staticmethod
@@ -287,6 +465,17 @@ class VenvArtifact(CodeArtifact):
         )
         return _venv_meta
 
+    @staticmethod
+    def get_meta_key(f_artifact: str) -> str:
+        """venv metadata is referenced by the venv path"""
+        return str(Path(f_artifact).parent.parent)
+
+    @staticmethod
+    def get_meta_files(f_artifact: str) -> List[str]:
+        """venv metadata is read from site-packages (changes when packages are (un)installed) and pyvenv.cfg"""
+        _path_venv = Path(f_artifact).parent.parent
+        return [f_artifact, str(_path_venv.joinpath("pyvenv.cfg")), str(_path_venv.joinpath("Scripts"))]
+
     def get_venv_meta(self, f_venv: str) -> VenvMeta:
         """gets the GitMeta for a given file reference"""
         return self._info_dict.get(f_venv)
@@ -302,27 +491,18 @@ class VenvArtifact(CodeArtifact):
             out[_venv_name] = _paths
         return out
 
-    def read_content(self) -> None:
+    def read_content(self, max_workers: int = None) -> None:
         """reads the venv content"""
-
-        def _read_venvs(task_id: TaskID, progress: Progress) -> None:
-            """reads the content of venv paths"""
-            for _p_venv_site in list(self._f_artifacts.keys()):
-                _venv_meta = VenvArtifact.read_meta(_p_venv_site)
-                _p_venv = str(Path(_p_venv_site).parent.parent)
-                self._info_dict[_p_venv] = _venv_meta
-                progress.update(task_id, advance=1)
-
-        with Progress(disable=(not self._show_progress), console=console) as progress:
-            task = progress.add_task("[out_path]Parsing VS Code Files", total=len(self.f_artifacts))
-            _read_venvs(task, progress)
+        self._read_metas(list(self._f_artifacts.keys()), "[out_path]Parsing VS Code Files", max_workers)
 
 
 class VsCodeArtifact(CodeArtifact):
     """VS Code Project Code Artifact Parsing"""
 
-    def __init__(self, artifact_meta: ArtifactMeta = ArtifactMeta()) -> None:
-        super().__init__(artifact_meta)
+    META_CLASS = VsCodeMeta
+
+    def __init__(self, artifact_meta: ArtifactMeta = ArtifactMeta(), read_artifacts: bool = True) -> None:
+        super().__init__(artifact_meta, read_artifacts)
         self._artifact_type = ARTIFACT.VSCODE
 
     @staticmethod
@@ -340,24 +520,20 @@ class VsCodeArtifact(CodeArtifact):
             _project_folders.append(_p_abspath)
         return _project_folders
 
-    def read_content(self) -> None:
-        """reads the content"""
-
-        def _read_vscode_files(task_id: TaskID, progress: Progress) -> None:
-            """reads the content od vscode files"""
-            # flatten all vscode file refs into a list
-            _vs_code_files = []
-            for _vs_code_file_list in self.f_artifacts.values():
-                _vs_code_files.extend(_vs_code_file_list)
-            for _f_artifact in _vs_code_files:
-                _vscode_meta = VsCodeMeta(f_vscode=_f_artifact)
-                _vscode_meta.p_folders = VsCodeArtifact.parse_vscode_folders(_f_artifact)
-                self._info_dict[_f_artifact] = _vscode_meta
-                progress.update(task_id, advance=1)
+    @staticmethod
+    def read_meta(f_vscode: str) -> VsCodeMeta:
+        """reading the vscode metadata from a vscode workspace file"""
+        _vscode_meta = VsCodeMeta(f_vscode=f_vscode)
+        _vscode_meta.p_folders = VsCodeArtifact.parse_vscode_folders(f_vscode)
+        return _vscode_meta
 
-        with Progress(disable=(not self._show_progress), console=console) as progress:
-            task = progress.add_task("[out_path]Parsing VS Code Files", total=len(self.f_artifacts))
-            _read_vscode_files(task, progress)
+    def read_content(self, max_workers: int = None) -> None:
+        """reads the content"""
+        # flatten all vscode file refs into a list
+        _vs_code_files = []
+        for _vs_code_file_list in self.f_artifacts.values():
+            _vs_code_files.extend(_vs_code_file_list)
+        self._read_metas(_vs_code_files, "[out_path]Parsing VS Code Files", max_workers)
 
     def get_vscode_meta(self, f_vscode: str) -> VsCodeMeta:
         """gets the GitMeta for a given file reference"""
@@ -384,27 +560,49 @@ ARTIFACT_CLASS = {ARTIFACT.GIT: GitArtifact, ARTIFACT.VSCODE: VsCodeArtifact, AR
 class CodeArtifacts:
     """handling all Code Artifacts Types in one class"""
 
-    def __init__(self, artifacts_meta: List[ArtifactMeta]) -> None:
+    def __init__(self, artifacts_meta: List[ArtifactMeta], f_cache: str = None) -> None:
         """Constructor to handle any of the Code Artifact Types
 
         Args:
             artifact_metas (List[Dict[ARTIFACT,ArtifactMeta]]):
+            f_cache (str, optional): json file caching the artifacts metadata. Defaults to None (no cache).
         """
         self._artifacts = {}
+        self._meta_cache: ArtifactMetaCache = None
+        if f_cache is not None:
+            self._meta_cache = ArtifactMetaCache(f_cache)
 
-        # instanciate classes
+        # instanciate classes, artifacts are searched together
         for _artifact_meta in artifacts_meta:
             _type = _artifact_meta.artifact_type
             try:
-                self._artifacts[_type] = ARTIFACT_CLASS[_type](_artifact_meta)
+                self._artifacts[_type] = ARTIFACT_CLASS[_type](_artifact_meta, read_artifacts=False)
+                self._artifacts[_type].meta_cache = self._meta_cache
             except AttributeError:
                 logger.warning(f"[CodeArtifacts] unknown type [{_type}]")
-        pass
+        self._read_artifacts()
+
+    def _read_artifacts(self) -> None:
+        """searches the artifacts of all loaded classes, each root path is only crawled once"""
+        _filters = {}
+        for _type, _artifact_cls in self._artifacts.items():
+            if _artifact_cls.artifact_filter is not None:
+                _filters[_type] = _artifact_cls.artifact_filter
+        _f_artifacts = Persistence.find_multi(_filters)
+        for _type, _f_artifacts_type in _f_artifacts.items():
+            self._artifacts[_type].f_artifacts = _f_artifacts_type
+
+    @property
+    def meta_cache(self) -> ArtifactMetaCache | None:
+        """returns the metadata cache"""
+        return self._meta_cache
 
-    def read_content(self) -> None:
-        """reads the content of all loaded classes"""
+    def read_content(self, max_workers: int = None) -> None:
+        """reads the content of all loaded classes, only changed artifacts are parsed if a cache file is used"""
         for _artifact_cls in list(self._artifacts.values()):
-            _artifact_cls.read_content()
+            _artifact_cls.read_content(max_workers)
+        if self._meta_cache is not None:
+            self._meta_cache.save()
 
     @property
     def vscode_artifact(self) -> VsCodeArtifact:
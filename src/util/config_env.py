@@ -60,7 +60,7 @@ def config_key(func):
         _config = self._config.get(key)
         if _config is None:
             # case insensitive search
-            _keys = [k for k in self._config_keys if k.lower() == key.lower()]
+            _keys = self.get_config_keys(key)
             if len(_keys) == 0:
                 _has_key = False
             else:
@@ -80,6 +80,9 @@ def config_key(func):
 class ConfigEnv:
     """Configuration of Command Line Environment"""
 
+    # shared instances: (config file, working directory) > (config file signature, instance)
+    _instances: Dict[tuple, tuple] = {}
+
     def __init__(self, f_config: str = None) -> None:
         """constructor"""
         self._f_config = None
@@ -90,6 +93,7 @@ class ConfigEnv:
             logger.error(f"[ConfigEnv] There is no config file here: [{self._f_config}]")
             return
         self._config_keys = list(self._config.keys())
+        self._config_key_index = ConfigEnv._create_key_index(self._config_keys)
         self._wrong_rule_keys = {}
         if not self._config:
             self._config = {}
@@ -97,6 +101,116 @@ class ConfigEnv:
         self._environment = Environment(self)
         pass
 
+    @staticmethod
+    def _get_signature(f_config: str) -> list | None:
+        """returns [modification time (ns), size] of the config file"""
+        try:
+            _stat = os.stat(f_config)
+        except OSError:
+            return None
+        return [_stat.st_mtime_ns, _stat.st_size]
+
+    @staticmethod
+    def get_snapshot_file(f_config: str) -> str:
+        """returns the file path of the snapshot of a config file (stored next to it)"""
+        return f"{os.path.splitext(f_config)[0]}{C.CONFIG_SNAPSHOT_SUFFIX}"
+
+    @staticmethod
+    def get_instance(f_config: str = None, snapshot: bool = False) -> "ConfigEnv":
+        """returns a shared ConfigEnv, that is only created once per config file (path, modification time and size)
+        and working directory. If snapshot is set, the resolved configuration is saved as json next to the
+        config file and is used by other processes as long as config file, working dir and PATH are the same
+        """
+        _f_config, _ = ConfigEnv.get_bootstrap_files(f_config)
+        if _f_config is None:
+            return ConfigEnv(f_config)
+        _f_config = os.path.abspath(_f_config)
+        _signature = ConfigEnv._get_signature(_f_config)
+        _key = (_f_config, os.getcwd())
+        _instance = ConfigEnv._instances.get(_key)
+        if _instance is not None and _instance[0] == _signature:
+            return _instance[1]
+        _config_env = None
+        if snapshot:
+            _config_env = ConfigEnv.load_snapshot(_f_config, _signature)
+        if _config_env is None:
+            _config_env = ConfigEnv(f_config)
+            if snapshot:
+                _config_env.save_snapshot(_signature)
+        ConfigEnv._instances[_key] = (_signature, _config_env)
+        return _config_env
+
+    @staticmethod
+    def clear_instances() -> None:
+        """clears the shared instances"""
+        ConfigEnv._instances = {}
+
+    def save_snapshot(self, signature: list = None) -> str | None:
+        """saves the resolved configuration as snapshot next to the config file, returns the snapshot file"""
+        if self._f_config is None or self._config is None:
+            return None
+        _f_config = os.path.abspath(self._f_config)
+        if signature is None:
+            signature = ConfigEnv._get_signature(_f_config)
+        _f_snapshot = ConfigEnv.get_snapshot_file(_f_config)
+        _snapshot = {
+            "f_config": _f_config,
+            "signature": signature,
+            "cwd": os.getcwd(),
+            "path": os.environ.get("PATH"),
+            "f_config_dict": self._f_config_dict,
+            "config": self._config,
+        }
+        try:
+            Persistence.save_json(_f_snapshot, _snapshot)
+        except (OSError, TypeError) as e:
+            logger.warning(f"[ConfigEnv] Couldn't save snapshot [{_f_snapshot}], {e}")
+            return None
+        return _f_snapshot
+
+    @staticmethod
+    def load_snapshot(f_config: str, signature: list = None) -> "ConfigEnv | None":
+        """creates a ConfigEnv from the snapshot of a config file without resolving the configuration again,
+        returns None if there is no valid snapshot for the current config file, working dir and PATH
+        """
+        _f_config = os.path.abspath(f_config)
+        _f_snapshot = ConfigEnv.get_snapshot_file(_f_config)
+        if not os.path.isfile(_f_snapshot):
+            return None
+        if signature is None:
+            signature = ConfigEnv._get_signature(_f_config)
+        _snapshot = Persistence.read_json(_f_snapshot)
+        if not isinstance(_snapshot, dict) or not isinstance(_snapshot.get("config"), dict):
+            logger.warning(f"[ConfigEnv] Invalid snapshot [{_f_snapshot}]")
+            return None
+        _valid = {"f_config": _f_config, "signature": signature, "cwd": os.getcwd(), "path": os.environ.get("PATH")}
+        for _attribute, _value in _valid.items():
+            if _snapshot.get(_attribute) != _value:
+                logger.debug(f"[ConfigEnv] Snapshot [{_f_snapshot}] is outdated, [{_attribute}] changed")
+                return None
+        out = ConfigEnv.__new__(ConfigEnv)
+        out._f_config = _snapshot["f_config"]
+        out._f_config_dict = _snapshot.get("f_config_dict")
+        out._config = _snapshot["config"]
+        out._config_keys = list(out._config.keys())
+        out._config_key_index = ConfigEnv._create_key_index(out._config_keys)
+        out._wrong_rule_keys = {}
+        out._environment = Environment(out)
+        logger.debug(f"[ConfigEnv] Loaded configuration from snapshot [{_f_snapshot}]")
+        return out
+
+    @staticmethod
+    def _create_key_index(config_keys: List[str]) -> Dict[str, List[str]]:
+        """creates the case insensitive key index (lower case key > config keys)"""
+        out = {}
+        for _key in config_keys:
+            out.setdefault(_key.lower(), []).append(_key)
+        return out
+
+    def get_config_keys(self, key: str) -> List[str]:
+        """returns the config keys matching a key (case insensitive)"""
+        return self._config_key_index.get(key.lower(), [])
+
     @staticmethod
     def type_is_valid(value: any, data_type: str) -> bool:
         """checks whether a value fits to the data type"""
@@ -874,27 +988,22 @@ class ConfigEnv:
     def get_file_ref(self, ref: str, exists: bool = False, work_path: str = None) -> str:
         """gets either a path object or an object from the configuration
         if the exists flag is set to true only existing path objects will be returned
+        relative paths are resolved against work_path (default: current directory) without changing
+        the current directory, so references can be resolved concurrently
         """
-        _cwd = os.getcwd()
-        if work_path is None:
-            _work_path = _cwd
-        else:
-            _work_path = work_path
-        os.chdir(_work_path)
-        _object_path = None
+        _work_path = os.getcwd() if work_path is None else str(work_path)
+        _ref = str(ref)
         # 1. if it's a real file system object return it
-        _path = Path(ref)
-        if _path.is_file() or _path.is_dir():
-            os.chdir(_cwd)
-            return str(os.path.abspath(_path))
+        _path = os.path.abspath(os.path.join(_work_path, _ref))
+        if os.path.isfile(_path) or os.path.isdir(_path):
+            return _path
 
         # 2. check if it's a config key (apply case insensitive search)
-        _keys = [k for k in self._config_keys if k.lower() == ref.lower()]
+        _keys = self.get_config_keys(_ref)
         if len(_keys) == 1:
             _object_path = self.get_ref(_keys[0])
             if _object_path is not None:
-                _object_path = os.path.abspath(_object_path)
-            os.chdir(_cwd)
+                _object_path = os.path.abspath(os.path.join(_work_path, _object_path))
             if exists and _object_path:
                 if os.path.isfile(_object_path) or os.path.isdir(_object_path):
                     return _object_path
@@ -906,10 +1015,9 @@ class ConfigEnv:
                 return _object_path
 
         # 3. try to assemble a path / parent object needs to be a valid object
-        os.chdir(_cwd)
-        _parent = _path.parent
-        if not (_parent.is_file() or _parent.is_dir()):
-            _msg = f"[ConfigEnv] Ref [{ref}], Parent [{str(_parent)}] is not a file object"
+        _parent = os.path.dirname(_path)
+        if not (os.path.isfile(_parent) or os.path.isdir(_parent)):
+            _msg = f"[ConfigEnv] Ref [{ref}], Parent [{str(Path(_ref).parent)}] is not a file object"
             logger.warning(_msg)
             return None
 
@@ -917,7 +1025,7 @@ class ConfigEnv:
         if exists:
             return None  # file ref is not existing return none
         else:
-            return str(_path.absolute())
+            return _path
 
     @config_key
     def get_ref(self, key: str, fallback_value: bool = False, fallback_default: any = None) -> str:
@@ -983,10 +1091,11 @@ class ConfigEnv:
             n += 1
         print(col(f"\n###### CONFIGURATION [{self._f_config}]\n", "C_T"))
 
-    def _bootstrap_path(self, f_ext: str):
+    @staticmethod
+    def get_bootstrap_files(f_ext: str = None) -> tuple:
         """ " bootstraps path to config file  i the following order
         if ENV CLI_CONFIG_DEMO is set => use /test_data/test_config/config_env_sample.json/
-
+        returns the config file and the dict of config files checked
         """
         # choose one of the following paths for config in order
 
@@ -1018,8 +1127,11 @@ class ConfigEnv:
             except KeyError:
                 logger.error(f"[CONFIG] Bootsrap Order, key [{_config}] is invalid")
                 continue
-        self._f_config_dict = _config_dict
-        self._f_config = _f_config
+        return (_f_config, _config_dict)
+
+    def _bootstrap_path(self, f_ext: str):
+        """bootstraps path to config file, see get_bootstrap_files"""
+        self._f_config, self._f_config_dict = ConfigEnv.get_bootstrap_files(f_ext)
 
 
 class Environment:
@@ -311,6 +311,8 @@ FILE_FORMATS = FileFormat.get_values()
 CONFIG_KEYS = ConfigAttribute.get_values()
 # if this is set in path, then the current path is used
 CONFIG_PATH_CWD = "CWD"  # Underscore marker
+# file suffix of the resolved config snapshot stored next to a config file
+CONFIG_SNAPSHOT_SUFFIX = "_snapshot.json"
 
 
 class ConfigKey(AbstractEnum):
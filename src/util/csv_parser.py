@@ -24,7 +24,7 @@ class CsvParser(Persistence):
     def __init__(self, f_read: str = None, f_save: str = None, f_config: str = None, **kwargs) -> None:
         """Constructor"""
         super().__init__(f_read, f_save, **kwargs)
-        self._config = ConfigEnv(f_config)
+        self._config = ConfigEnv.get_instance(f_config)
         self._global_keys = {}
         self._config_key = "NO KEY"
         self._description = "NO_DESCRIPTION"
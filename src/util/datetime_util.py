@@ -31,6 +31,9 @@ WEEKDAY_NUM = dict(zip(list(WEEKDAY.values()), list(WEEKDAY.keys())))
 WEEKDAY_EN = {1: "Mon", 2: "Tue", 3: "Wed", 4: "Thu", 5: "Fri", 6: "Sat", 7: "Sun"}
 # WORKDAYS = ["onduty","workday","workday_home"]
 
+# isoweek year properties by calendar year (see DateTimeUtil.get_isoweekyear)
+_ISOWEEKYEAR_CACHE: Dict[int, dict] = {}
+
 MONTHS = {
     1: "Januar",
     2: "Februar",
@@ -489,6 +492,9 @@ class DateTimeUtil:
         """returns isoweek properties for given calendar year as dictionary:
         1st and last monday of isoweek year, number of working weeks
         """
+        isoweekyear = _ISOWEEKYEAR_CACHE.get(y)
+        if isoweekyear is not None:
+            return dict(isoweekyear)
         d_first = DateTimeUtil.get_1st_isoweek_date(y)
         d_last = DateTimeUtil.get_1st_isoweek_date(y + 1)
         working_weeks = (d_last - d_first).days // 7
@@ -499,6 +505,7 @@ class DateTimeUtil:
         isoweekyear["last_day"] = d_last + timedelta(days=6)
         isoweekyear["weeks"] = working_weeks
         isoweekyear["year"] = y
+        _ISOWEEKYEAR_CACHE[y] = dict(isoweekyear)
 
         return isoweekyear
 
@@ -526,47 +533,13 @@ class DateTimeUtil:
 
     @staticmethod
     def year_index(year: int = None) -> Dict[int, CalendarIndexType]:
-        """creates a year index pointing to month, day tuple and isoweek infos"""
-        out = {}
-        _idx = 1
-        if year is None:
-            year = DateTime.now().year
-        _holidays = DateTimeUtil.get_holiday_dates(year)
-        curr_year = year
-        curr_date = DateTime(year, 1, 1)
-        while year == curr_year:
-            _is_holiday = False
-            _holiday = _holidays.get(curr_date)
-            if _holiday:
-                _is_holiday = True
-                _holiday = _holiday["name"]
-            _info = DateTimeUtil.isoweek(curr_date)
-            _weekday = _info["weekday"]
-            _is_workday = True
-            _is_weekend = False
-            if _weekday > 5:
-                _is_workday = False
-                _is_weekend = True
-            _idx_info = {
-                "datetime": curr_date,
-                "year": _info["year"],
-                "month": curr_date.month,
-                "day": curr_date.day,
-                "day_in_year": _idx,
-                "calendar_week": _info["calendar_week"],
-                "month_day": [curr_date.month, curr_date.day],
-                "weekday": _info["weekday"],
-                "holiday": _holiday,
-                "is_leap_year": _info["leap_year"],
-                "is_holiday": _is_holiday,
-                "is_weekend": _is_weekend,
-                "is_workday": _is_workday,
-            }
-            out[_idx] = CalendarIndexType(**_idx_info)
-            curr_date += timedelta(days=1)
-            curr_year = curr_date.year
-            _idx += 1
-        return out
+        """creates a year index pointing to month, day tuple and isoweek infos
+        (built from the process wide calendar table, see util.calendar_table)
+        """
+        # import here, calendar_table depends on DateTimeUtil
+        from util.calendar_table import CalendarTable
+
+        return CalendarTable.get_year(year).get_year_index()
 
     @staticmethod
     def get_dates_from_range(daterange: str) -> list:
@@ -1,17 +1,23 @@
 """Analyzing Files and Paths"""
 
+import codecs
 import logging
+import mmap
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # import re
 from copy import deepcopy
 from pathlib import Path
+from typing import Generator
 
 from util import constants as C
 
 # from util.colors import col
-from util.persistence import Persistence
+from util.file_index import FileSysIndex
+from util.persistence import BOM, Persistence
 from util.string_matcher import FileMatcher, StringMatcher
 from cli.bootstrap_env import CLI_LOG_LEVEL
 
@@ -28,11 +34,21 @@ logger = logging.getLogger(__name__)
 # get log level from environment if given
 logger.setLevel(CLI_LOG_LEVEL)
 
+# regex tokens to check before using a pattern on bytes: escapes, negated sets, any character, lookarounds
+REGEX_BYTES_TOKENS = re.compile(r"\\x[0-9a-fA-F]{2}|\\[0-7]{3}|\\.|\[\^|\(\?<?[=!]|\.", re.DOTALL)
+# escapes matching differently on bytes (ascii only) than on str (unicode) or depending on the position
+BYTES_UNSAFE_ESCAPES = "wWdDsSbBAZ"
+# escapes matching a line break
+REGEX_LINE_BREAK_ESCAPES = ["\\n", "\\x0a", "\\x0A", "\\012"]
+
 
 class FileSysObjectInfo:
     """class to read os file and path info into a dictionary"""
 
-    def __init__(self, root_paths: list | str = None) -> None:
+    def __init__(self, root_paths: list | str = None, f_index: str = None) -> None:
+        """constructor, if an index file f_index is supplied, the file system objects will be read
+        from the persistent index (and only directories that changed will be read again)
+        """
         _root_paths = []
         self._root_paths = []
         self._filter_matcher = StringMatcher()
@@ -50,13 +66,33 @@ class FileSysObjectInfo:
             self._root_paths.append(_root_path)
         self._files = {}
         self._paths = {}
+        self._file_index = None
+        if f_index is not None:
+            self._file_index = FileSysIndex(f_index)
 
         self._read_file_objects()
 
+    def _read_file_objects_from_index(self) -> None:
+        """get a list of all file system objects from the persistent index"""
+        for _root_path in self._root_paths:
+            _paths = []
+            logger.info(f"[FileInfo] Adding file system objects from [{_root_path}] (index)")
+            for subpath, _file_infos in self._file_index.refresh(_root_path).items():
+                files = [_file_info[0] for _file_info in _file_infos]
+                _path = Path(subpath).absolute()
+                _files_absolute = [_path.joinpath(f) for f in files]
+                self._files[subpath] = {C.FILES_ABSOLUTE: _files_absolute, C.FILES: files}
+                _paths.append(subpath)
+            self._paths[_root_path] = _paths
+
     def _read_file_objects(self) -> None:
         """get a list of all file system objects"""
         self._files = {}
         self._paths = {}
+        if self._file_index is not None:
+            self._read_file_objects_from_index()
+            logger.debug(f"[FileInfo] Read [{self._files}] Files, [{self._paths}] Paths")
+            return
         for _root_path in self._root_paths:
             _paths = []
             logger.info(f"[FileInfo] Adding file system objects from [{_root_path}]")
@@ -106,14 +142,18 @@ class FileAnalyzer:
         apply: str = C.APPLY_ALL,
         by_line_default: bool = False,
         by_rule: bool = True,
+        f_index: str = None,
+        compiled: bool = False,
     ) -> None:
-        """File Info Object Constructor."""
-        self._file_info = FileSysObjectInfo(root_paths)
+        """File Info Object Constructor, f_index: optional file to persist the file system index
+        compiled: use the compiled matching mode of the StringMatcher for file objects
+        """
+        self._file_info = FileSysObjectInfo(root_paths, f_index)
         # separate matchers for each of the file types
         self._rule_dicts = {
-            C.RULE_FILENAME: StringMatcher(apply_default=apply),
-            C.RULE_PATH: StringMatcher(apply_default=apply),
-            C.RULE_ABSOLUTE_PATH: StringMatcher(apply_default=apply),
+            C.RULE_FILENAME: StringMatcher(apply_default=apply, compiled=compiled),
+            C.RULE_PATH: StringMatcher(apply_default=apply, compiled=compiled),
+            C.RULE_ABSOLUTE_PATH: StringMatcher(apply_default=apply, compiled=compiled),
             C.RULE_FILE_CONTENT: FileMatcher(apply=apply, by_line_default=by_line_default),
         }
         self._rule_dict = StringMatcher(apply_default=apply)
@@ -176,15 +216,28 @@ class FileAnalyzer:
 
     @staticmethod
     def _add_path_matches(file_objects: dict, path_objects: dict):
-        """adding the path matches to search result"""
-
-        for _path_object, _path_object_info in path_objects.items():
-            for _file, _file_info in file_objects.items():
-                if str(_path_object) in str(_file):
-                    logger.debug(
-                        f"[FileAnalyzer] Adding Path Matching Infos {list(_path_object_info.keys())} to [{_file}]"
-                    )
-                    _file_info.update(_path_object_info)
+        """adding the path matches to search result: the path matches are indexed by their absolute path
+        so that each file only needs to look up its own parent paths
+        """
+        if len(path_objects) == 0:
+            return
+        _path_index = {os.path.normcase(os.path.abspath(str(_p))): _info for _p, _info in path_objects.items()}
+
+        for _file, _file_info in file_objects.items():
+            _path_object_infos = []
+            _p = os.path.dirname(os.path.normcase(os.path.abspath(str(_file))))
+            while True:
+                _path_object_info = _path_index.get(_p)
+                if _path_object_info is not None:
+                    _path_object_infos.append(_path_object_info)
+                _p_parent = os.path.dirname(_p)
+                if _p_parent == _p:
+                    break
+                _p = _p_parent
+            # add the infos top down, so that infos of the deepest path take precedence
+            for _path_object_info in reversed(_path_object_infos):
+                logger.debug(f"[FileAnalyzer] Adding Path Matching Infos {list(_path_object_info.keys())} to [{_file}]")
+                _file_info.update(_path_object_info)
 
     @staticmethod
     def _filter_result_set(file_objects: dict, all_rules: list) -> None:
@@ -321,10 +374,14 @@ class FileContentAnalyzer(FileAnalyzer):
         apply: str = C.APPLY_ALL,
         by_line_default: bool = False,
         by_rule: bool = True,
+        f_index: str = None,
+        compiled: bool = False,
+        use_mmap: bool = False,
     ) -> None:
-        """Constructor"""
-        super().__init__(root_paths, apply, by_line_default, by_rule)
+        """Constructor, use_mmap: scan file contents as memory mapped bytes (binary files are skipped)"""
+        super().__init__(root_paths, apply, by_line_default, by_rule, f_index, compiled)
         # params to read out a text file
+        self._use_mmap = use_mmap
         self._encoding = "utf-8"
         self._comment_marker = None
         self._skip_blank_lines = False
@@ -382,32 +439,340 @@ class FileContentAnalyzer(FileAnalyzer):
 
         # do process the all rules set
         if filter_result_set is True and _all_rules_set is False:
-            _drop_lines = []
-            for line, _results_by_line in _results.items():
-                # check if all keys are present
-                _result_keys = list(_results_by_line.keys())
-                all_keys_present = [all_rule_key in _result_keys for all_rule_key in _all_rules]
-                if all(all_keys_present):
-                    continue
-                # at least one all rule is not matching, skip results
-                for _all_rule in _all_rules:
-                    _ = _results_by_line.pop(_all_rule, None)
-                # if the dict is empty, clean itup later
-                if len(_results_by_line) == 0:
-                    _drop_lines.append(line)
-            # clean up empty lines
-            for _drop_line in _drop_lines:
-                _results.pop(_drop_line)
-                pass
+            FileContentAnalyzer._filter_all_rules(_results, _all_rules)
 
         return _results
 
+    @staticmethod
+    def _filter_all_rules(results: dict, all_rules: list) -> dict:
+        """drops the apply_all rule results from lines where not all of the apply_all rules match"""
+        _drop_lines = []
+        for line, _results_by_line in results.items():
+            # check if all keys are present
+            _result_keys = list(_results_by_line.keys())
+            all_keys_present = [all_rule_key in _result_keys for all_rule_key in all_rules]
+            if all(all_keys_present):
+                continue
+            # at least one all rule is not matching, skip results
+            for _all_rule in all_rules:
+                _ = _results_by_line.pop(_all_rule, None)
+            # if the dict is empty, clean itup later
+            if len(_results_by_line) == 0:
+                _drop_lines.append(line)
+        # clean up empty lines
+        for _drop_line in _drop_lines:
+            results.pop(_drop_line)
+        return results
+
+    @staticmethod
+    def _find_content_in_file(f: str, rules_matcher: FileMatcher, encoding: str, filter_result_set: bool) -> tuple:
+        """searches a single file, the file is streamed once and all rules are applied in one pass
+        (lines are only kept in memory if there are rules to search the complete text)
+        returns a tuple (file, results by line, lines with hits)
+        """
+        _rules = rules_matcher.rules
+        _all_rules = rules_matcher._all_rules
+        _line_rules = [
+            _r for _r, _rule_dict in _rules.items() if _rule_dict.get(C.RULE_FIND_BY_LINE, True) is not False
+        ]
+        _text_rules = [_r for _r in _rules.keys() if not _r in _line_rules]
+        _results = {}
+        _hit_lines = {}
+        _lines = [] if len(_text_rules) > 0 else None
+        _all_rules_set = True
+        try:
+            with open(f, encoding=encoding, errors="backslashreplace") as fp:
+                for _line_num, _line in enumerate(fp):
+                    if _line_num == 0 and _line[:1] == BOM:
+                        _line = _line[1:]
+                    if _lines is not None:
+                        _lines.append(_line)
+                    if _line_num == 0:
+                        _hit_lines[0] = _line
+                    for _rule in _line_rules:
+                        _matches = rules_matcher.find(_line, _rule)
+                        if len(_matches) > 0:
+                            _results.setdefault(_line_num, {})[_rule] = _matches
+                            _hit_lines[_line_num] = _line
+                        elif _rule in _all_rules:
+                            _all_rules_set = False
+        except Exception as e:
+            logger.error(f"[FileContentAnalyzer] Exception reading file {f}, [{e}]")
+            return (f, {}, {})
+
+        # search in the complete text
+        if _lines is not None:
+            _content_file = "\n".join(_lines)
+            for _rule in _text_rules:
+                _matches = rules_matcher.find(_content_file, _rule)
+                if len(_matches) > 0:
+                    _results.setdefault(0, {})[_rule] = _matches
+                elif _rule in _all_rules:
+                    _all_rules_set = False
+
+        if filter_result_set is True and _all_rules_set is False:
+            FileContentAnalyzer._filter_all_rules(_results, _all_rules)
+
+        _hit_lines = {_line_num: _line for _line_num, _line in _hit_lines.items() if _line_num in _results}
+        return (f, _results, _hit_lines)
+
+    @staticmethod
+    def _is_bytes_safe(pattern: str) -> bool:
+        """checks whether a regex pattern matches the same on bytes as on str: only ascii, no character
+        classes, no any character or negated sets (matching single bytes) and no lookarounds
+        """
+        if not pattern.isascii():
+            return False
+        for _token in REGEX_BYTES_TOKENS.findall(pattern):
+            if not _token.startswith("\\"):
+                return False
+            if len(_token) > 2:
+                # hex or octal escape
+                _code = int(_token[2:], 16) if _token[1] == "x" else int(_token[1:], 8)
+                if _code > 127:
+                    return False
+            elif _token[1] in BYTES_UNSAFE_ESCAPES:
+                return False
+        return True
+
+    @staticmethod
+    def _is_line_break_free(pattern: str) -> bool:
+        """checks whether a (bytes safe) regex pattern can't match a line break: no line break
+        characters or escapes and no character sets
+        """
+        if "\n" in pattern or "[" in pattern:
+            return False
+        return not any([_token in REGEX_LINE_BREAK_ESCAPES for _token in REGEX_BYTES_TOKENS.findall(pattern)])
+
+    @staticmethod
+    def _bytes_regex(rule_dict: dict, encoding: str) -> re.Pattern | None:
+        """converts a rule into a regex on bytes (literal rules are escaped), returns None if the rule
+        would give other results than on lines of text: ignorecase literals have to be lower case ascii
+        (lines are lower cased), regexes have to pass _is_bytes_safe and must not match an empty string.
+        Rules searching the complete text must not match line breaks (the text read by line has
+        doubled line breaks, see _find_content_in_file)
+        """
+        _by_line = rule_dict.get(C.RULE_FIND_BY_LINE, True) is not False
+        _flags = re.MULTILINE if _by_line else 0
+        _regex = rule_dict.get(C.RULE_REGEX)
+        if _regex is None:
+            _rule = str(rule_dict.get(C.RULE_RULE))
+            if rule_dict.get(C.RULE_IGNORECASE, True):
+                if not _rule.isascii() or _rule != _rule.lower():
+                    return None
+                _flags |= re.IGNORECASE
+            if not _by_line and "\n" in _rule:
+                return None
+            _pattern = re.escape(_rule.encode(encoding))
+        else:
+            if not FileContentAnalyzer._is_bytes_safe(_regex.pattern):
+                return None
+            if not _by_line and not FileContentAnalyzer._is_line_break_free(_regex.pattern):
+                return None
+            _flags |= _regex.flags & (re.IGNORECASE | re.DOTALL | re.VERBOSE)
+            _pattern = _regex.pattern.encode(encoding)
+        out = re.compile(_pattern, _flags)
+        if out.search(b"") is not None:
+            return None
+        return out
+
+    @staticmethod
+    def _is_binary(f: str, encoding: str, blocksize: int = 8192) -> bool:
+        """checks whether a file is binary: the first block contains NUL or can't be decoded"""
+        with open(f, mode="rb") as fp:
+            _block = fp.read(blocksize)
+        if b"\0" in _block:
+            return True
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(_block, final=False)
+        except UnicodeDecodeError:
+            return True
+        return False
+
+    @staticmethod
+    def _has_line_conversion(mapped: mmap.mmap) -> bool:
+        """checks whether reading the lines converts the content (CR line breaks or BOM)"""
+        _bom = BOM.encode("utf-8")
+        return mapped[: len(_bom)] == _bom or mapped.find(b"\r") != -1
+
+    @staticmethod
+    def _finditer_by_line(regex: re.Pattern, content: mmap.mmap) -> Generator:
+        """yields the matches of a regex in the content as if it was applied line by line:
+        a match spanning a line break is dropped and its lines are searched one by one
+        """
+        _pos = 0
+        _len = len(content)
+        while _pos < _len:
+            _match = regex.search(content, _pos)
+            if _match is None:
+                return
+            _start, _end = _match.span()
+            # a line break may only be the last character of a match
+            if content.find(b"\n", _start, _end - 1) == -1:
+                yield _match
+                _pos = max(_end, _start + 1)
+                continue
+            _lines_end = content.find(b"\n", _end - 1)
+            _lines_end = _len if _lines_end == -1 else _lines_end + 1
+            while _pos < _lines_end:
+                _line_end = content.find(b"\n", _pos, _lines_end)
+                _line_end = _lines_end if _line_end == -1 else _line_end + 1
+                yield from regex.finditer(content, _pos, _line_end)
+                _pos = _line_end
+
+    @staticmethod
+    def _count_lines(mapped: mmap.mmap, start: int, end: int, chunk_size: int = 1048576) -> int:
+        """counts the line breaks between two positions (in chunks, to keep memory usage bounded)"""
+        _num_lines = 0
+        while start < end:
+            _end = min(end, start + chunk_size)
+            _num_lines += mapped[start:_end].count(b"\n")
+            start = _end
+        return _num_lines
+
+    @staticmethod
+    def _get_line(mapped: mmap.mmap, pos: int, encoding: str) -> str:
+        """returns the decoded line (including line break) at a given position"""
+        _start = mapped.rfind(b"\n", 0, pos) + 1
+        _end = mapped.find(b"\n", pos)
+        _end = len(mapped) if _end == -1 else _end + 1
+        _line = mapped[_start:_end].decode(encoding, errors="backslashreplace")
+        if _start == 0 and _line[:1] == BOM:
+            _line = _line[1:]
+        return _line
+
+    @staticmethod
+    def _find_content_in_file_mmap(f: str, rules_matcher: FileMatcher, encoding: str, filter_result_set: bool) -> tuple:
+        """searches a single file using regexes on the memory mapped bytes, line numbers and lines
+        are only determined for the hits, the content is never copied as a whole. Binary files are
+        skipped (see _is_binary). Files are searched line by line using _find_content_in_file if
+        rules exclude results or would match differently on bytes (see _bytes_regex), or if reading
+        the lines converts the content (CR line breaks or BOM)
+        returns a tuple (file, results by line, lines with hits)
+        """
+        try:
+            if FileContentAnalyzer._is_binary(f, encoding):
+                logger.debug(f"[FileContentAnalyzer] Skipping binary file [{f}]")
+                return (f, {}, {})
+        except OSError as e:
+            logger.error(f"[FileContentAnalyzer] Exception reading file {f}, [{e}]")
+            return (f, {}, {})
+
+        _rules = rules_matcher.rules
+        if any([_rule_dict.get(C.RULE_INCLUDE, True) is not True for _rule_dict in _rules.values()]):
+            return FileContentAnalyzer._find_content_in_file(f, rules_matcher, encoding, filter_result_set)
+        try:
+            _bytes_regexes = {_r: FileContentAnalyzer._bytes_regex(_d, encoding) for _r, _d in _rules.items()}
+        except re.error as e:
+            logger.debug(f"[FileContentAnalyzer] Rules can't be used on bytes, reading file [{f}] ({e})")
+            return FileContentAnalyzer._find_content_in_file(f, rules_matcher, encoding, filter_result_set)
+        _line_rules = [_r for _r, _bytes_regex in _bytes_regexes.items() if _bytes_regex is None]
+        if len(_line_rules) > 0:
+            logger.debug(f"[FileContentAnalyzer] Rules {_line_rules} can't be used on bytes, reading file [{f}]")
+            return FileContentAnalyzer._find_content_in_file(f, rules_matcher, encoding, filter_result_set)
+
+        # none of the remaining rules matches an empty text
+        if os.path.getsize(f) == 0:
+            return (f, {}, {})
+
+        try:
+            with open(f, mode="rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as _mapped:
+                if FileContentAnalyzer._has_line_conversion(_mapped):
+                    _results = None
+                else:
+                    _results, _hit_lines = FileContentAnalyzer._find_in_mapped(
+                        _mapped, _rules, _bytes_regexes, encoding
+                    )
+        except (OSError, ValueError) as e:
+            logger.error(f"[FileContentAnalyzer] Exception reading file {f}, [{e}]")
+            return (f, {}, {})
+        if _results is None:
+            logger.debug(f"[FileContentAnalyzer] File [{f}] contains CR line breaks or BOM, reading lines")
+            return FileContentAnalyzer._find_content_in_file(f, rules_matcher, encoding, filter_result_set)
+
+        if filter_result_set is True:
+            FileContentAnalyzer._filter_all_rules(_results, rules_matcher._all_rules)
+        _hit_lines = {_line_num: _line for _line_num, _line in _hit_lines.items() if _line_num in _results}
+        return (f, _results, _hit_lines)
+
+    @staticmethod
+    def _find_in_mapped(mapped: mmap.mmap, rules: dict, bytes_regexes: dict, encoding: str) -> tuple:
+        """applies the bytes regexes (rule > regex) to the mapped file,
+        returns a tuple (results by line, lines with hits)
+        """
+        _results = {}
+        _hit_lines = {}
+        _hits = []
+        for _rule, _bytes_regex in bytes_regexes.items():
+            _rule_dict = rules[_rule]
+            _literal = _rule_dict[C.RULE_RULE] if _rule_dict.get(C.RULE_REGEX) is None else None
+            _num_groups = _bytes_regex.groups
+            # search in complete text: results are stored in line 0
+            if _rule_dict.get(C.RULE_FIND_BY_LINE, True) is False:
+                _matches = _bytes_regex.findall(mapped)
+                if len(_matches) == 0:
+                    continue
+                if _literal is not None:
+                    _matches = [_literal]
+                else:
+                    _matches = [FileContentAnalyzer._decode_match(_m, encoding) for _m in _matches]
+                _results.setdefault(0, {})[_rule] = _matches
+                _hit_lines[0] = FileContentAnalyzer._get_line(mapped, 0, encoding)
+                continue
+            for _match in FileContentAnalyzer._finditer_by_line(_bytes_regex, mapped):
+                if _literal is not None:
+                    _value = _literal
+                elif _num_groups == 0:
+                    _value = _match.group(0)
+                elif _num_groups == 1:
+                    _value = _match.group(1) or b""
+                else:
+                    _value = tuple([_g or b"" for _g in _match.groups()])
+                _hits.append((_match.start(), _rule, _value))
+
+        # determine line numbers in one pass over the sorted hits
+        _hits.sort(key=lambda _hit: _hit[0])
+        _line_num = 0
+        _pos = 0
+        for _hit_pos, _rule, _value in _hits:
+            _line_num += FileContentAnalyzer._count_lines(mapped, _pos, _hit_pos)
+            _pos = _hit_pos
+            _matches = _results.setdefault(_line_num, {}).setdefault(_rule, [])
+            if isinstance(_value, str):
+                # literal rules have one result per line
+                if len(_matches) == 0:
+                    _matches.append(_value)
+            else:
+                _matches.append(FileContentAnalyzer._decode_match(_value, encoding))
+            if not _line_num in _hit_lines:
+                _hit_lines[_line_num] = FileContentAnalyzer._get_line(mapped, _hit_pos, encoding)
+
+        # keep the order of rules in the results
+        _results = {
+            _line_num: {_rule: _results_by_line[_rule] for _rule in rules.keys() if _rule in _results_by_line}
+            for _line_num, _results_by_line in sorted(_results.items())
+        }
+        return (_results, _hit_lines)
+
+    @staticmethod
+    def _decode_match(match: bytes | tuple, encoding: str) -> str | tuple:
+        """decodes a regex match on bytes (or the tuple of groups)"""
+        if isinstance(match, tuple):
+            return tuple([_m.decode(encoding, errors="backslashreplace") for _m in match])
+        return match.decode(encoding, errors="backslashreplace")
+
     def find_file_content(self, f: str, filter_result_set: bool = True) -> dict:
         """find occurences in file
         filter_result_set: Check the all rules
         """
         # use the file content rule
-        _results = self._find_file_content_txt(f, filter_result_set)
+        if self._use_mmap:
+            _rules_matcher = self._get_matcher(C.RULE_FILE_CONTENT)
+            _, _results, self._content_lines = FileContentAnalyzer._find_content_in_file_mmap(
+                str(f), _rules_matcher, self._encoding, filter_result_set
+            )
+        else:
+            _results = self._find_file_content_txt(f, filter_result_set)
         logger.info(f"[FileContentAnalyzer] File [{f}], found [{len(_results)}] hits")
         return _results
 
@@ -427,16 +792,27 @@ class FileContentAnalyzer(FileAnalyzer):
         as_dict determines whether a result dictionary will be returned
         """
 
-        results = {}
         _results = self.find_file_content(f=f, filter_result_set=filter_result_set)
-        for _line_num, _match_infos in _results.items():
+        _prefixes = (any_before, any_after, all_before, all_after)
+        return FileContentAnalyzer._format_results(f, _results, self._content_lines, _prefixes, skip_prefix_handling)
+
+    @staticmethod
+    def _format_results(
+        f: str, results: dict, content_lines: dict, prefixes: tuple, skip_prefix_handling: bool = False
+    ) -> dict:
+        """formats the search results of a file by line,
+        prefixes is the tuple (any_before, any_after, all_before, all_after)
+        """
+        any_before, any_after, all_before, all_after = prefixes
+        _results = {}
+        for _line_num, _match_infos in results.items():
             _result = {}
             _rules = list(_match_infos.keys())
 
             _result[C.LINE] = _line_num
-            s_out = self._content_lines.get(_line_num, "")
+            s_out = content_lines.get(_line_num, "")
             if skip_prefix_handling:
-                results[_line_num] = s_out
+                _results[_line_num] = s_out
                 continue
 
             # for _rule in rules:, _match_infos in _match_infos.items():
@@ -462,9 +838,67 @@ class FileContentAnalyzer(FileAnalyzer):
             _result[C.FORMATTED] = s_out
             _result[C.RULES] = _rules
             _result[C.LINE] = _line_num
-            results[_line_num] = _result
+            _results[_line_num] = _result
 
-        return results
+        return _results
+
+    def find_in_files(
+        self,
+        files: list | dict = None,
+        filter_result_set: bool = True,
+        any_before: str = C.RESULT_ANY_PREFIX_BEFORE,
+        any_after: str = C.RESULT_ANY_PREFIX_AFTER,
+        all_before: str = C.RESULT_ALL_PREFIX_BEFORE,
+        all_after: str = C.RESULT_ALL_PREFIX_AFTER,
+        skip_prefix_handling: bool = False,
+        max_workers: int = None,
+    ) -> Generator[tuple, None, None]:
+        """searches the content of multiple files in a process pool (max_workers processes) and yields
+        a tuple (file, results) for each file with hits as soon as it was searched (same results as in find)
+        files is a list of files or the dict as returned by find_file_objects, if no files are supplied
+        the file objects found by the file object rules (or all files if there are no such rules) are used
+        """
+        if files is None:
+            _has_file_rules = any(
+                [
+                    len(self._get_matcher(_rule).rules) > 0
+                    for _rule in [C.RULE_FILENAME, C.RULE_PATH, C.RULE_ABSOLUTE_PATH]
+                ]
+            )
+            files = self.find_file_objects() if _has_file_rules else self._file_info.files
+        _rules_matcher = self._get_matcher(C.RULE_FILE_CONTENT)
+        _prefixes = (any_before, any_after, all_before, all_after)
+        _num_files = 0
+        _num_hits = 0
+        if self._use_mmap:
+            _find_content = FileContentAnalyzer._find_content_in_file_mmap
+        else:
+            _find_content = FileContentAnalyzer._find_content_in_file
+        _executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            _futures = [
+                _executor.submit(
+                    _find_content,
+                    str(_f),
+                    _rules_matcher,
+                    self._encoding,
+                    filter_result_set,
+                )
+                for _f in files
+            ]
+            for _future in as_completed(_futures):
+                _f, _results, _hit_lines = _future.result()
+                _num_files += 1
+                if len(_results) == 0:
+                    continue
+                _num_hits += 1
+                yield (
+                    _f,
+                    FileContentAnalyzer._format_results(_f, _results, _hit_lines, _prefixes, skip_prefix_handling),
+                )
+        finally:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            logger.info(f"[FileContentAnalyzer] Searched [{_num_files}] files, [{_num_hits}] files with hits")
 
 
 def main():
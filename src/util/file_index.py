@@ -0,0 +1,159 @@
+"""Persistent file system index (sqlite) with incremental refresh"""
+
+import json
+import logging
+import os
+import sqlite3
+import sys
+from contextlib import closing
+
+from util.persistence import Persistence
+
+from cli.bootstrap_env import CLI_LOG_LEVEL
+
+# when doing tests add this to reference python path
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+logger = logging.getLogger(__name__)
+# get log level from environment if given
+logger.setLevel(CLI_LOG_LEVEL)
+
+# sqlite table definitions
+SQL_CREATE_DIRS = """CREATE TABLE IF NOT EXISTS dirs (
+    root TEXT NOT NULL, path TEXT NOT NULL, mtime_ns INTEGER NOT NULL, subdirs TEXT NOT NULL,
+    PRIMARY KEY (root, path))"""
+SQL_CREATE_FILES = """CREATE TABLE IF NOT EXISTS files (
+    root TEXT NOT NULL, path TEXT NOT NULL, name TEXT NOT NULL, size INTEGER, mtime_ns INTEGER)"""
+SQL_CREATE_FILES_INDEX = "CREATE INDEX IF NOT EXISTS files_root_path ON files (root, path)"
+
+
+class FileSysIndex:
+    """persistent index of the file system objects (paths, file names, sizes and mtimes) per root path.
+    On refresh the directory mtimes are checked and only directories that changed are read again
+    (note: a directory mtime only changes when entries are added, removed or renamed, so sizes and
+    mtimes of files in unchanged directories are the ones of the last scan)
+    """
+
+    def __init__(self, f_index: str) -> None:
+        """constructor, f_index is the sqlite file the index is stored in"""
+        self._f_index = os.path.abspath(f_index)
+        # statistics of the last refresh
+        self._num_dirs = 0
+        self._num_dirs_scanned = 0
+        self._num_dirs_deleted = 0
+        with closing(self._connect()) as _conn:
+            with _conn:
+                _conn.execute(SQL_CREATE_DIRS)
+                _conn.execute(SQL_CREATE_FILES)
+                _conn.execute(SQL_CREATE_FILES_INDEX)
+
+    def _connect(self) -> sqlite3.Connection:
+        """returns a connection to the index file"""
+        return sqlite3.connect(self._f_index)
+
+    @property
+    def f_index(self) -> str:
+        """returns the index file"""
+        return self._f_index
+
+    @property
+    def stats(self) -> dict:
+        """returns statistics of the last refresh"""
+        return {
+            "dirs": self._num_dirs,
+            "dirs_scanned": self._num_dirs_scanned,
+            "dirs_deleted": self._num_dirs_deleted,
+        }
+
+    @staticmethod
+    def _get_root_key(root_path: str) -> str:
+        """returns the key of a root path in the index (normalized absolute path)"""
+        return os.path.normcase(os.path.abspath(root_path))
+
+    def refresh(self, root_path: str) -> dict:
+        """updates the index for a root path and returns all directories in os.walk (top down) order
+        as dict {subpath:[(name,size,mtime_ns),...]}, with subpath as os.walk would return it.
+        The root path is stored as normalized absolute path and the directories relative to it,
+        so the same index is used for relative root paths from different working directories
+        """
+        self._num_dirs = 0
+        self._num_dirs_scanned = 0
+        self._num_dirs_deleted = 0
+        out = {}
+        _root_key = FileSysIndex._get_root_key(root_path)
+        # relative paths of the directories read
+        _rel_paths = set()
+        with closing(self._connect()) as _conn:
+            _indexed_dirs = {
+                _rel_path: (_mtime_ns, json.loads(_subdirs))
+                for _rel_path, _mtime_ns, _subdirs in _conn.execute(
+                    "SELECT path, mtime_ns, subdirs FROM dirs WHERE root = ?", (_root_key,)
+                )
+            }
+            _indexed_files = {}
+            for _rel_path, _name, _size, _mtime_ns in _conn.execute(
+                "SELECT path, name, size, mtime_ns FROM files WHERE root = ? ORDER BY rowid", (_root_key,)
+            ):
+                _indexed_files.setdefault(_rel_path, []).append((_name, _size, _mtime_ns))
+
+            _changed_dirs = []
+            # stack of (path as os.walk would return it, path relative to root)
+            _stack = [(root_path, ".")]
+            while _stack:
+                _p, _rel_path = _stack.pop()
+                try:
+                    _mtime_ns = os.stat(_p).st_mtime_ns
+                except OSError:
+                    continue
+                _indexed_dir = _indexed_dirs.get(_rel_path)
+                if _indexed_dir is not None and _indexed_dir[0] == _mtime_ns:
+                    _subdirs = _indexed_dir[1]
+                    _files = _indexed_files.get(_rel_path, [])
+                else:
+                    _, _, _dirs, _files, _subdir_paths = Persistence._scan_dir(_p, 0, file_stats=True)
+                    if _dirs is None:
+                        continue
+                    _subdirs = [os.path.basename(_subdir_path) for _subdir_path in _subdir_paths]
+                    _changed_dirs.append((_rel_path, _mtime_ns, _subdirs, _files))
+                out[_p] = _files
+                _rel_paths.add(_rel_path)
+                for _subdir in reversed(_subdirs):
+                    _rel_subdir = _subdir if _rel_path == "." else os.path.join(_rel_path, _subdir)
+                    _stack.append((os.path.join(_p, _subdir), _rel_subdir))
+
+            _deleted_dirs = [_rel_path for _rel_path in _indexed_dirs.keys() if _rel_path not in _rel_paths]
+            with _conn:
+                for _rel_path in _deleted_dirs:
+                    _conn.execute("DELETE FROM dirs WHERE root = ? AND path = ?", (_root_key, _rel_path))
+                    _conn.execute("DELETE FROM files WHERE root = ? AND path = ?", (_root_key, _rel_path))
+                for _rel_path, _mtime_ns, _subdirs, _files in _changed_dirs:
+                    _conn.execute("DELETE FROM files WHERE root = ? AND path = ?", (_root_key, _rel_path))
+                    _conn.execute(
+                        "INSERT OR REPLACE INTO dirs (root, path, mtime_ns, subdirs) VALUES (?, ?, ?, ?)",
+                        (_root_key, _rel_path, _mtime_ns, json.dumps(_subdirs)),
+                    )
+                    _conn.executemany(
+                        "INSERT INTO files (root, path, name, size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+                        [(_root_key, _rel_path, *_file) for _file in _files],
+                    )
+
+        self._num_dirs = len(out)
+        self._num_dirs_scanned = len(_changed_dirs)
+        self._num_dirs_deleted = len(_deleted_dirs)
+        logger.info(
+            f"[FileSysIndex] Root [{root_path}], [{self._num_dirs}] dirs, scanned [{self._num_dirs_scanned}], deleted [{self._num_dirs_deleted}]"
+        )
+        return out
+
+    def clear(self, root_path: str = None) -> None:
+        """deletes the index for a root path or the complete index if no root path is given"""
+        with closing(self._connect()) as _conn:
+            with _conn:
+                if root_path is None:
+                    _conn.execute("DELETE FROM dirs")
+                    _conn.execute("DELETE FROM files")
+                else:
+                    _root_key = FileSysIndex._get_root_key(root_path)
+                    _conn.execute("DELETE FROM dirs WHERE root = ?", (_root_key,))
+                    _conn.execute("DELETE FROM files WHERE root = ?", (_root_key,))
@@ -9,8 +9,21 @@ from pydantic import ConfigDict, BaseModel
 # from util.filter_set import ParamsFileTreeModel
 from model.model_persistence import ParamsFind
 from util.persistence import Persistence
-from util.tree import Tree
-from util.utils import FILES, IS_FILE, PARENT, PATHS, ROOT, SIZE, TOTAL_SIZE, VALUE, Utils
+from util.tree import AGG_COUNT, AGG_MAX, AGG_SUM, Tree
+from util.utils import (
+    CHDATE,
+    FILES,
+    IS_FILE,
+    PARENT,
+    PATHS,
+    ROOT,
+    SIZE,
+    TOTAL_CHDATE,
+    TOTAL_FILES,
+    TOTAL_SIZE,
+    VALUE,
+    Utils,
+)
 from cli.bootstrap_env import CLI_LOG_LEVEL
 
 
@@ -123,28 +136,31 @@ class FileTree:
         if self._add_metadata is False:
             logger.info("[FileTree] Calculation of subtotal file sizes not possible since no metadata were read")
             return
-        # get all children (=Files) and adf file size to each predecessor
         _tree = self.tree
-        # get all leaves in case no leaf ids are transferred
-        if leaves is None:
-            _leaves = _tree.get_leaves()
         # can be used to calculate trees only for some sub trees
-        else:
-            _leaves = leaves
-
-        for _leaf_id in _leaves:
-            # get the info
-            _info = self._tree_dict.get(_leaf_id)
-            # only add size of files
-            if _info[IS_FILE] is False:
+        _leaves = None if leaves is None else set(leaves)
+
+        def _is_file(node_id: object, info: dict) -> bool:
+            """only add size of files"""
+            if _leaves is not None and node_id not in _leaves:
+                return False
+            return info.get(IS_FILE) is True
+
+        # single bottom up pass to get size, number of files and newest change date of each path
+        _aggregates = _tree.aggregate([SIZE, CHDATE], node_filter=_is_file)
+        for _node_id, _node_aggregates in _aggregates.items():
+            _info = self._tree_dict.get(_node_id)
+            if _info is None or _info.get(IS_FILE) is True:
                 continue
-            _size = _info.get(SIZE, 0)
-            # get all predecessors and add size of leaf node (=file)
-            _pred_ids = _tree.get_predecessors(_leaf_id)
-            for _pred_id in _pred_ids:
-                _info_pred = self._tree_dict.get(_pred_id)
-                _pred_size = _info_pred.get(TOTAL_SIZE, 0) + _size
-                _info_pred[TOTAL_SIZE] = _pred_size
+            _size_aggregates = _node_aggregates[SIZE]
+            # no files (any more): drop totals of a previous calculation
+            if _size_aggregates[AGG_COUNT] == 0:
+                for _total in [TOTAL_SIZE, TOTAL_FILES, TOTAL_CHDATE]:
+                    _info.pop(_total, None)
+                continue
+            _info[TOTAL_SIZE] = _size_aggregates[AGG_SUM]
+            _info[TOTAL_FILES] = _size_aggregates[AGG_COUNT]
+            _info[TOTAL_CHDATE] = _node_aggregates[CHDATE][AGG_MAX]
 
     @property
     def stats(self):
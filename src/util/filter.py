@@ -1,11 +1,12 @@
 """Generic Filter"""
 
 import logging
+import operator
 import re
 from abc import ABC, abstractmethod
 from datetime import datetime as DateTime
 from re import Pattern
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional
 
 from pydantic import ConfigDict
 
@@ -24,6 +25,10 @@ logger = logging.getLogger(__name__)
 # get log level from environment if given
 logger.setLevel(CLI_LOG_LEVEL)
 
+# comparison of value (left) and filter value (right)
+OPERATORS_MAX = {"lt": operator.lt, "le": operator.le, "eq": operator.eq}
+OPERATORS_MIN = {"gt": operator.gt, "ge": operator.ge, "eq": operator.eq}
+
 
 class AbstractAtomicFilter(ABC):
     """generic definition of an atomic filter"""
@@ -116,6 +121,25 @@ class AbstractAtomicFilter(ABC):
     def filter(self, obj: Any, groups: list = None) -> bool | None:
         """abstract filter method to be implemented by subclass"""
 
+    def compile(self) -> Callable[[Any], bool | None]:
+        """returns a filter function for the current filter settings, returning None instead of raising
+        a ValueError for objects that can't be filtered. can be overridden by subclasses
+        """
+
+        def _filter(obj: Any) -> bool | None:
+            try:
+                _passed = self.filter(obj)
+            except ValueError:
+                return None
+            return None if _passed is None else bool(_passed)
+
+        return _filter
+
+    def filter_many(self, values: list) -> list:
+        """filters a list of values, returns list of results (None for values that can't be filtered)"""
+        _filter = self.compile()
+        return [_filter(_value) for _value in values]
+
 
 class NumericalFilter(AbstractAtomicFilter):
     """Numerical Filter"""
@@ -135,7 +159,7 @@ class NumericalFilter(AbstractAtomicFilter):
         """filter passed object"""
         if not isinstance(obj, (int, float, DateTime)):
             raise ValueError(
-                f"[NumericalFilter] Passed {obj} of type [{type(obj).__name__}], expected [{self._filter_type.__name__}]"
+                f"[NumericalFilter] Passed {obj} of type [{type(obj).__name__}], expected [{self._filter_type}]"
             )
 
         # type checking
@@ -177,6 +201,30 @@ class NumericalFilter(AbstractAtomicFilter):
 
         return passed
 
+    def compile(self) -> Callable[[Any], bool | None]:
+        """returns a filter function with precalculated comparisons"""
+        _numerical_type = self._numerical_type
+        _value_max = self._filter.value_max
+        _value_min = self._filter.value_min
+        # filter is not set or has no valid type
+        if (_value_max is None and _value_min is None) or not issubclass(_numerical_type, (int, float, DateTime)):
+            return lambda obj: None
+        _op_max = None
+        if _value_max is not None:
+            _op_max = OPERATORS_MAX.get(self._filter.operator_max or "le")
+        _op_min = None
+        if _value_min is not None:
+            _op_min = OPERATORS_MIN.get(self._filter.operator_min or "ge")
+        _exclude = self._filter.include == "exclude"
+
+        def _filter(obj: Any) -> bool | None:
+            if type(obj) is not _numerical_type:
+                return None
+            _passed = (_op_max is None or _op_max(obj, _value_max)) and (_op_min is None or _op_min(obj, _value_min))
+            return _passed is not _exclude
+
+        return _filter
+
 
 class RegexFilter(AbstractAtomicFilter):
     """Parsing Regex"""
@@ -207,6 +255,18 @@ class RegexFilter(AbstractAtomicFilter):
 
         return passed
 
+    def compile(self) -> Callable[[Any], bool | None]:
+        """returns a filter function (find_all matches are not stored)"""
+        _search = self._regex.search
+        _exclude = self._filter.include == "exclude"
+
+        def _filter(obj: Any) -> bool | None:
+            if not isinstance(obj, str):
+                return None
+            return (_search(obj) is not None) is not _exclude
+
+        return _filter
+
     def find_all(self, obj):
         """returning the matches"""
         _ = self.filter(obj)
@@ -259,6 +319,52 @@ class StringFilter(AbstractAtomicFilter):
 
         return passed
 
+    def compile(self) -> Callable[[Any], bool | None]:
+        """returns a filter function using a set for exact matches and a combined regex for any contains match"""
+        _filter_strings = self._filter.filter_strings
+        if _filter_strings is None:
+            logger.warning(
+                f"[StringFilter] String Filter [{self._filter.key}] ({self._filter.description}) has no value"
+            )
+            return lambda obj: None
+        if isinstance(_filter_strings, str):
+            _filter_strings = [_filter_strings]
+        _filter_strings = tuple(_filter_strings)
+        _exclude = self._filter.include == "exclude"
+        _is_all = self._filter.string_operator == "all"
+
+        if self._filter.match == "contains" and _is_all:
+
+            def _passes(obj: str) -> bool:
+                for _filter_s in _filter_strings:
+                    if _filter_s not in obj:
+                        return False
+                return True
+
+        elif self._filter.match == "contains":
+            _regex = None
+            if len(_filter_strings) > 0:
+                _regex = re.compile("|".join([re.escape(_filter_s) for _filter_s in _filter_strings]))
+
+            def _passes(obj: str) -> bool:
+                return _regex is not None and _regex.search(obj) is not None
+
+        else:
+            _filter_set = frozenset(_filter_strings)
+
+            def _passes(obj: str) -> bool:
+                # all strings need to be equal to the object
+                if _is_all:
+                    return len(_filter_set) == 0 or (len(_filter_set) == 1 and obj in _filter_set)
+                return obj in _filter_set
+
+        def _filter(obj: Any) -> bool | None:
+            if not isinstance(obj, str):
+                return None
+            return _passes(obj) is not _exclude
+
+        return _filter
+
 
 class CalendarFilterModel(FilterModel):
     """Filtering DateTime in a Calendar Object"""
@@ -288,6 +394,7 @@ class CalendarFilterWrapper(AbstractAtomicFilter):
         if self._calendar_filter_obj is None:
             self._calendar_filter_obj = CalendarFilterObject(self._filter_str, self._date_list_in)
         self._datelist = self._calendar_filter_obj.datelist
+        self._dateset = frozenset(self._datelist)
 
     def filter(self, obj: Any, groups: list = None) -> bool | None:
         """filtering the calendar object"""
@@ -298,13 +405,25 @@ class CalendarFilterWrapper(AbstractAtomicFilter):
                 f"[CalendarFilter] Passed {obj} of type [{type(obj).__name__}], expected datetime.datetime"
             )
 
-        passed = True if obj in self._datelist else False
+        passed = True if obj in self._dateset else False
 
         if self._filter.include == "exclude":
             passed = not passed
 
         return passed
 
+    def compile(self) -> Callable[[Any], bool | None]:
+        """returns a filter function checking the dates against a set"""
+        _dates = self._dateset
+        _exclude = self._filter.include == "exclude"
+
+        def _filter(obj: Any) -> bool | None:
+            if not isinstance(obj, DateTime):
+                return None
+            return (obj in _dates) is not _exclude
+
+        return _filter
+
     @property
     def datelist(self) -> List[DateTime]:
         """returns the date list"""
@@ -1,7 +1,7 @@
 """Combined Atomic Filters to a filter set"""
 
 import logging
-from typing import Dict, List
+from typing import Any, Callable, Dict, List
 
 
 from model.model_filter import FilterSetModel, AtomicFilterResult, FilterSetResult
@@ -29,6 +29,8 @@ class FilterSet(AbstractAtomicFilter):
         self._filter_attribute_dict: Dict[str, list] = {}
         self._filter_key_dict: Dict[str, AbstractAtomicFilter] = {}
         self._verbose = None
+        # compiled filter functions by groups
+        self._compiled: Dict[tuple, Callable[[Any], bool | None]] = {}
         # get items
         self._parse_filter_list()
         pass
@@ -137,6 +139,127 @@ class FilterSet(AbstractAtomicFilter):
         _messages.append(message)
         filter_set_result.messages[key] = _messages
 
+    def _get_plan(self, groups: list = None) -> list:
+        """returns the flat list of (atomic filter, attributes) to be applied for the groups,
+        attribute None is the plain object
+        """
+        out = []
+        for _atomic_filter in self._filter_key_dict.values():
+            _atomic_filter_groups = _atomic_filter.groups
+            if groups is not None and _atomic_filter_groups is not None:
+                _filtered = [filtered_group for filtered_group in groups if filtered_group in _atomic_filter_groups]
+                if len(_filtered) == 0:
+                    continue
+            _attributes = _atomic_filter.attributes
+            if isinstance(_attributes, list) and len(_attributes) > 0:
+                _attributes = tuple(_attributes)
+            else:
+                _attributes = (None,)
+            out.append((_atomic_filter, _attributes))
+        return out
+
+    def compile(self, groups: list = None) -> Callable[[Any], bool | None]:
+        """compiles the filter set for a fixed group selection into a single filter function, returning
+        the same result as filter with verbose=False (compiled functions are buffered by groups,
+        filters containing filter sets are compiled as well). Call invalidate when filters are changed
+        """
+        if isinstance(groups, str):
+            groups = [groups]
+        _groups_key = None if groups is None else tuple(groups)
+        _compiled = self._compiled.get(_groups_key)
+        if _compiled is not None:
+            return _compiled
+
+        _plan = tuple(
+            [(_atomic_filter.compile(), _attributes) for _atomic_filter, _attributes in self._get_plan(groups)]
+        )
+        _ignore_missing_attributes = self._filter.ignore_missing_attributes
+        _is_all = self._filter.operator == "all"
+        _exclude = self._filter.include == "exclude"
+
+        def _filter(obj: Any) -> bool | None:
+            _has_result = False
+            _is_dict = isinstance(obj, dict)
+            for _filter_function, _attributes in _plan:
+                for _attribute in _attributes:
+                    if _attribute is None:
+                        _value = obj
+                    else:
+                        _value = obj.get(_attribute) if _is_dict else getattr(obj, _attribute, None)
+                        if _value is None and _ignore_missing_attributes:
+                            continue
+                    _passed = _filter_function(_value)
+                    if _passed is None:
+                        continue
+                    # first failed filter (all) or first passed filter (any) decides
+                    if _passed is not _is_all:
+                        return _passed is not _exclude
+                    _has_result = True
+            if not _has_result:
+                return None
+            return _is_all is not _exclude
+
+        self._compiled[_groups_key] = _filter
+        return _filter
+
+    def _filter_columns(self, num_objects: int, get_column: Callable[[str | None], list], groups: list = None) -> list:
+        """filters column by column and combines the results of each filter"""
+        if isinstance(groups, str):
+            groups = [groups]
+        _ignore_missing_attributes = self._filter.ignore_missing_attributes
+        _is_all = self._filter.operator == "all"
+        _exclude = self._filter.include == "exclude"
+        # None: no filter result yet, False: filter results, True: decided by a filter
+        # (first failed filter for all, first passed filter for any)
+        _decided = [None] * num_objects
+        for _atomic_filter, _attributes in self._get_plan(groups):
+            for _attribute in _attributes:
+                _values = get_column(_attribute)
+                _results = _atomic_filter.filter_many(_values)
+                _skip_none = _attribute is not None and _ignore_missing_attributes
+                for _idx, _passed in enumerate(_results):
+                    if _passed is None or _decided[_idx] is True:
+                        continue
+                    if _skip_none and _values[_idx] is None:
+                        continue
+                    _decided[_idx] = _passed is not _is_all
+        _result_decided = (not _is_all) is not _exclude
+        _result_undecided = _is_all is not _exclude
+        return [None if _d is None else (_result_decided if _d else _result_undecided) for _d in _decided]
+
+    def filter_many(self, objs: list, groups: list = None) -> list:
+        """filters a list of objects (dicts, objects or plain values) column by column,
+        returns the list of results, same as calling filter with verbose=False for each object
+        """
+
+        def _get_column(attribute: str | None) -> list:
+            if attribute is None:
+                return objs
+            return [_obj.get(attribute) if isinstance(_obj, dict) else getattr(_obj, attribute, None) for _obj in objs]
+
+        return self._filter_columns(len(objs), _get_column, groups)
+
+    def filter_columns(self, columns: Dict[str, list], groups: list = None) -> list:
+        """filters a column mapping {attribute: [values]} (all columns of same length),
+        returns the list of results per row, filters without attributes are not applied
+        """
+        _num_objects = max([len(_values) for _values in columns.values()], default=0)
+
+        def _get_column(attribute: str | None) -> list:
+            _values = columns.get(attribute)
+            if _values is None:
+                return [None] * _num_objects
+            return _values
+
+        return self._filter_columns(_num_objects, _get_column, groups)
+
+    def invalidate(self) -> None:
+        """drops the compiled filter functions (also of the nested filter sets)"""
+        self._compiled = {}
+        for _atomic_filter in self._filter_list:
+            if isinstance(_atomic_filter, FilterSet):
+                _atomic_filter.invalidate()
+
     def filter(
         self, obj: object, groups: list = None, verbose: bool = False
     ) -> bool | None | Dict[str, AtomicFilterResult]:
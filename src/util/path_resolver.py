@@ -0,0 +1,159 @@
+"""Resolving executables on PATH without spawning processes (pure python where / which -a)"""
+
+import logging
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from cli.bootstrap_env import CLI_LOG_LEVEL, PATH_HOME
+from util.persistence import Persistence
+
+logger = logging.getLogger(__name__)
+# get log level from environment if given
+logger.setLevel(CLI_LOG_LEVEL)
+
+# default disk cache of the executable index
+F_PATH_CACHE_DEFAULT = os.path.join(PATH_HOME, "path_cache.json")
+IS_WIN = sys.platform == "win32"
+
+
+class PathResolver:
+    """index of the executables in the PATH directories, directories are scanned once using os.scandir.
+    The index is cached in memory and on disk and is created again once PATH or the modification time
+    of a PATH directory (changes when files are added or removed) changes
+    """
+
+    # {"path": PATH, "dirs": {dir: mtime}, "index": {executable name: [executables in PATH order]}}
+    _cache: dict = None
+
+    @staticmethod
+    def get_path_dirs(path_env: str = None) -> List[str]:
+        """returns the unique directories of PATH in order"""
+        if path_env is None:
+            path_env = os.environ.get("PATH", "")
+        out = []
+        for _p in path_env.split(os.pathsep):
+            _p = _p.strip().strip('"')
+            if len(_p) > 0 and _p not in out:
+                out.append(_p)
+        return out
+
+    @staticmethod
+    def _get_dir_mtimes(dirs: List[str]) -> Dict[str, int | None]:
+        """returns modification times of directories (None if it doesn't exist)"""
+        out = {}
+        for _p in dirs:
+            try:
+                out[_p] = os.stat(_p).st_mtime_ns
+            except OSError:
+                out[_p] = None
+        return out
+
+    @staticmethod
+    def _get_exts() -> List[str]:
+        """returns the extensions of executables (windows only)"""
+        return [_ext.lower() for _ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(";") if _ext]
+
+    @staticmethod
+    def _scan_dirs(dirs: List[str]) -> Dict[str, List[str]]:
+        """scans the directories for executables, returns index executable name > executables
+        on windows names are lower case and can be used with or without extension
+        """
+        out = {}
+        _exts = PathResolver._get_exts() if IS_WIN else []
+        for _p in dirs:
+            try:
+                with os.scandir(_p) as _entries:
+                    for _entry in _entries:
+                        try:
+                            if not _entry.is_file():
+                                continue
+                        except OSError:
+                            continue
+                        _names = []
+                        if IS_WIN:
+                            _name = _entry.name.lower()
+                            _stem, _ext = os.path.splitext(_name)
+                            if _ext not in _exts:
+                                continue
+                            _names = [_name, _stem]
+                        elif os.access(_entry.path, os.X_OK):
+                            _names = [_entry.name]
+                        for _name in _names:
+                            out.setdefault(_name, []).append(_entry.path)
+            except OSError as e:
+                logger.debug(f"[PathResolver] Couldn't read PATH directory [{_p}], {e}")
+        return out
+
+    @staticmethod
+    def _is_valid(cache: dict | None, path_env: str, dir_mtimes: dict) -> bool:
+        """checks whether a cached index fits to PATH and directory modification times"""
+        if not isinstance(cache, dict) or not isinstance(cache.get("index"), dict):
+            return False
+        return cache.get("path") == path_env and cache.get("dirs") == dir_mtimes
+
+    @staticmethod
+    def get_index(path_env: str = None, f_cache: str = F_PATH_CACHE_DEFAULT) -> Dict[str, List[str]]:
+        """returns the (cached) executable index of PATH, f_cache is the disk cache (None: no disk cache)"""
+        if path_env is None:
+            path_env = os.environ.get("PATH", "")
+        _dirs = PathResolver.get_path_dirs(path_env)
+        _dir_mtimes = PathResolver._get_dir_mtimes(_dirs)
+        if PathResolver._is_valid(PathResolver._cache, path_env, _dir_mtimes):
+            return PathResolver._cache["index"]
+        if f_cache is not None and os.path.isfile(f_cache):
+            _cache = Persistence.read_json(f_cache)
+            if PathResolver._is_valid(_cache, path_env, _dir_mtimes):
+                logger.debug(f"[PathResolver] Loaded executable index from [{f_cache}]")
+                PathResolver._cache = _cache
+                return _cache["index"]
+        _cache = {"path": path_env, "dirs": _dir_mtimes, "index": PathResolver._scan_dirs(_dirs)}
+        logger.debug(f"[PathResolver] Scanned [{len(_dirs)}] PATH directories")
+        PathResolver._cache = _cache
+        if f_cache is not None and os.path.isdir(str(Path(f_cache).parent)):
+            Persistence.save_json(f_cache, _cache)
+        return _cache["index"]
+
+    @staticmethod
+    def where(
+        cmd: str, re_prefered: str = None, path_env: str = None, f_cache: str = F_PATH_CACHE_DEFAULT
+    ) -> List[str]:
+        """returns all executables for a command in PATH order, if a regex for preferred executables
+        is supplied, only matching executables are returned (all, if none matches)
+        """
+        if os.path.dirname(cmd):
+            out = [cmd] if os.path.isfile(cmd) else []
+        else:
+            _index = PathResolver.get_index(path_env, f_cache)
+            out = list(_index.get(cmd.lower() if IS_WIN else cmd, []))
+        if re_prefered is not None:
+            _re_prefered = re.compile(re_prefered, re.IGNORECASE)
+            _prefered = [_cmd for _cmd in out if _re_prefered.search(_cmd)]
+            if len(_prefered) > 0:
+                out = _prefered
+        return out
+
+    @staticmethod
+    def which(
+        cmd: str, re_prefered: str = None, path_env: str = None, f_cache: str = F_PATH_CACHE_DEFAULT
+    ) -> str | None:
+        """returns the first (preferred) executable for a command or None"""
+        _cmds = PathResolver.where(cmd, re_prefered, path_env, f_cache)
+        return _cmds[0] if len(_cmds) > 0 else None
+
+    @staticmethod
+    def clear() -> None:
+        """clears the in memory cache"""
+        PathResolver._cache = None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        format="%(asctime)s %(levelname)s %(module)s:[%(name)s.%(funcName)s(%(lineno)d)]: %(message)s",
+        level=CLI_LOG_LEVEL,
+        stream=sys.stdout,
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    print(PathResolver.where("python"))
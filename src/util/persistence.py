@@ -1,5 +1,6 @@
 """Helper class to read / write (single) file"""
 
+import inspect
 import io
 import json
 import logging
@@ -7,6 +8,7 @@ import os
 import re
 import shutil
 import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime as DateTime
 from pathlib import Path
 from typing import Literal
@@ -122,9 +124,8 @@ class Persistence:
             block = file.read(blocksize)
             if b"\0" in block:
                 return False
-            text_characters = b"".join(
-                map(lambda x: x.to_bytes(1, "big"), range(32, 127)) + [b"\n", b"\r", b"\t", b"\b"]
-            )
+            if len(block) == 0:
+                return True
             text_characters = list(map(lambda x: x.to_bytes(1, "big"), range(32, 127)))
             text_characters.extend([b"\n", b"\r", b"\t", b"\b"])
             text_characters = b"".join(text_characters)
@@ -304,72 +305,191 @@ class Persistence:
         """walks the path in a given root directory
         is used in find method as a way to get objects without rendering
         progress bars, returns number of processed files
+        (single filter case of _walk_paths_multi, results are appended to path_dict, paths_out, files_out)
+        """
+        if show_progress:
+            rprint(f"[{Color['OUT_TITLE']}]### Path  [{Color['OUT_PATH']}][{p_root}]")
+        _params = {
+            "root_path_only": root_path_only,
+            "re_include_paths": re_include_paths,
+            "re_exclude_paths": re_exclude_paths,
+            "re_include_files": re_include_files,
+            "re_exclude_files": re_exclude_files,
+            "re_include_abspaths": re_include_abspaths,
+            "re_exclude_abspaths": re_exclude_abspaths,
+            "match_all": match_all,
+            "max_path_depth": max_path_depth,
+            "max_num_files": max_num_files,
+            "max_num_dirs": max_num_dirs,
+            "paths_only": paths_only,
+        }
+        _walked = Persistence._walk_paths_multi(
+            p_root, {None: _params}, {None: (path_dict, paths_out, files_out)}, show_progress
+        )
+        return _walked[None][3]
+
+    @staticmethod
+    def _scan_dir(p: str, level: int, file_stats: bool = False) -> tuple:
+        """reads a single directory using os.scandir, returns a tuple (path,level,dirs,files,subdirs)
+        with subdirs being the directories to descend into (symlinks are not followed, as in os.walk)
+        dirs is None if the directory couldn't be read (os.walk will skip those as well)
+        file_stats: files are returned as tuples (name,size,mtime_ns) (None if they can't be read)
+        """
+        _dirs = []
+        _files = []
+        _subdirs = []
+        try:
+            with os.scandir(p) as _entries:
+                for _entry in _entries:
+                    try:
+                        _is_dir = _entry.is_dir()
+                    except OSError:
+                        _is_dir = False
+                    if _is_dir:
+                        _dirs.append(_entry.name)
+                        if not _entry.is_symlink():
+                            _subdirs.append(_entry.path)
+                    elif file_stats:
+                        try:
+                            _stat = _entry.stat()
+                            _files.append((_entry.name, _stat.st_size, _stat.st_mtime_ns))
+                        except OSError:
+                            _files.append((_entry.name, None, None))
+                    else:
+                        _files.append(_entry.name)
+        except OSError as e:
+            logger.debug(f"[Persistence] Couldn't read path [{p}], skipping ({e})")
+            return (p, level, None, None, None)
+        return (p, level, _dirs, _files, _subdirs)
+
+    @staticmethod
+    def _scandir_crawl(
+        p_root: str,
+        max_workers: int = None,
+        max_path_depth: int = None,
+        root_path_only: bool = False,
+    ) -> dict:
+        """crawls a root path using a bounded thread pool, each directory being a work item
+        returns a dict {path:(level,dirs,files)} of all directories read
+        directories below max_path_depth are not read at all
+        """
+        out = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as _executor:
+            _pending = {_executor.submit(Persistence._scan_dir, p_root, 0)}
+            while _pending:
+                _done, _pending = wait(_pending, return_when=FIRST_COMPLETED)
+                for _future in _done:
+                    _p, _level, _dirs, _files, _subdirs = _future.result()
+                    if _dirs is None:
+                        continue
+                    out[_p] = (_level, _dirs, _files)
+                    if root_path_only:
+                        continue
+                    if max_path_depth is not None and _level >= max_path_depth:
+                        continue
+                    for _subdir in _subdirs:
+                        _pending.add(_executor.submit(Persistence._scan_dir, _subdir, _level + 1))
+        return out
+
+    @staticmethod
+    def _scandir_paths(
+        path_dict: dict,
+        paths_out: list,
+        files_out: list,
+        p_root: str,
+        root_path_only: bool = False,
+        re_include_paths: list = None,
+        re_exclude_paths: list = None,
+        re_include_files: list = None,
+        re_exclude_files: list = None,
+        re_include_abspaths: list = None,
+        re_exclude_abspaths: list = None,
+        match_all: bool = False,
+        show_progress: bool = False,
+        max_path_depth: int = None,
+        max_num_files: int = None,
+        max_num_dirs: int = None,
+        paths_only: bool = False,
+        add_empty_paths: bool = False,
+        max_workers: int = None,
+    ) -> int:
+        """alternative to _walk_paths: reads the directories in parallel (os.scandir in a thread pool)
+        and then evaluates them in the same (top down) order as os.walk, so that the output is the same
+        returns number of processed files. max_num_files / max_num_dirs count all directories in os.walk
+        order (also the ones below max_path_depth), so _walk_paths is used if any of these limits is set
         """
+        if max_num_files is not None or max_num_dirs is not None:
+            logger.debug("[Persistence] File / dir limits are set, using os.walk instead of scandir")
+            return Persistence._walk_paths(
+                path_dict=path_dict,
+                paths_out=paths_out,
+                files_out=files_out,
+                p_root=p_root,
+                root_path_only=root_path_only,
+                re_include_paths=re_include_paths,
+                re_exclude_paths=re_exclude_paths,
+                re_include_files=re_include_files,
+                re_exclude_files=re_exclude_files,
+                re_include_abspaths=re_include_abspaths,
+                re_exclude_abspaths=re_exclude_abspaths,
+                match_all=match_all,
+                show_progress=show_progress,
+                max_path_depth=max_path_depth,
+                max_num_files=max_num_files,
+                max_num_dirs=max_num_dirs,
+                paths_only=paths_only,
+                add_empty_paths=add_empty_paths,
+            )
         out = 0
 
         if show_progress:
             rprint(f"[{Color['OUT_TITLE']}]### Path  [{Color['OUT_PATH']}][{p_root}]")
-        # determine depth of root path
-        _depth_root_path = len(Path(os.path.abspath(p_root)).parts)
-        _num_total_files = 0
-        _num_total_dirs = 0
-        for _subpath, _, _files in os.walk(p_root):
-            _num_total_dirs += 1
-            if max_num_dirs is not None and _num_total_dirs > max_num_dirs:
-                logger.info(f"[Persistence] Read more than [{_num_total_dirs}] dirs, will end here")
-                break
-            _num_total_files += len(_files)
-            if max_num_files is not None and _num_total_files > max_num_files:
-                logger.info(f"[Persistence] Read more than [{_num_total_files}] files, will end here")
-                break
 
-            _cur_path = Path(_subpath).absolute()
-            if root_path_only and str(_cur_path) != p_root:
+        # same string representation of paths as in _walk_paths
+        _p_root_abs = str(Path(p_root).absolute())
+        _dir_infos = Persistence._scandir_crawl(_p_root_abs, max_workers, max_path_depth, root_path_only)
+
+        _color_progress = Color["PROGRESS_BAR"].value
+        # traverse the directories in os.walk order
+        _stack = [_p_root_abs]
+        while _stack:
+            _p = _stack.pop()
+            _dir_info = _dir_infos.get(_p)
+            if _dir_info is None:
+                continue
+            _level, _dirs, _files = _dir_info
+            _stack.extend([os.path.join(_p, _d) for _d in reversed(_dirs)])
+
+            if root_path_only and _p != p_root:
                 continue
-            _depth_sub_path = len(_cur_path.parts)
-            if max_path_depth is not None and (_depth_sub_path - _depth_root_path) > max_path_depth:
+            if max_path_depth is not None and _level > max_path_depth:
                 continue
-            # check for path is there are criteria
-            _passed = True
-            _p = str(_cur_path)
             if re_include_paths or re_exclude_paths:
-                _passed = Persistence._passes(_p, re_include_paths, re_exclude_paths, match_all)
-            if _passed is False:
-                continue
+                if Persistence._passes(_p, re_include_paths, re_exclude_paths, match_all) is False:
+                    continue
 
             paths_out.append(_p)
-            path_dict[_p] = []
+            _path_files = []
+            path_dict[_p] = _path_files
 
-            # skip file processing
             if paths_only:
                 continue
 
-            _file_params = {
-                "f_abs": None,
-                "path": _p,
-                "path_dict": path_dict,
-                "files_out": files_out,
-                "re_include_files": re_include_files,
-                "re_exclude_files": re_exclude_files,
-                "re_include_abspaths": re_include_abspaths,
-                "re_exclude_abspaths": re_exclude_abspaths,
-                "match_all": match_all,
-            }
+            if show_progress:
+                _p_rel = os.path.relpath(_p, p_root)
+                _s = f"[{Color['OUT_TITLE'].value}]  - ({str(len(_files)).zfill(3)}) [{Color['OUT_PATH'].value}].\\{_p_rel:<60}"
+                _files = track(_files, description=_s, style=_color_progress, refresh_per_second=2)
 
-            _p_rel = os.path.relpath(_p, p_root)
-            _s = f"[{Color['OUT_TITLE'].value}]  - ({str(len(_files)).zfill(3)}) [{Color['OUT_PATH'].value}].\{_p_rel:<60}"
-            _color_progress = Color["PROGRESS_BAR"].value
-            for _f in track(
-                _files,
-                description=_s,
-                style=_color_progress,
-                refresh_per_second=2,
-                disable=not show_progress,
-            ):
-                _file_params["f_abs"] = os.path.join(_p, _f)
-                _passed = Persistence._passes_filecheck(**_file_params)
-                if _passed is False:
-                    continue
+            for _f in _files:
+                if re_include_files or re_exclude_files:
+                    if Persistence._passes(_f, re_include_files, re_exclude_files, match_all) is False:
+                        continue
+                _f_abs = os.path.join(_p, _f)
+                if re_include_abspaths or re_exclude_abspaths:
+                    if Persistence._passes(_f_abs, re_include_abspaths, re_exclude_abspaths, match_all) is False:
+                        continue
+                _path_files.append(_f_abs)
+                files_out.append(_f_abs)
                 out += 1
 
         return out
@@ -396,10 +516,15 @@ class Persistence:
         max_num_dirs: int = None,
         paths_only: bool = False,
         add_empty_paths: bool = True,
+        engine: Literal["walk", "scandir"] = "walk",
+        max_workers: int = None,
     ) -> list | dict:
         """finds files and paths according to path names / a slightly slimmer version than the FileAnalyzer
         regex can be used (differewntly for filename only, path only or abs path)
         match all or anxy determines whethwer all or any crieteria need to match
+        engine "walk" uses os.walk, engine "scandir" reads directories in parallel using os.scandir
+        in a thread pool of max_workers threads (default as in ThreadPoolExecutor). Both return the same
+        results, if max_num_files or max_num_dirs is set, os.walk is used in any case
         """
         _num_total = 0
 
@@ -446,7 +571,11 @@ class Persistence:
             }
 
             # do the analysis
-            _num_files = Persistence._walk_paths(**_params)
+            if engine == "scandir":
+                _params["max_workers"] = max_workers
+                _num_files = Persistence._scandir_paths(**_params)
+            else:
+                _num_files = Persistence._walk_paths(**_params)
             _num_total += _num_files
             logger.debug(f"[Persistence] Found [{_num_files}] in Path [{_root_path}]")
 
@@ -474,6 +603,186 @@ class Persistence:
             elif files:
                 return _files_out
 
+    @staticmethod
+    def _get_find_params(find_filter: dict) -> dict:
+        """returns the find params of a filter, completed by the default values of method find"""
+        out = {
+            _param: _info.default
+            for _param, _info in inspect.signature(Persistence.find).parameters.items()
+            if _info.default is not inspect.Parameter.empty
+        }
+        _unknown = [_param for _param in find_filter.keys() if _param not in out]
+        if len(_unknown) > 0:
+            logger.warning(f"[Persistence] Unknown find params {_unknown}, will be ignored")
+        out.update({_param: _value for _param, _value in find_filter.items() if _param in out})
+        if isinstance(out["p_root_paths"], str):
+            out["p_root_paths"] = out["p_root_paths"].split(",")
+        if out["p_root_paths"] is None:
+            out["p_root_paths"] = []
+        for _param in ["abspaths", "files", "paths"]:
+            out[f"re_include_{_param}"] = Persistence._re_list(out[f"include_{_param}"], out["ignore_case"])
+            out[f"re_exclude_{_param}"] = Persistence._re_list(out[f"exclude_{_param}"], out["ignore_case"])
+        return out
+
+    @staticmethod
+    def _walk_paths_multi(p_root: str, find_params: dict, outputs: dict = None, show_progress: bool = False) -> dict:
+        """walks a root directory once and evaluates all find params (key > params) for each directory.
+        Subdirectories are only read if any of the filters needs them. Results are appended to
+        outputs (key > (path_dict,paths_out,files_out), new ones if not supplied), show_progress
+        renders a progress bar per directory. returns the results as dict
+        key > (path_dict,paths_out,files_out,number of files)
+        """
+        out = {}
+        if outputs is None:
+            outputs = {}
+        _depth_root_path = len(Path(os.path.abspath(p_root)).parts)
+        # state per filter: [params, path_dict, paths_out, files_out, num_dirs, num_files, num_found]
+        _states = {}
+        _prune_depth = 0
+        for _key, _params in find_params.items():
+            _path_dict, _paths_out, _files_out = outputs.get(_key, ({}, [], []))
+            _states[_key] = [_params, _path_dict, _paths_out, _files_out, 0, 0, 0]
+            _depth = 0 if _params["root_path_only"] else _params["max_path_depth"]
+            # file / dir limits depend on all directories being read
+            if _params["max_num_files"] is not None or _params["max_num_dirs"] is not None:
+                _depth = None
+            if _depth is None or _prune_depth is None:
+                _prune_depth = None
+            else:
+                _prune_depth = max(_prune_depth, _depth)
+        _active = list(_states.keys())
+        _color_progress = Color["PROGRESS_BAR"].value
+
+        for _subpath, _dirs, _files in os.walk(p_root):
+            _cur_path = Path(_subpath).absolute()
+            _p = str(_cur_path)
+            _depth = len(_cur_path.parts) - _depth_root_path
+            for _key in _active.copy():
+                _state = _states[_key]
+                _params = _state[0]
+                _state[4] += 1
+                if _params["max_num_dirs"] is not None and _state[4] > _params["max_num_dirs"]:
+                    logger.info(f"[Persistence] Read more than [{_state[4]}] dirs, will end here")
+                    _active.remove(_key)
+                    continue
+                _state[5] += len(_files)
+                if _params["max_num_files"] is not None and _state[5] > _params["max_num_files"]:
+                    logger.info(f"[Persistence] Read more than [{_state[5]}] files, will end here")
+                    _active.remove(_key)
+                    continue
+                if _params["root_path_only"] and _p != p_root:
+                    continue
+                if _params["max_path_depth"] is not None and _depth > _params["max_path_depth"]:
+                    continue
+                _re_include_paths = _params["re_include_paths"]
+                _re_exclude_paths = _params["re_exclude_paths"]
+                if _re_include_paths or _re_exclude_paths:
+                    if Persistence._passes(_p, _re_include_paths, _re_exclude_paths, _params["match_all"]) is False:
+                        continue
+                _state[2].append(_p)
+                _state[1][_p] = []
+                if _params["paths_only"]:
+                    continue
+                _file_params = {
+                    "f_abs": None,
+                    "path": _p,
+                    "path_dict": _state[1],
+                    "files_out": _state[3],
+                    "re_include_files": _params["re_include_files"],
+                    "re_exclude_files": _params["re_exclude_files"],
+                    "re_include_abspaths": _params["re_include_abspaths"],
+                    "re_exclude_abspaths": _params["re_exclude_abspaths"],
+                    "match_all": _params["match_all"],
+                }
+                _files_progress = _files
+                if show_progress:
+                    _p_rel = os.path.relpath(_p, p_root)
+                    _s = f"[{Color['OUT_TITLE'].value}]  - ({str(len(_files)).zfill(3)}) [{Color['OUT_PATH'].value}].\\{_p_rel:<60}"
+                    _files_progress = track(_files, description=_s, style=_color_progress, refresh_per_second=2)
+                for _f in _files_progress:
+                    _file_params["f_abs"] = os.path.join(_p, _f)
+                    if Persistence._passes_filecheck(**_file_params) is False:
+                        continue
+                    _state[6] += 1
+            if len(_active) == 0:
+                break
+            # don't descend into directories no filter will evaluate
+            if _prune_depth is not None and _depth >= _prune_depth:
+                _dirs.clear()
+
+        for _key, _state in _states.items():
+            out[_key] = (_state[1], _state[2], _state[3], _state[6])
+        return out
+
+    @staticmethod
+    def find_multi(find_filters: dict) -> dict:
+        """finds files and paths for multiple filters (key > dict of params of method find) in one pass:
+        each root path is only walked once and every directory is evaluated by all filters using it.
+        returns a dict key > result, with each result being the same as calling find with the filter params
+        (engine and max_workers are ignored, progress is only shown per root path)
+        """
+        out = {}
+        _find_params = {_key: Persistence._get_find_params(_filter) for _key, _filter in find_filters.items()}
+        # root path > filter keys, in order of appearance
+        _root_keys = {}
+        for _key, _params in _find_params.items():
+            for _root_path in _params["p_root_paths"]:
+                _keys = _root_keys.setdefault(_root_path, [])
+                if _key not in _keys:
+                    _keys.append(_key)
+
+        # (root,key) > walk results
+        _results = {}
+        for _root_path, _keys in _root_keys.items():
+            logger.debug(f"[Persistence] Checking files and paths for [{_root_path}], filters {_keys}")
+            if not os.path.isdir(_root_path):
+                logger.warning(f"[Persistence] Path [{_root_path}] doesn't exist")
+                continue
+            if any([_find_params[_key]["show_progress"] for _key in _keys]):
+                rprint(f"[{Color['OUT_TITLE']}]### Path  [{Color['OUT_PATH']}][{_root_path}]")
+            _walked = Persistence._walk_paths_multi(_root_path, {_key: _find_params[_key] for _key in _keys})
+            for _key, _result in _walked.items():
+                _results[(_root_path, _key)] = _result
+
+        # assemble the results in the order of the root paths of each filter
+        for _key, _params in _find_params.items():
+            _path_dict = {}
+            _paths_out = []
+            _files_out = []
+            _num_total = 0
+            for _root_path in _params["p_root_paths"]:
+                _result = _results.get((_root_path, _key))
+                if _result is None:
+                    continue
+                _path_dict.update(_result[0])
+                _paths_out.extend(_result[1])
+                _files_out.extend(_result[2])
+                _num_total += _result[3]
+                logger.debug(f"[Persistence] Found [{_result[3]}] in Path [{_root_path}]")
+
+            if _params["show_progress"]:
+                rprint(
+                    f"[{Color.OUT_TITLE.value}]### ({str(_num_total).zfill(3)}) Files found in [{Color.OUT_PATH.value}]{_params['p_root_paths']}"
+                )
+
+            if _params["as_dict"]:
+                out[_key] = {
+                    _path: _file_list
+                    for _path, _file_list in _path_dict.items()
+                    if not (
+                        _params["paths_only"] is False and len(_file_list) == 0 and _params["add_empty_paths"] is False
+                    )
+                }
+            elif _params["paths"] and _params["files"]:
+                out[_key] = (_paths_out, _files_out)
+            elif _params["paths"]:
+                out[_key] = _paths_out
+            elif _params["files"]:
+                out[_key] = _files_out
+            else:
+                out[_key] = None
+        return out
+
     @staticmethod
     def absolute_winpath(f: str, posix: bool = False, uri: bool = False, as_path: bool = False) -> bool:
         """gets absolute path in a given representation also does an existence check"""
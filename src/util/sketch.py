@@ -0,0 +1,275 @@
+"""Constant memory streaming sketches: quantiles (KLL), histograms and distinct counts (HyperLogLog)"""
+
+import logging
+import math
+import random
+import sys
+from hashlib import blake2b
+
+from cli.bootstrap_env import CLI_LOG_LEVEL
+
+logger = logging.getLogger(__name__)
+# get log level from environment if given
+logger.setLevel(CLI_LOG_LEVEL)
+
+# default quantiles returned in stats
+QUANTILES = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+# keys of the sketch stats
+NUM = "num"
+DISTINCT = "distinct"
+QUANTILE = "quantiles"
+HISTOGRAM = "histogram"
+
+
+class QuantileSketch:
+    """KLL quantile sketch (Karnin, Lang, Liberty), keeps O(k) items of a stream,
+    with k=200 the rank error is typically below 1%
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0) -> None:
+        """constructor"""
+        self._k: int = k
+        self._c: float = 2 / 3
+        self._compactors: list = [[]]
+        self._size: int = 0
+        self._max_size: int = 0
+        self._num: int = 0
+        self._random = random.Random(seed)
+        self._update_max_size()
+
+    @property
+    def num(self) -> int:
+        """number of values added"""
+        return self._num
+
+    def _capacity(self, height: int) -> int:
+        """capacity of the compactor at height, lower compactors are smaller"""
+        _depth = len(self._compactors) - height - 1
+        return int(math.ceil(self._k * self._c**_depth)) + 1
+
+    def _update_max_size(self) -> None:
+        """max number of items for the current number of compactors"""
+        self._max_size = sum([self._capacity(_height) for _height in range(len(self._compactors))])
+
+    def _compress(self) -> None:
+        """compacts the first full compactor: half of its sorted items is promoted with double weight"""
+        for _height, _compactor in enumerate(self._compactors):
+            if len(_compactor) < self._capacity(_height):
+                continue
+            if _height + 1 == len(self._compactors):
+                self._compactors.append([])
+                self._update_max_size()
+            _compactor.sort()
+            # odd number of items: the smallest item stays
+            _num_keep = len(_compactor) % 2
+            _offset = self._random.randint(0, 1)
+            self._compactors[_height + 1].extend(_compactor[_num_keep + _offset :: 2])
+            self._compactors[_height] = _compactor[:_num_keep]
+            self._size = sum([len(_c) for _c in self._compactors])
+            if self._size < self._max_size:
+                break
+
+    def add(self, value: float) -> None:
+        """adds a value"""
+        self._compactors[0].append(value)
+        self._size += 1
+        self._num += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def _weighted_items(self) -> list:
+        """returns sorted list of (value, weight)"""
+        _items = []
+        for _height, _compactor in enumerate(self._compactors):
+            _weight = 2**_height
+            _items.extend([(_value, _weight) for _value in _compactor])
+        _items.sort(key=lambda _item: _item[0])
+        return _items
+
+    def quantiles(self, quantiles: list = None) -> dict:
+        """returns approximated values for a list of quantiles (0..1) as dict {quantile: value}"""
+        if quantiles is None:
+            quantiles = QUANTILES
+        out = {}
+        _items = self._weighted_items()
+        if len(_items) == 0:
+            return {_q: None for _q in quantiles}
+        _total = sum([_weight for _, _weight in _items])
+        for _q in quantiles:
+            _rank = _q * _total
+            _cumulated = 0
+            _value = _items[-1][0]
+            for _item_value, _weight in _items:
+                _cumulated += _weight
+                if _cumulated >= _rank:
+                    _value = _item_value
+                    break
+            out[_q] = _value
+        return out
+
+    def quantile(self, quantile: float) -> float | None:
+        """returns approximated value for a quantile (0..1)"""
+        return self.quantiles([quantile])[quantile]
+
+
+class Histogram:
+    """histogram with a fixed number of bins. Bins have a width of a power of 2 and are aligned to 0,
+    if a value doesn't fit into the bins, bin width is doubled and neighbouring bins are merged
+    """
+
+    def __init__(self, num_bins: int = 32) -> None:
+        """constructor"""
+        self._num_bins: int = num_bins
+        self._width: float = None
+        # bin index (value // width) > count
+        self._counts: dict = {}
+        self._num: int = 0
+
+    @property
+    def num(self) -> int:
+        """number of values added"""
+        return self._num
+
+    def _merge_bins(self) -> None:
+        """doubles the bin width"""
+        _counts = {}
+        for _idx, _count in self._counts.items():
+            _counts[_idx // 2] = _counts.get(_idx // 2, 0) + _count
+        self._counts = _counts
+        self._width *= 2
+
+    def add(self, value: float) -> None:
+        """adds a value, infinite values, NaN and values out of float range are ignored"""
+        try:
+            value = float(value)
+        except OverflowError:
+            logger.debug("[Histogram] Value out of float range, skipped")
+            return
+        if not math.isfinite(value):
+            return
+        if self._width is None:
+            # initial resolution relative to the first value
+            _exponent = math.frexp(value)[1] if value != 0 else 0
+            self._width = 2.0 ** (_exponent - 10)
+        _idx = math.floor(value / self._width)
+        if len(self._counts) > 0:
+            _low = min(min(self._counts.keys()), _idx)
+            _high = max(max(self._counts.keys()), _idx)
+            while _high - _low >= self._num_bins:
+                self._merge_bins()
+                _low //= 2
+                _high //= 2
+            _idx = math.floor(value / self._width)
+        self._counts[_idx] = self._counts.get(_idx, 0) + 1
+        self._num += 1
+
+    def bins(self) -> list:
+        """returns list of bins (lower bound, upper bound, count) from lowest to highest value"""
+        if len(self._counts) == 0:
+            return []
+        _low = min(self._counts.keys())
+        _high = max(self._counts.keys())
+        return [
+            (_idx * self._width, (_idx + 1) * self._width, self._counts.get(_idx, 0)) for _idx in range(_low, _high + 1)
+        ]
+
+
+class HyperLogLog:
+    """HyperLogLog distinct count, uses 2**precision registers (standard error 1.04/sqrt(2**precision))"""
+
+    def __init__(self, precision: int = 12) -> None:
+        """constructor"""
+        self._precision: int = precision
+        self._num_registers: int = 2**precision
+        self._registers = bytearray(self._num_registers)
+        self._alpha: float = 0.7213 / (1 + 1.079 / self._num_registers)
+
+    @staticmethod
+    def _hash(value: object) -> int:
+        """returns a stable 64 bit hash of a value"""
+        return int.from_bytes(blake2b(repr(value).encode("utf-8"), digest_size=8).digest(), "big")
+
+    def add(self, value: object) -> None:
+        """adds a value"""
+        _hash = HyperLogLog._hash(value)
+        _bits = 64 - self._precision
+        _idx = _hash >> _bits
+        _rank = _bits - (_hash & ((1 << _bits) - 1)).bit_length() + 1
+        if _rank > self._registers[_idx]:
+            self._registers[_idx] = _rank
+
+    @property
+    def distinct(self) -> int:
+        """estimated number of distinct values"""
+        _estimate = self._alpha * self._num_registers**2 / sum([2.0**-_register for _register in self._registers])
+        # small range correction (linear counting)
+        if _estimate <= 2.5 * self._num_registers:
+            _num_zero = self._registers.count(0)
+            if _num_zero > 0:
+                _estimate = self._num_registers * math.log(self._num_registers / _num_zero)
+        return int(round(_estimate))
+
+
+class FieldSketch:
+    """sketches of a single field: quantiles and histogram of numbers and distinct count of all values"""
+
+    def __init__(self, k: int = 200, num_bins: int = 32, precision: int = 12) -> None:
+        """constructor"""
+        self._quantiles = QuantileSketch(k)
+        self._histogram = Histogram(num_bins)
+        self._hll = HyperLogLog(precision)
+        self._num: int = 0
+
+    def add(self, value: object) -> None:
+        """adds a value, None is skipped"""
+        if value is None:
+            return
+        self._num += 1
+        try:
+            self._hll.add(value)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"[FieldSketch] Couldn't hash value [{value}], {e}")
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            self._quantiles.add(value)
+            self._histogram.add(value)
+
+    @property
+    def quantile_sketch(self) -> QuantileSketch:
+        """quantile sketch"""
+        return self._quantiles
+
+    @property
+    def histogram(self) -> Histogram:
+        """histogram"""
+        return self._histogram
+
+    @property
+    def distinct(self) -> int:
+        """estimated number of distinct values"""
+        return self._hll.distinct
+
+    def quantile(self, quantile: float) -> float | None:
+        """returns approximated value for a quantile (0..1)"""
+        return self._quantiles.quantile(quantile)
+
+    def get_stats(self, quantiles: list = None) -> dict:
+        """returns the sketch stats as dict"""
+        return {
+            NUM: self._num,
+            DISTINCT: self.distinct,
+            QUANTILE: self._quantiles.quantiles(quantiles),
+            HISTOGRAM: self._histogram.bins(),
+        }
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        format="%(asctime)s %(levelname)s %(module)s:[%(name)s.%(funcName)s(%(lineno)d)]: %(message)s",
+        level=CLI_LOG_LEVEL,
+        stream=sys.stdout,
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    _sketch = FieldSketch()
+    for _i in range(100000):
+        _sketch.add(_i % 1000)
+    print(_sketch.get_stats())
@@ -30,16 +30,26 @@ RULEDICT = C.RULEDICT
 APPLY_ANY = C.APPLY_ANY
 APPLY_ALL = C.APPLY_ALL
 
+# regex patterns using back references or conditional group references can't be merged into a
+# combined regex (group numbers are shifted by the groups of the preceding patterns)
+REGEX_BACKREFERENCE = re.compile(r"\\\d|\(\?P=|\(\?\(")
+
 
 class StringMatcher:
     """bundling sets of rules to perform rule matching on strings"""
 
-    def __init__(self, rules: list = None, apply_default: str = APPLY_ALL) -> None:
+    def __init__(self, rules: list = None, apply_default: str = APPLY_ALL, compiled: bool = False) -> None:
+        """constructor, compiled: use the compiled matching mode in find_all
+        (regex rules merged into one combined regex, one pass per string to check for hits)
+        """
         self._rules = {}
         # 'all' rules that need match
         self._all_rules = []
         # apply all or any rules
         self._apply_default = apply_default
+        self._compiled = compiled
+        # compiled match plan, will be created on demand
+        self._match_plan = None
         self.add_rules(rules)
 
     def add_rules(self, rules: list) -> None:
@@ -59,6 +69,7 @@ class StringMatcher:
     def clear(self) -> None:
         """reset list of rules"""
         self._rules = {}
+        self._match_plan = None
 
     def _add_all_rules(self):
         """updates the all rules list"""
@@ -105,6 +116,7 @@ class StringMatcher:
             )
 
         self._add_all_rules()
+        self._match_plan = None
 
     def find(self, s: str, rule: str) -> list:
         """looks for string using rule, returns found string as list"""
@@ -191,6 +203,96 @@ class StringMatcher:
 
         return result_set
 
+    @staticmethod
+    def _combine_regex(regexes: list) -> re.Pattern | None:
+        """merges compiled regexes into one alternation (flags are kept as scoped inline flags)
+        returns None if the patterns can't be combined
+        """
+        if len(regexes) == 0:
+            return None
+        _patterns = []
+        for _regex in regexes:
+            _flags = "i" if _regex.flags & re.IGNORECASE else ""
+            _patterns.append(f"(?{_flags}:{_regex.pattern})" if _flags else f"(?:{_regex.pattern})")
+        try:
+            return re.compile("|".join(_patterns))
+        except re.error as e:
+            logger.debug(f"[StringMatcher] Couldn't combine regex rules, will evaluate them one by one ({e})")
+            return None
+
+    def compile(self) -> tuple:
+        """creates the match plan for the compiled matching mode:
+        a flat list of tuples (rule name, apply, regex, literal, ignorecase, include, prefilter)
+        where prefilter is the key of the combined regex (include / exclude) the rule is part of
+        returns a tuple (match plan, combined regexes by include flag)
+        """
+        _plan = []
+        _combinable = {True: [], False: []}
+        for _rule_name, _rule_dict in self._rules.items():
+            _apply = _rule_dict.get(C.RULE_APPLY, self._apply_default)
+            _regex = _rule_dict.get(RULE_REGEX)
+            _include = _rule_dict.get(C.RULE_INCLUDE, True) is True
+            _prefilter = None
+            if _regex is not None and not REGEX_BACKREFERENCE.search(_regex.pattern):
+                _combinable[_include].append(_regex)
+                _prefilter = _include
+            _plan.append(
+                [
+                    _rule_name,
+                    _apply,
+                    _regex,
+                    _rule_dict.get(RULE_RULE),
+                    _rule_dict.get(RULE_IGNORECASE),
+                    _include,
+                    _prefilter,
+                ]
+            )
+        _combined = {_include: StringMatcher._combine_regex(_regexes) for _include, _regexes in _combinable.items()}
+        # rules that can't be combined will be evaluated one by one
+        for _plan_item in _plan:
+            if _plan_item[6] is not None and _combined[_plan_item[6]] is None:
+                _plan_item[6] = None
+        self._match_plan = ([tuple(_plan_item) for _plan_item in _plan], _combined)
+        logger.debug(f"[StringMatcher] Compiled [{len(_plan)}] rules, combined regex {_combined}")
+        return self._match_plan
+
+    def _find_all_compiled(self, s: str) -> dict:
+        """returns matches by rule using the match plan, the string is scanned once by each of the
+        combined regexes, the single rule regexes are only applied if the combined regex has hits
+        """
+        if self._match_plan is None:
+            self.compile()
+        _plan, _combined = self._match_plan
+        _found_results = {}
+        # check for any hits of all combined regex rules in one pass
+        _hits = {
+            _include: _regex is not None and _regex.search(s) is not None for _include, _regex in _combined.items()
+        }
+        _s_lower = None
+        for _rule_name, _apply, _regex, _literal, _ignorecase, _include, _prefilter in _plan:
+            if _regex is None:
+                if _ignorecase:
+                    if _s_lower is None:
+                        _s_lower = s.lower()
+                    _found = _literal in _s_lower
+                else:
+                    _found = _literal in s
+                if _found is not _include:
+                    continue
+                _results = [_literal]
+            elif _include is True:
+                if _prefilter is not None and not _hits[_prefilter]:
+                    continue
+                _results = _regex.findall(s)
+                if len(_results) == 0:
+                    continue
+            else:
+                if (_prefilter is None or _hits[_prefilter]) and _regex.search(s) is not None:
+                    continue
+                _results = [s]
+            _found_results[_rule_name] = {C.RULE_RESULTS: _results, C.RULE_APPLY: _apply}
+        return _found_results
+
     def find_all(self, s: str, by_rule: bool = True, filter_result_set: bool = True) -> dict | list:
         """returns matches.
         returns found results as dict by rule
@@ -201,15 +303,19 @@ class StringMatcher:
         _found_results = {}
         _rules = []
         _rule_names = self._rules.keys()
-        logger.debug(f"[StringMatcher] Find in [{s}] using rules {_rule_names}")
-
-        for _rule_name in _rule_names:
-            # get the apply mode from rules or from default
-            _apply = self._rules.get(_rule_name, {}).get(C.RULE_APPLY, self._apply_default)
-            _results = self.find(s, _rule_name)
-            _rules.append(_rule_name)
-            if len(_results) > 0:
-                _found_results[_rule_name] = {C.RULE_RESULTS: _results, C.RULE_APPLY: _apply}
+
+        if self._compiled:
+            _found_results = self._find_all_compiled(s)
+            _rules = list(_rule_names)
+        else:
+            logger.debug(f"[StringMatcher] Find in [{s}] using rules {_rule_names}")
+            for _rule_name in _rule_names:
+                # get the apply mode from rules or from default
+                _apply = self._rules.get(_rule_name, {}).get(C.RULE_APPLY, self._apply_default)
+                _results = self.find(s, _rule_name)
+                _rules.append(_rule_name)
+                if len(_results) > 0:
+                    _found_results[_rule_name] = {C.RULE_RESULTS: _results, C.RULE_APPLY: _apply}
 
         if filter_result_set:
             self._filter_result_set(_found_results)
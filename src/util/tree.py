@@ -4,7 +4,7 @@ import json
 import logging
 import sys
 from functools import wraps
-from typing import Dict
+from typing import Callable, Dict
 
 from model.model_tree import NAME, PARENT_ID, TreeNodeModel
 from cli.bootstrap_env import CLI_LOG_LEVEL
@@ -20,6 +20,12 @@ logger = logging.getLogger(__name__)
 # get log level from environment if given
 logger.setLevel(CLI_LOG_LEVEL)
 
+# keys of aggregated values
+AGG_COUNT = "count"
+AGG_SUM = "sum"
+AGG_MIN = "min"
+AGG_MAX = "max"
+
 
 def valid_node_id(func):
     """decorator / annotation to verify a valid node id was passed and returns None otherwise"""
@@ -27,7 +33,7 @@ def valid_node_id(func):
     @wraps(func)
     def func_wrapper(self, node_id: object, *args, **kwargs):
         # check if valid key was passed, if not, skip function execution
-        if not self._hierarchy_nodes_dict.get(node_id):
+        if not self._has_node_id(node_id):
             logger.info(f"[Tree] valid_node_id decorator: node_id [{node_id}] not found")
             return None
         # there is a key, execute function
@@ -53,12 +59,38 @@ class Tree:
         self._analyze_fields: bool = False
         self._cell_type_analyzer: CellTypeAnalyzer = CellTypeAnalyzer()
         self._cell_type_analyzer.is_active = self._analyze_fields
+        # cached derived views, valid for the current version of the tree
+        self._version: int = 0
+        # views depending on filters
+        self._cache: dict = {}
+        # views of the tree structure (filters are not applied)
+        self._structure_cache: dict = {}
+
+    @property
+    def version(self) -> int:
+        """version of the tree, is increased whenever the tree or its filter changes"""
+        return self._version
+
+    def invalidate(self, structure: bool = True) -> None:
+        """invalidates the cached views, needs to be called whenever the tree or its filter changes
+        structure: the tree structure changed, if False (filter changes) structural views are kept
+        """
+        self._version += 1
+        self._cache = {}
+        if structure:
+            self._structure_cache = {}
 
     @property
     def hierarchy(self) -> Dict[object, TreeNodeModel]:
-        """tree hierarchy"""
-        # only return items that are not filtered
-        return {_node_id: _node for _node_id, _node in self._hierarchy_nodes_dict.items() if self.is_node(_node_id)}
+        """tree hierarchy (cached, don't modify the returned dict)"""
+        _hierarchy = self._cache.get("hierarchy")
+        if _hierarchy is None:
+            # only return items that are not filtered
+            _hierarchy = {
+                _node_id: _node for _node_id, _node in self._hierarchy_nodes_dict.items() if self.is_node(_node_id)
+            }
+            self._cache["hierarchy"] = _hierarchy
+        return _hierarchy
 
     @property
     def max_level(self):
@@ -70,8 +102,46 @@ class Tree:
         """root node id"""
         return self._root
 
-    def _create_node(self, node_info: dict, key: object) -> TreeNodeModel:
-        """creates a tree node from input dict"""
+    def _has_node_id(self, node_id: object) -> bool:
+        """checks whether the node id is part of the tree, used to validate node ids"""
+        return self._hierarchy_nodes_dict.get(node_id) is not None
+
+    def _get_child_ids(self, node_id: object) -> list:
+        """returns the ids of the direct children regardless of any filter"""
+        return self._hierarchy_nodes_dict[node_id].children
+
+    def _get_parent_and_obj(self, node_id: object) -> tuple:
+        """returns the tuple (parent id, object) of a node regardless of any filter"""
+        _node = self._hierarchy_nodes_dict[node_id]
+        return (_node.parent_id, _node.obj)
+
+    def _get_intervals(self) -> tuple:
+        """returns the (cached) dfs interval index as tuple (intervals, preorder):
+        intervals is a dict {node_id: (entry, exit)} of positions in the preorder list of node ids,
+        the subtree of a node are the ids preorder[entry:exit] (filters are not applied)
+        """
+        _intervals = self._structure_cache.get("intervals")
+        if _intervals is not None:
+            return _intervals
+        _entry_exit = {}
+        _preorder = []
+        if self._root is not None and self._has_node_id(self._root):
+            # entries with None as entry position are visited, otherwise the subtree is complete
+            _stack = [(self._root, None)]
+            while _stack:
+                _node_id, _entry = _stack.pop()
+                if _entry is not None:
+                    _entry_exit[_node_id] = (_entry, len(_preorder))
+                    continue
+                _stack.append((_node_id, len(_preorder)))
+                _preorder.append(_node_id)
+                _stack.extend([(_child_id, None) for _child_id in reversed(self._get_child_ids(_node_id))])
+        _intervals = (_entry_exit, _preorder)
+        self._structure_cache["intervals"] = _intervals
+        return _intervals
+
+    def _get_node_info(self, node_info: dict, key: object) -> tuple | None:
+        """gets the tuple (name, parent id, object type) from input dict or object"""
         if node_info is None:
             logger.warning(f"[Tree] Passed Input Dictionary has no key [{key}]")
             return
@@ -92,6 +162,14 @@ class Tree:
                 return
             if hasattr(node_info, self._name_field):
                 _name = getattr(node_info, self._name_field)
+        return (_name, _parent_id, _type)
+
+    def _create_node(self, node_info: dict, key: object) -> TreeNodeModel:
+        """creates a tree node from input dict"""
+        _node_info = self._get_node_info(node_info, key)
+        if _node_info is None:
+            return
+        _name, _parent_id, _type = _node_info
         self._num_nodes += 1
         return TreeNodeModel(id=key, parent_id=_parent_id, name=_name, obj=node_info, obj_type=_type)
 
@@ -100,6 +178,7 @@ class Tree:
     ) -> None:
         """creates the tree hierarchy / also calculate min max values"""
         self._hierarchy_nodes_dict = {}
+        self.invalidate()
         logger.debug("[Tree] Create Tree")
         _root_node = None
 
@@ -113,10 +192,10 @@ class Tree:
         if parent_field is not None:
             self._parent_field = parent_field
 
-        for _node_id, _node_info in nodes_dict.items():
-            # calculate min and max values for numerical values
-            self._cell_type_analyzer.analyze(obj=_node_info, objkey=_node_id)
+        # calculate min and max values for numerical values
+        self._cell_type_analyzer.analyze_batch(nodes_dict)
 
+        for _node_id, _node_info in nodes_dict.items():
             # it was created before as parent node
             _node_obj = self._hierarchy_nodes_dict.get(_node_id)
             if not _node_obj:
@@ -145,6 +224,7 @@ class Tree:
 
             _parent_node.children.append(_node_id)
 
+        self.invalidate()
         if _root_node is not None:
             self._root = _root_node
         else:
@@ -205,6 +285,10 @@ class Tree:
         also may check if children exist
         """
         logger.debug("[Tree] Get Children Nodes")
+        _cache_key = ("all_children", node_id, only_leaves)
+        children_nodes = self._cache.get(_cache_key)
+        if children_nodes is not None:
+            return list(children_nodes)
         children_nodes = []
         _parent_node = self.get_node(node_id)
         if _parent_node is None:
@@ -233,8 +317,41 @@ class Tree:
 
         # if classs is subclassed and nodes are filtered filter them
         children_nodes = [_c for _c in children_nodes if self.is_node(_c)]
+        self._cache[_cache_key] = children_nodes
 
-        return children_nodes
+        return list(children_nodes)
+
+    @valid_node_id
+    def get_subtree(self, node_id: object, only_leaves: bool = False) -> list:
+        """gets all children nodes below node in depth first order (option to select only leaves)"""
+        _intervals, _preorder = self._get_intervals()
+        _interval = _intervals.get(node_id)
+        if _interval is None:
+            return []
+        _entry, _exit = _interval
+        children_nodes = _preorder[_entry + 1 : _exit]
+        if only_leaves:
+            children_nodes = [_c for _c in children_nodes if self.is_leaf(_c)]
+        # if classs is subclassed and nodes are filtered filter them
+        return [_c for _c in children_nodes if self.is_node(_c)]
+
+    @valid_node_id
+    def get_subtree_size(self, node_id: object) -> int:
+        """returns the number of all nodes below node (filters are not applied)"""
+        _interval = self._get_intervals()[0].get(node_id)
+        if _interval is None:
+            return 0
+        return _interval[1] - _interval[0] - 1
+
+    @valid_node_id
+    def is_descendant(self, node_id: object, ancestor_id: object) -> bool:
+        """checks whether node is below the ancestor node (filters are not applied)"""
+        _intervals = self._get_intervals()[0]
+        _interval = _intervals.get(node_id)
+        _ancestor_interval = _intervals.get(ancestor_id)
+        if _interval is None or _ancestor_interval is None:
+            return False
+        return _ancestor_interval[0] < _interval[0] < _ancestor_interval[1]
 
     @valid_node_id
     def has_children(self, node_id: object) -> bool:
@@ -350,6 +467,9 @@ class Tree:
 
     def get_leaves(self) -> list:
         """returns the leaves of the tree"""
+        leaves = self._cache.get("leaves")
+        if leaves is not None:
+            return list(leaves)
         leaves = []
         for _node_id in self._hierarchy_nodes_dict.keys():
             _node = self.get_node(_node_id)
@@ -357,10 +477,15 @@ class Tree:
                 continue
             if len(_node.children) == 0:
                 leaves.append(_node_id)
-        return leaves
+        self._cache["leaves"] = leaves
+        return list(leaves)
 
     def get_leaf_siblings(self, only_leaves: bool = True) -> dict:
         """gets sibling leaves alongside with parent node path"""
+        _cache_key = ("leaf_siblings", only_leaves)
+        leaf_siblings = self._cache.get(_cache_key)
+        if leaf_siblings is not None:
+            return list(leaf_siblings)
         _leaves = self.get_leaves()
         leaf_siblings = []
         # processed list
@@ -374,8 +499,82 @@ class Tree:
                 _processed[sibling] = True
             _predecessors = self.get_predecessors(_leaf)
             leaf_siblings.append([_siblings, _predecessors])
+        self._cache[_cache_key] = leaf_siblings
+
+        return list(leaf_siblings)
+
+    def aggregate(self, fields: list | str, node_filter: Callable[[object, object], bool] = None) -> Dict[object, dict]:
+        """aggregates field values of the node objects bottom up in a single pass over the tree,
+        returns dict {node_id: {field: {count, sum, min, max}}} with the values of the node and all nodes below.
+        node_filter(node_id,obj) can be used to select the nodes whose values are counted,
+        sum is only calculated for numbers (filters of the tree are not applied)
+        """
+        if isinstance(fields, str):
+            fields = [fields]
+        out = {}
+
+        def _get_aggregates(node_id: object) -> dict:
+            _aggregates = out.get(node_id)
+            if _aggregates is None:
+                _aggregates = {_field: {AGG_COUNT: 0, AGG_SUM: 0, AGG_MIN: None, AGG_MAX: None} for _field in fields}
+                out[node_id] = _aggregates
+            return _aggregates
+
+        _preorder = self._get_intervals()[1]
+        # reversed preorder: all nodes below a node are processed before the node itself
+        for _node_id in reversed(_preorder):
+            _parent_id, _obj = self._get_parent_and_obj(_node_id)
+            _node_aggregates = _get_aggregates(_node_id)
+            if node_filter is None or node_filter(_node_id, _obj):
+                for _field in fields:
+                    if isinstance(_obj, dict):
+                        _value = _obj.get(_field)
+                    else:
+                        _value = getattr(_obj, _field, None)
+                    if _value is None:
+                        continue
+                    _aggregates = _node_aggregates[_field]
+                    _aggregates[AGG_COUNT] += 1
+                    if isinstance(_value, (int, float)) and _aggregates[AGG_SUM] is not None:
+                        _aggregates[AGG_SUM] += _value
+                    else:
+                        _aggregates[AGG_SUM] = None
+                    Tree._update_min_max(_aggregates, _value, _value)
+            # root node
+            if _parent_id is None:
+                continue
+            # add to parent node
+            _parent_aggregates = _get_aggregates(_parent_id)
+            for _field in fields:
+                _aggregates = _node_aggregates[_field]
+                if _aggregates[AGG_COUNT] == 0:
+                    continue
+                _parent_field_aggregates = _parent_aggregates[_field]
+                _parent_field_aggregates[AGG_COUNT] += _aggregates[AGG_COUNT]
+                if _aggregates[AGG_SUM] is None or _parent_field_aggregates[AGG_SUM] is None:
+                    _parent_field_aggregates[AGG_SUM] = None
+                else:
+                    _parent_field_aggregates[AGG_SUM] += _aggregates[AGG_SUM]
+                Tree._update_min_max(_parent_field_aggregates, _aggregates[AGG_MIN], _aggregates[AGG_MAX])
+        return out
 
-        return leaf_siblings
+    @staticmethod
+    def _update_min_max(aggregates: dict, value_min: object, value_max: object) -> None:
+        """updates min and max of aggregates, values that can't be compared (None or
+        values of other types like str and numbers) are skipped
+        """
+        for _agg, _value, _is_lower in [(AGG_MIN, value_min, True), (AGG_MAX, value_max, False)]:
+            if _value is None:
+                continue
+            _current = aggregates[_agg]
+            if _current is None:
+                aggregates[_agg] = _value
+                continue
+            try:
+                if (_value < _current) if _is_lower else (_value > _current):
+                    aggregates[_agg] = _value
+            except TypeError:
+                logger.debug(f"[Tree] Skipping value [{_value}] for [{_agg}], can't be compared to [{_current}]")
 
     def get_nested_dict(self, add_leaf_values: bool = True) -> dict:
         """gets the keys of tree as nested dict without the value
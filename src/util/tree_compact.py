@@ -0,0 +1,314 @@
+"""Tree with a compact array based node store"""
+
+import logging
+import sys
+from array import array
+from typing import Dict
+
+from cli.bootstrap_env import CLI_LOG_LEVEL
+from model.model_tree import TreeNodeModel
+from util.tree import Tree, valid_node_id
+
+logger = logging.getLogger(__name__)
+# get log level from environment if given
+logger.setLevel(CLI_LOG_LEVEL)
+
+# index used for a missing parent / child / sibling
+NO_INDEX = -1
+
+
+class CompactTree(Tree):
+    """Tree storing the structure in arrays (parent index, first child / next sibling links,
+    levels and leaf flags) keyed by an integer index per node id. TreeNodeModel objects
+    are only created when a node is requested with get_node and buffered afterwards
+    """
+
+    def __init__(self) -> None:
+        """constructor"""
+        super().__init__()
+        # node id > index and index > node id
+        self._index: Dict[object, int] = {}
+        self._ids: list = []
+        # node names, parent ids and passed objects / object types
+        self._names: list = []
+        self._parent_ids: list = []
+        self._objs: list = []
+        self._obj_types: list = []
+        # structure
+        self._parent = array("q")
+        self._first_child = array("q")
+        self._last_child = array("q")
+        self._next_sibling = array("q")
+        self._level = array("q")
+        self._is_leaf = array("b")
+        # materialized nodes
+        self._hierarchy_nodes_dict = {}
+
+    def _clear(self) -> None:
+        """resets the node store"""
+        self._index = {}
+        self._ids = []
+        self._names = []
+        self._parent_ids = []
+        self._objs = []
+        self._obj_types = []
+        self._parent = array("q")
+        self._first_child = array("q")
+        self._last_child = array("q")
+        self._next_sibling = array("q")
+        self._level = array("q")
+        self._is_leaf = array("b")
+        self._hierarchy_nodes_dict = {}
+        self._num_nodes = 0
+
+    def _has_node_id(self, node_id: object) -> bool:
+        """checks whether the node id is part of the tree"""
+        return node_id in self._index
+
+    def _add_node(self, node_info: dict, key: object) -> int | None:
+        """adds a node to the arrays, returns the index of the node"""
+        _node_info = self._get_node_info(node_info, key)
+        if _node_info is None:
+            return None
+        _name, _parent_id, _type = _node_info
+        _idx = len(self._ids)
+        self._index[key] = _idx
+        self._ids.append(key)
+        self._names.append(_name)
+        self._parent_ids.append(_parent_id)
+        self._objs.append(node_info)
+        self._obj_types.append(_type)
+        self._parent.append(NO_INDEX)
+        self._first_child.append(NO_INDEX)
+        self._last_child.append(NO_INDEX)
+        self._next_sibling.append(NO_INDEX)
+        self._level.append(NO_INDEX)
+        self._is_leaf.append(1)
+        self._num_nodes += 1
+        return _idx
+
+    def _append_child(self, parent_idx: int, idx: int) -> None:
+        """links a child to its parent"""
+        self._parent[idx] = parent_idx
+        _last_child = self._last_child[parent_idx]
+        if _last_child == NO_INDEX:
+            self._first_child[parent_idx] = idx
+        else:
+            self._next_sibling[_last_child] = idx
+        self._last_child[parent_idx] = idx
+        self._is_leaf[parent_idx] = 0
+
+    def _get_child_ids(self, node_id: object) -> list:
+        """returns the ids of the direct children"""
+        return [self._ids[_c] for _c in self._iter_children(self._index[node_id])]
+
+    def _get_parent_and_obj(self, node_id: object) -> tuple:
+        """returns the tuple (parent id, object) of a node"""
+        _idx = self._index[node_id]
+        return (self._parent_ids[_idx], self._objs[_idx])
+
+    def _iter_children(self, idx: int):
+        """iterates over the child indices of a node"""
+        _child = self._first_child[idx]
+        while _child != NO_INDEX:
+            yield _child
+            _child = self._next_sibling[_child]
+
+    def create_tree(
+        self, nodes_dict: dict, name_field: str = None, parent_field: str = None, analyze_fields: bool = False
+    ) -> None:
+        """creates the tree hierarchy / also calculate min max values"""
+        self._clear()
+        self.invalidate()
+        logger.debug("[CompactTree] Create Tree")
+        _root_node = None
+
+        self._analyze_fields = analyze_fields
+        self._cell_type_analyzer.is_active = analyze_fields
+
+        if name_field:
+            self._name_field = name_field
+
+        if parent_field is not None:
+            self._parent_field = parent_field
+
+        # calculate min and max values for numerical values
+        self._cell_type_analyzer.analyze_batch(nodes_dict)
+
+        for _node_id, _node_info in nodes_dict.items():
+            # it was created before as parent node
+            _idx = self._index.get(_node_id)
+            if _idx is None:
+                _idx = self._add_node(_node_info, _node_id)
+            if _idx is None:
+                continue
+            # get parent and add as child
+            _parent_id = self._parent_ids[_idx]
+            if _parent_id is None:
+                if _root_node is None:
+                    _root_node = _node_id
+                    continue
+                else:
+                    logger.warning("[CompactTree] Create Tree, there is more than 1 root node, skip processing")
+                    _root_node = None
+                    break
+            _parent_idx = self._index.get(_parent_id)
+            # create node if not already there
+            if _parent_idx is None:
+                _parent_idx = self._add_node(nodes_dict.get(_parent_id), _parent_id)
+                if _parent_idx is None:
+                    continue
+
+            self._append_child(_parent_idx, _idx)
+
+        # only needed while building the tree
+        self._last_child = array("q")
+        self.invalidate()
+        if _root_node is not None:
+            self._root = _root_node
+        else:
+            self._clear()
+            return
+
+        if self._calc_tree_levels:
+            self.set_tree_levels()
+
+        logger.debug(f"[CompactTree] Created [{self._num_nodes}] nodes in Tree")
+
+    @property
+    def hierarchy(self) -> Dict[object, TreeNodeModel]:
+        """tree hierarchy (will create all tree nodes, cached, don't modify the returned dict)"""
+        _hierarchy = self._cache.get("hierarchy")
+        if _hierarchy is None:
+            _hierarchy = {_node_id: self.get_node(_node_id) for _node_id in self._ids if self.is_node(_node_id)}
+            self._cache["hierarchy"] = _hierarchy
+        return _hierarchy
+
+    def set_tree_levels(self) -> None:
+        """setting the tree levels"""
+        self._tree_level_stats = {}
+        _level = 0
+        _current_idx = [self._index[self.root_id]]
+        while len(_current_idx) > 0:
+            _next_idx = []
+            self._tree_level_stats[_level] = len(_current_idx)
+            for _idx in _current_idx:
+                self._level[_idx] = _level
+                _node = self._hierarchy_nodes_dict.get(self._ids[_idx])
+                if _node is not None:
+                    _node.level = _level
+                _next_idx.extend(self._iter_children(_idx))
+            _level += 1
+            _current_idx = _next_idx
+        self._max_level = _level - 1
+
+    @valid_node_id
+    def get_node(self, node_id: object) -> TreeNodeModel | None:
+        """returns the tree node for given node id, node is created on first access"""
+        _node = self._hierarchy_nodes_dict.get(node_id)
+        if _node is not None:
+            return _node
+        _idx = self._index[node_id]
+        _level = self._level[_idx]
+        _node = TreeNodeModel(
+            id=node_id,
+            parent_id=self._parent_ids[_idx],
+            children=[self._ids[_c] for _c in self._iter_children(_idx)],
+            is_leaf=bool(self._is_leaf[_idx]),
+            name=self._names[_idx],
+            obj=self._objs[_idx],
+            obj_type=self._obj_types[_idx],
+            level=None if _level == NO_INDEX else _level,
+        )
+        self._hierarchy_nodes_dict[node_id] = _node
+        return _node
+
+    @valid_node_id
+    def get_children(self, node_id: object, only_leaves: bool = False) -> list:
+        """returns ids of direct children"""
+        _children = self._iter_children(self._index[node_id])
+        if only_leaves:
+            _children = [_c for _c in _children if self._is_leaf[_c]]
+        return [self._ids[_c] for _c in _children]
+
+    @valid_node_id
+    def get_all_children(self, node_id: object, only_leaves: bool = False) -> list:
+        """gets all children nodes below node as list (option to select only leaves)"""
+        children_nodes = []
+        _current_idx = list(self._iter_children(self._index[node_id]))
+        # level by level, same order as in Tree
+        while len(_current_idx) > 0:
+            _next_idx = []
+            for _idx in _current_idx:
+                if not only_leaves or self._is_leaf[_idx]:
+                    children_nodes.append(self._ids[_idx])
+                _next_idx.extend(self._iter_children(_idx))
+            _current_idx = _next_idx
+        return children_nodes
+
+    @valid_node_id
+    def has_children(self, node_id: object) -> bool:
+        """checks if node has children"""
+        return self._first_child[self._index[node_id]] != NO_INDEX
+
+    @valid_node_id
+    def get_predecessors(self, node_id: object) -> list:
+        """gets the parent nodes in a list"""
+        parents = []
+        _parent_idx = self._parent[self._index[node_id]]
+        while _parent_idx != NO_INDEX:
+            _parent_id = self._ids[_parent_idx]
+            # same as in Tree, an empty parent id ends the path
+            if not _parent_id:
+                break
+            parents.append(_parent_id)
+            _parent_idx = self._parent[_parent_idx]
+        return parents
+
+    @valid_node_id
+    def is_node(self, node_id: object) -> bool:
+        """returns whether an id represents a node"""
+        return True
+
+    @valid_node_id
+    def is_leaf(self, node_id: object) -> bool:
+        """checks if node is leaf"""
+        return bool(self._is_leaf[self._index[node_id]])
+
+    @valid_node_id
+    def get_siblings(self, node_id: object, only_leaves: bool = True) -> list:
+        """gets the list of siblings and only leaves"""
+        _idx = self._index[node_id]
+        _parent_idx = self._parent[_idx]
+        if _parent_idx == NO_INDEX:
+            return []
+        return [
+            self._ids[_c]
+            for _c in self._iter_children(_parent_idx)
+            if _c != _idx and (not only_leaves or self._is_leaf[_c])
+        ]
+
+    def get_leaves(self) -> list:
+        """returns the leaves of the tree"""
+        return [_node_id for _node_id, _is_leaf in zip(self._ids, self._is_leaf) if _is_leaf]
+
+
+if __name__ == "__main__":
+    loglevel = logging.DEBUG
+    logging.basicConfig(
+        format="%(asctime)s %(levelname)s %(module)s:[%(name)s.%(funcName)s(%(lineno)d)]: %(message)s",
+        level=loglevel,
+        stream=sys.stdout,
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    tree = {
+        1: {"parent": None, "value": "value 1"},
+        2: {"parent": 1, "value": "value 2"},
+        4: {"parent": 2, "value": "value 4"},
+        3: {"parent": 1, "value": "value 3"},
+    }
+    my_tree = CompactTree()
+    my_tree.create_tree(tree, name_field="value", parent_field="parent")
+    print(my_tree.get_all_children(1))
+    print(my_tree.get_predecessors(4))
+    print(my_tree.get_node(4))
@@ -20,8 +20,8 @@ class TreeFiltered(Tree):
     def __init__(self, filter_type: IncludeLiteral = "exclude"):
         """constructor"""
         super().__init__()
-        # filtered keys
-        self._filtered_nodes: Optional[Dict[object, set]] = {}
+        # filtered keys (children are matched using the interval index of the tree)
+        self._filtered_nodes: Optional[Dict[object, None]] = {}
         self._is_active: bool = True
         # include type:
         # exclude: nodes matching id will be excluded
@@ -49,10 +49,17 @@ class TreeFiltered(Tree):
                 pass
 
         if _match is None:
-            # TODO PRIO4 maybe add a progress indicator
-            for _, _children_nodes in self._filtered_nodes.items():
-                if node_id in _children_nodes:
-                    _match = True
+            # check whether node is in the subtree of a filter node
+            _intervals = self._get_intervals()[0]
+            _interval = _intervals.get(node_id)
+            if _interval is not None:
+                for _filter_node_id in self._filtered_nodes.keys():
+                    _filter_interval = _intervals.get(_filter_node_id)
+                    if _filter_interval is None:
+                        continue
+                    if _filter_interval[0] < _interval[0] < _filter_interval[1]:
+                        _match = True
+                        break
 
         if _match is None:
             _match = False
@@ -77,27 +84,27 @@ class TreeFiltered(Tree):
     @valid_node_id
     def add_filter(self, node_id: object):
         """adds a filter id to the filtered_nodes"""
-        # _node = self._hierarchy_nodes_dict[node_id]
-        # add all children as values
-        # tremporarily deactivate filter (all methods will run into the gget_node method)
-        _old_active = self.is_active
-        self.is_active = False
-        _children_ids = self.get_all_children(node_id)
-        self._filtered_nodes[node_id] = set(_children_ids)
-        self.is_active = _old_active
+        self._filtered_nodes[node_id] = None
+        self.invalidate(structure=False)
 
     @valid_node_id
     def remove_filter(self, node_id: object):
         """removes a filter id from the filtered_nodes"""
         try:
             _ = self._filtered_nodes.pop(node_id)
+            self.invalidate(structure=False)
         except KeyError:
             logger.info(f"[TreeFiltered] No Node Key [{node_id}] in filtered nodes")
 
     @property
     def filtered_nodes(self) -> Dict[object, set]:
-        """returns the current filter"""
-        return self._filtered_nodes
+        """returns the current filter as dict {filter node id: set of all children ids}"""
+        _intervals, _preorder = self._get_intervals()
+        out = {}
+        for _node_id in self._filtered_nodes.keys():
+            _entry, _exit = _intervals.get(_node_id, (0, 0))
+            out[_node_id] = set(_preorder[_entry + 1 : _exit])
+        return out
 
     @property
     def is_active(self) -> bool:
@@ -107,10 +114,13 @@ class TreeFiltered(Tree):
     def clear(self) -> None:
         """clear filter"""
         self._filtered_nodes = {}
+        self.invalidate(structure=False)
 
     @is_active.setter
     def is_active(self, is_active: bool):
         """setting the index type"""
+        if is_active != self._is_active:
+            self.invalidate(structure=False)
         self._is_active = is_active
 
 
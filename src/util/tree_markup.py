@@ -1,11 +1,12 @@
 """Nesting tree elements, to be used for nested tree output for creating markup structures such as xmls, plantuml or markdown"""
 
 # from pathlib import Path
+import io
 import logging
 import sys
 
 # import typer
-from typing import Dict
+from typing import Iterator, List, TextIO
 from cli.bootstrap_env import CLI_LOG_LEVEL
 from model.model_tree import TreeNodeModel
 from util.tree import Tree
@@ -23,12 +24,11 @@ class TreeMarkup:
         self._tree: Tree = tree
         self._start_tag: str = "{"
         self._end_tag: str = "}"
-        self._rendered_elements: Dict[object, str] = {}
-        self._render_stack: list = []
+        # separator between rendered children, used when streaming
+        self._child_separator: str = "\n"
         self._indent: str = num_spaces * " "
+        # rendered on first access of rendered, write / iter_chunks stream without rendering the whole tree
         self._rendered_tree = None
-        self._render_leaves()
-        self._render_nodes()
 
     def render_leaf(self, node: TreeNodeModel) -> str:
         """render a single leaf can be used for overwriting"""
@@ -36,29 +36,11 @@ class TreeMarkup:
         # for now we only implement a minimal implementation
         return f"{_indent}[{node.name}]"
 
-    def _render_leaf(self, node_id: object) -> None:
-        """renders content of a single node, van be subclassed"""
-        _node = self._tree.get_node(node_id)
-        if _node is None:
-            return
-        _content = self.render_leaf(_node)
-        self._rendered_elements[node_id] = _content
-        # add parent to be rendered if not already done
-        _parent_id = _node.parent_id
-        if _parent_id is not None and self._rendered_elements.get(_parent_id) is None:
-            if _parent_id not in self._render_stack:
-                self._render_stack.append(_parent_id)
-
-    def _render_leaves(self):
-        """renders all nodes"""
-        # initialize the stack with all children
-        _node_ids = self._tree.get_all_children(self._tree.root_id, only_leaves=True)
-        for _node_id in _node_ids:
-            self._render_leaf(_node_id)
-
     def join_rendered_children(self, rendered_children: list) -> str:
-        """join children (eg add commata or simple add them, whatever) ..."""
-        out = "\n".join(rendered_children)
+        """join children (eg add commata or simple add them, whatever) ...
+        if overwritten, the tree is rendered node by node instead of being streamed
+        """
+        out = self._child_separator.join(rendered_children)
         return out
 
     def render_node(self, node: TreeNodeModel) -> str:
@@ -73,58 +55,106 @@ class TreeMarkup:
         out = f"\n{_indent}{self._end_tag}"
         return out
 
-    def _render_node(self, node_id: object):
-        """render the node.
-        we can assume that all children nodes were parsed before"""
+    def _get_children(self, node: TreeNodeModel) -> List[TreeNodeModel]:
+        """returns the existing children nodes"""
+        out = []
+        for _child_id in node.children:
+            _child = self._tree.get_node(_child_id)
+            if _child is not None:
+                out.append(_child)
+        return out
+
+    def iter_chunks(self, node_id: object = None) -> Iterator[str]:
+        """iterative depth first traversal, yields the markup in chunks (node, separator, children, close tag)
+        so that the tree can be streamed without building nested strings. Starts at root by default
+        """
         if node_id is None:
+            node_id = self._tree.root_id
+        _node = self._tree.get_node(node_id)
+        if _node is None:
+            return
+        if len(_node.children) == 0:
+            yield self.render_leaf(_node)
             return
-        _out = ""
+        yield self.render_node(_node)
+        # stack of [node, its children, index of next child]
+        _stack = [[_node, self._get_children(_node), 0]]
+        while len(_stack) > 0:
+            _entry = _stack[-1]
+            _parent, _children, _idx = _entry
+            if _idx == len(_children):
+                _stack.pop()
+                yield self.render_close_tag(_parent)
+                continue
+            _entry[2] += 1
+            if _idx > 0:
+                yield self._child_separator
+            _child = _children[_idx]
+            if len(_child.children) == 0:
+                yield self.render_leaf(_child)
+            else:
+                yield self.render_node(_child)
+                _stack.append([_child, self._get_children(_child), 0])
+
+    def _is_joined(self) -> bool:
+        """checks whether joining children is overwritten (then the tree can't be streamed)"""
+        return type(self).join_rendered_children is not TreeMarkup.join_rendered_children
+
+    def write(self, writer: TextIO, node_id: object = None) -> None:
+        """streams the markup to a writer (file or io.StringIO)"""
+        if self._is_joined():
+            _rendered = self._render_joined(self._tree.root_id if node_id is None else node_id)
+            if _rendered is not None:
+                writer.write(_rendered)
+            return
+        for _chunk in self.iter_chunks(node_id):
+            writer.write(_chunk)
+
+    def _render_joined(self, node_id: object) -> str | None:
+        """iterative post order rendering, children are joined with join_rendered_children"""
         _node = self._tree.get_node(node_id)
-        _indent = _node.level * self._indent
-        _parent_id = _node.parent_id
-        # add the parent to the stack
-        if _parent_id and _parent_id not in self._render_stack:
-            self._render_stack.append(_parent_id)
-        _child_ids = _node.children
-        _rendered_children = []
-        for _child_id in _child_ids:
-            s_child = self._rendered_elements.pop(_child_id)
-            _rendered_children.append(s_child)
-        _rendered_node = self.render_node(_node)
-        _rendered_children = self.join_rendered_children(_rendered_children)
-        _close_tag = self.render_close_tag(_node)
-        _out = _rendered_node + _rendered_children + _close_tag
-        self._rendered_elements[node_id] = _out
-
-    def _render_nodes(self):
-        # continue as long as there are nodes to render
-        while len(self._render_stack) > 0:
-            # go through in reverse order
-            _next_element = None
-            _children = None
-            for _idx in range(len(self._render_stack) - 1, -1, -1):
-                # find the next element where all children are rendered
-                _node_id = self._render_stack[_idx]
-                _node = self._tree.get_node(_node_id)
-                _children = _node.children
-                _unrendered_children = [_child for _child in _children if self._rendered_elements.get(_child) is None]
-                # this element has all childrens rendered, so it can be rendered
-                if len(_unrendered_children) == 0:
-                    _next_element = self._render_stack[_idx]
-                    break
-            if _next_element:
-                # remove the current index
-                self._render_stack.pop(_idx)
-                self._render_node(_next_element)
-
-        if len(self._rendered_elements) != 1:
-            logger.error(f"[TreeNester] There are {len(self._rendered_elements)}, expected one, quit")
+        if _node is None:
+            return None
+        if len(_node.children) == 0:
+            return self.render_leaf(_node)
+        # stack of [node, its children, rendered children]
+        _stack = [[_node, self._get_children(_node), []]]
+        out = None
+        while len(_stack) > 0:
+            _parent, _children, _rendered_children = _stack[-1]
+            _idx = len(_rendered_children)
+            if _idx < len(_children):
+                _child = _children[_idx]
+                if len(_child.children) == 0:
+                    _rendered_children.append(self.render_leaf(_child))
+                else:
+                    _stack.append([_child, self._get_children(_child), []])
+                continue
+            _stack.pop()
+            out = (
+                self.render_node(_parent)
+                + self.join_rendered_children(_rendered_children)
+                + self.render_close_tag(_parent)
+            )
+            if len(_stack) > 0:
+                _stack[-1][2].append(out)
+        return out
+
+    def _render_tree(self) -> None:
+        """renders the whole tree, streamed unless joining children is overwritten"""
+        _root_id = self._tree.root_id
+        if self._tree.get_node(_root_id) is None:
+            logger.error(f"[TreeMarkup] Root node [{_root_id}] not found, quit")
             return
-        self._rendered_tree = next(iter((self._rendered_elements.values())))
+        _writer = io.StringIO()
+        self.write(_writer)
+        self._rendered_tree = _writer.getvalue()
 
     @property
     def rendered(self) -> str:
-        """rendered output"""
+        """rendered output (the tree is rendered on first access)"""
+        if self._rendered_tree is None:
+            self._render_tree()
         return self._rendered_tree
 
     def __str__(self):
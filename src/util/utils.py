@@ -22,6 +22,7 @@ from model.model_filter import AnyOrAllType, StringMatch, IncludeType, SimpleStr
 from cli.bootstrap_env import CLI_LOG_LEVEL
 
 # from util.cmd_runner import CmdRunner
+from util.path_resolver import PathResolver
 from util.persistence import Persistence
 
 logger = logging.getLogger(__name__)
@@ -56,6 +57,8 @@ PERMISSION = "permission"
 PERMISSION_CHMOD = "chmod"
 IS_FILE = "is_file"
 TOTAL_SIZE = "total_size"
+TOTAL_FILES = "total_files"
+TOTAL_CHDATE = "total_chdate"
 
 
 class Utils:
@@ -607,29 +610,16 @@ class Utils:
 
     @staticmethod
     def where(cmd: str, to_string: bool = True, re_prefered: str = None) -> str | list:
-        """tries to find executables using where command (you need to ensure where command is on PATH
-        optionally allows to searc1h for a preferred version of an executable
+        """tries to find executables on PATH (like where / which -a, but without running a process)
+        optionally allows to search for a preferred version of an executable (regex matching the path)
         """
-        _cmd_list = CmdRunner().cmd(os_cmd=f"where {cmd}", as_string=False)
+        _cmd_list = PathResolver.where(cmd, re_prefered=re_prefered)
         # validate if it is a file
         _valid = False
-        # find a prefered version
-        _prefered = None
-        if re_prefered is not None:
-            _prefered_cmds = []
-            for _cmd in _cmd_list:
-                _prefered = re.findall(re_prefered, _cmd, re.IGNORECASE)
-                if len(_prefered) > 0:
-                    _prefered_cmds.extend(_prefered)
-            if len(_prefered_cmds) > 0:
-                _cmd_list = _prefered_cmds
-
         if len(_cmd_list) > 0:
             _valid = all([os.path.isfile(c) for c in _cmd_list])
         if not _valid:
-            logger.warning(
-                f"[Utils] Couldn't locate where command when trying to find [{cmd}].Ensure where is set on your PATH"
-            )
+            logger.warning(f"[Utils] Couldn't locate [{cmd}], ensure it is on your PATH")
             return C.INVALID
 
         if to_string:
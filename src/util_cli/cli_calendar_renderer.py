@@ -29,6 +29,7 @@ from util.datetime_util import (
 from util.emoji_util import EmojiUtil
 from util.utils import Utils
 from util.calendar_filter import CalendarFilter
+from util_cli.cli_style_cache import STYLE_CACHE
 
 
 REGEX_ICON_STR = ":[a-zA-Z0-9_]+:"  # alphanum chars embraced in colons
@@ -533,7 +534,7 @@ class CalendarTreeRenderer(CalendarRenderer):
         # self._calendar_colors
         _day_type = day_info.day_type.name
         _color = getattr(self._calendar_colors, _day_type)
-        return _color
+        return STYLE_CACHE.parse(_color)
 
     def _render_day_nodes(self):
         """renders the single day nodes"""
@@ -24,6 +24,7 @@ from util.matrix_list import MatrixList
 from util.persistence import Persistence
 from util.utils import Utils
 from util_cli.cli_color_maps import ANSI_VALUES, COLOR_NAMES, HEX_COLORS, RGB_COLORS
+from util_cli.cli_style_cache import KEY_ESC_CODES, STYLE_CACHE
 
 HEX = "hex"
 ANSI = "ansi"  # ansi codes not implemented yet
@@ -45,6 +46,15 @@ F_COLOR_THEMES = "color_themes.json"
 F_STYLES = "styles.json"
 BASE_HEX_COLORS = HEX_COLORS[:16]
 BASE_RGB_COLORS = RGB_COLORS[:16]
+# index of the nearest ANSI color cube value for each channel value 0-255
+ANSI_CUBE_INDEX = [
+    min(range(len(ANSI_VALUES)), key=lambda _idx: abs(ANSI_VALUES[_idx] - _value)) for _value in range(256)
+]
+# ANSI grey values 232-255: 8,18,...,238
+ANSI_GREY_CODE = 232
+ANSI_GREY_MIN = 8
+ANSI_GREY_STEP = 10
+ANSI_GREY_NUM = 24
 
 
 class RichStyle(Enum):
@@ -90,6 +100,34 @@ logger.setLevel(CLI_LOG_LEVEL)
 class ColorMapper:
     """Class to handle Color Mappings"""
 
+    # reverse lookups value > code, shared as the color tables are shared (see theme setter)
+    _rgb_lookup: dict = None
+    _hex_lookup: dict = None
+    _name_lookup: dict = None
+
+    @staticmethod
+    def _create_lookup(values: list) -> dict:
+        """creates reverse lookup value > index of first occurence (same as list.index)"""
+        out = {}
+        for _idx, _value in enumerate(values):
+            out.setdefault(_value, _idx)
+        return out
+
+    @staticmethod
+    def _update_lookups() -> None:
+        """(re)creates the reverse lookups of the color tables"""
+        ColorMapper._rgb_lookup = ColorMapper._create_lookup(RGB_COLORS)
+        ColorMapper._hex_lookup = ColorMapper._create_lookup(HEX_COLORS)
+        ColorMapper._name_lookup = ColorMapper._create_lookup(COLOR_NAMES)
+
+    @staticmethod
+    def _lookup(lookup: dict, value: Any) -> int | None:
+        """returns code from lookup, None if not found or value can't be a key"""
+        try:
+            return lookup.get(value)
+        except TypeError:
+            return None
+
     def _read_themes(self) -> dict:
         """reads themes for standard colors, returns theme dictionary"""
         out = {}
@@ -315,10 +353,51 @@ class ColorMapper:
 
     def rgb2code(self, rgb: tuple) -> str:
         """convert rgb to code"""
-        try:
-            return self._rgb_colors.index(rgb)
-        except ValueError:
-            return None
+        return ColorMapper._lookup(ColorMapper._rgb_lookup, rgb)
+
+    @staticmethod
+    def rgb2code_nearest(rgb: tuple, base_colors: bool = False) -> int:
+        """returns the code of the nearest color (euclidean distance in rgb),
+        codes 16-255 (color cube and grey values) or 0-255 with base_colors
+        (base colors are not used as default since they depend on the theme)
+        """
+        r, g, b = [int(_c) for _c in rgb]
+        if min(r, g, b) < 0 or max(r, g, b) > 255:
+            raise ValueError(f"Invalid rgb value [{rgb}]")
+        # color cube: the nearest color is the combination of the nearest values per channel
+        _r_idx = ANSI_CUBE_INDEX[r]
+        _g_idx = ANSI_CUBE_INDEX[g]
+        _b_idx = ANSI_CUBE_INDEX[b]
+        _dist = (ANSI_VALUES[_r_idx] - r) ** 2 + (ANSI_VALUES[_g_idx] - g) ** 2 + (ANSI_VALUES[_b_idx] - b) ** 2
+        _code = 16 + 36 * _r_idx + 6 * _g_idx + _b_idx
+        # grey values: the nearest grey is the one nearest to the mean channel value
+        _grey_idx = round(((r + g + b) / 3 - ANSI_GREY_MIN) / ANSI_GREY_STEP)
+        _grey_idx = min(max(_grey_idx, 0), ANSI_GREY_NUM - 1)
+        _grey = ANSI_GREY_MIN + _grey_idx * ANSI_GREY_STEP
+        _grey_dist = (_grey - r) ** 2 + (_grey - g) ** 2 + (_grey - b) ** 2
+        if _grey_dist < _dist:
+            _dist = _grey_dist
+            _code = ANSI_GREY_CODE + _grey_idx
+        if base_colors:
+            for _base_code in range(16):
+                _r, _g, _b = RGB_COLORS[_base_code]
+                _base_dist = (_r - r) ** 2 + (_g - g) ** 2 + (_b - b) ** 2
+                if _base_dist < _dist or (_base_dist == _dist and _base_code < _code):
+                    _dist = _base_dist
+                    _code = _base_code
+        return _code
+
+    def nearest_codes(self, values: list, base_colors: bool = False) -> list:
+        """bulk conversion of rgb tuples or hex values into codes of the nearest colors (None if invalid)"""
+        out = []
+        for _value in values:
+            try:
+                if isinstance(_value, str):
+                    _value = self.hex2rgb(_value)
+                out.append(ColorMapper.rgb2code_nearest(_value, base_colors))
+            except (TypeError, ValueError, IndexError):
+                out.append(None)
+        return out
 
     def name2rgb(self, name: str) -> str:
         """convert name to rgb"""
@@ -338,10 +417,7 @@ class ColorMapper:
 
     def name2code(self, name: int) -> str:
         """convert name to code"""
-        try:
-            return COLOR_NAMES.index(name)
-        except ValueError:
-            return None
+        return ColorMapper._lookup(ColorMapper._name_lookup, name)
 
     def hex2rgb(self, chex: str) -> str:
         """convert hex to rgb"""
@@ -359,10 +435,7 @@ class ColorMapper:
 
     def hex2code(self, chex: str) -> str:
         """convert hex to code by finding its index"""
-        try:
-            return self._hexcolors.index(chex)
-        except ValueError:
-            return None
+        return ColorMapper._lookup(ColorMapper._hex_lookup, chex)
 
     def __init__(self, theme: str = None, p_resources: str = None) -> None:
         """constructor
@@ -383,6 +456,8 @@ class ColorMapper:
 
         self._hexcolors = HEX_COLORS
         self._rgb_colors = RGB_COLORS
+        if ColorMapper._rgb_lookup is None:
+            ColorMapper._update_lookups()
         self._themes = []
         self._theme = None
         if theme:
@@ -438,6 +513,7 @@ class ColorMapper:
             for i in range(16):
                 self._hexcolors[i] = _base_colors[i]
                 self._rgb_colors[i] = self.hex2rgb(self._hexcolors[i])
+            ColorMapper._update_lookups()
         else:
             logger.warning("[ColorMapper] Configuration file was not found")
 
@@ -466,6 +542,22 @@ class ColorMapper:
                 return None
             return value
 
+    def convert_many(self, values: list, to: str = HEX) -> list:
+        """bulk conversion of a list of color values (see convert), each distinct value is converted only once"""
+        out = []
+        _converted = {}
+        for _value in values:
+            _key = (type(_value), tuple(_value) if isinstance(_value, list) else _value)
+            try:
+                _color = _converted[_key]
+            except KeyError:
+                _color = self.convert(_value, to)
+                _converted[_key] = _color
+            except TypeError:
+                _color = self.convert(_value, to)
+            out.append(_color)
+        return out
+
     def _rgb_colors_hex(self) -> list:
         """returns the rgb_colors as hex values"""
         out = []
@@ -533,7 +625,14 @@ class ThemeConsole(ColorMapper):
             self._theme = self._default_theme
 
     def get_esc_codes(self) -> dict:
-        """returns the ANSI escape codes for the current theme"""
+        """returns the ANSI escape codes for the current theme (cached per theme)"""
+        _esc_codes = STYLE_CACHE.get_or_create(
+            (KEY_ESC_CODES, self._p_rich_themes, self._theme), self._create_esc_codes
+        )
+        return dict(_esc_codes)
+
+    def _create_esc_codes(self) -> dict:
+        """creates the ANSI escape codes for the current theme"""
         out = {}
         out["reset"] = "ESC[0m"
         # get the color map and the styles from current theme
@@ -546,7 +645,6 @@ class ThemeConsole(ColorMapper):
         _theme = self._theme_manager.get(self._theme)
         _style_names = _theme.style_names
         _styles = _theme.styles
-        _color_map = self.config.get("themes", {}).get(self._theme, {})
         for _style_name in _style_names:
             _esc_out = []
             _style = _styles.get(_style_name)
@@ -713,6 +811,7 @@ class ThemeConsole(ColorMapper):
             logger.debug(f"[ThemeConsole] Creating Theme [{_theme_name}]")
             _rich_themes.append(Theme(**_theme))
         print(f"[ThemeConsole] CREATED RICH STYLE THEMES IN [{self._p_rich_themes}]")
+        STYLE_CACHE.clear(KEY_ESC_CODES)
         return ThemeManager(theme_dir=self._p_rich_themes, themes=_rich_themes, overwrite=True)
 
     def _set_rich_themes_path(self):
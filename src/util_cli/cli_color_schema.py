@@ -8,6 +8,7 @@ from rich.logging import RichHandler
 from util import constants as C
 from util_cli.cli_color_schema_maps import COLOR_SCHEMAS
 from util_cli.cli_color_mapper import ColorMapper
+from util_cli.cli_style_cache import KEY_SCHEMA_COLOR, STYLE_CACHE
 from model.model_filter import AnyOrAllType
 from model.model_visualizer import (
     ColorSchemaSetType,
@@ -146,8 +147,8 @@ class ColorSchema:
                     _out_colors.append(_col_tuple)
                 elif self._color_encoding == "hex":
                     _out_colors.append(self._color_mapper.rgb2hex(_col_tuple))
-                elif self._color_mapper == "code":
-                    _out_colors.append(self._color_mapper.rgb2code(_col_tuple))
+                elif self._color_encoding == "code":
+                    _out_colors.append(self._color_mapper.rgb2code_nearest(_col_tuple))
             out[str(_idx)] = _out_colors
         self._buffered_schema = schema
         self._buffered_schema_info = out
@@ -237,6 +238,13 @@ class ColorSchema:
     def color(self, index: int, num_colors: int = None, schema: ColorSchemaType = None) -> list:
         """returns the color code and the information on whether to invert the font color"""
         _num_colors = self.adjust_num_colors(num_colors)
+        # colors are cached by schema, number of colors and index
+        if schema is not None and schema != self._buffered_schema:
+            self.get_schema_info(schema)
+        _key = (KEY_SCHEMA_COLOR, self._buffered_schema, self._color_encoding, self._reverse_schema, _num_colors, index)
+        _color = STYLE_CACHE.get(_key)
+        if _color is not None:
+            return list(_color)
         _schema_info = self._get_schema(_num_colors, schema)
         if _schema_info is None:
             return
@@ -247,6 +255,7 @@ class ColorSchema:
         _color_code = _schema_info[str(_num_colors)][_index]
         _invert_font_info = _schema_info[INVERT_FONT][str(_num_colors)]
         _invert_font = True if str(_index + 1) in _invert_font_info else False
+        STYLE_CACHE.put(_key, (_color_code, _invert_font))
         return [_color_code, _invert_font]
 
     def color_by_value(
@@ -19,7 +19,8 @@ from util.file_tree import ParamsFileTreeModel
 from cli.bootstrap_env import CLI_LOG_LEVEL
 
 from util.file_tree import FileTree
-from util.utils import ROOT, SIZE, TOTAL_SIZE, VALUE, IS_FILE, CHDATE, PERMISSION_CHMOD, Utils
+from util.utils import ROOT, SIZE, TOTAL_FILES, TOTAL_SIZE, VALUE, IS_FILE, CHDATE, PERMISSION_CHMOD, Utils
+from util_cli.cli_style_cache import STYLE_CACHE
 
 logger = logging.getLogger(__name__)
 # get log level from environment if given
@@ -195,13 +196,15 @@ class FileTreeRenderer:
             _icon = _skin.icon
             if _icon is None:
                 _icon = self._default_icon
-            _text_chdate = Text(f"{_chdate_s}", _color)
-            _text_filename = Text(f"{_name}", _color)
+            _style = STYLE_CACHE.parse(_color)
+            _text_chdate = Text(f"{_chdate_s}", _style)
+            _text_filename = Text(f"{_name}", _style)
             # TODO PRIO3 ADD HIGHLIGHTS DEPENDING ON SEARCh ITEMS WHEN SEARCHING
             # text_filename.highlight_regex(r"\..*$", "bold bright_blue")
             _text_filename.stylize(f"link {_link_path}")
-            _text_filename.append(f" ({decimal(_size)})", _color)
-            _label = Text(f"[{_permissions}] ", _guide_color) + _text_chdate + " " + Text(_icon) + " " + _text_filename
+            _text_filename.append(f" ({decimal(_size)})", _style)
+            _guide = STYLE_CACHE.parse(_guide_color)
+            _label = Text(f"[{_permissions}] ", _guide) + _text_chdate + " " + Text(_icon) + " " + _text_filename
             out = {"label": _label}
         # path
         else:
@@ -218,6 +221,7 @@ class FileTreeRenderer:
                 _icon = _skin.icon
                 _default_icon = self._icon_folder_close
                 _size = 0
+                _num_files = None
                 _extra_format = ""
             else:
                 _skin = self._filetree_skin.get(FOLDER_OPEN, {})
@@ -225,13 +229,15 @@ class FileTreeRenderer:
                 _icon = _skin.icon
                 _default_icon = self._icon_folder_close
                 _size = node_info.get(TOTAL_SIZE, 0)
+                _num_files = node_info.get(TOTAL_FILES)
                 _extra_format = "[bold]"
 
             if _color is None:
                 _color = self._default_color
             if _icon is None:
                 _icon = _default_icon
-            _label = f"{_extra_format}{_icon}{_permissions_text}[{_color}]{_chdate_s} [link {_link_path}]{escape(_name)} ({decimal(_size)})"
+            _num_files_s = f", {_num_files} files" if _num_files else ""
+            _label = f"{_extra_format}{_icon}{_permissions_text}[{_color}]{_chdate_s} [link {_link_path}]{escape(_name)} ({decimal(_size)}{_num_files_s})"
             out["label"] = _label
             out["style"] = _style
 
@@ -0,0 +1,93 @@
+"""Bounded LRU Cache for rendered styles, schema colors and escape codes shared by the renderers"""
+
+import logging
+from collections import OrderedDict
+from typing import Any, Callable
+
+from rich.style import Style
+
+from cli.bootstrap_env import CLI_LOG_LEVEL
+
+logger = logging.getLogger(__name__)
+# get log level from environment if given
+logger.setLevel(CLI_LOG_LEVEL)
+
+# key prefixes of the cached items
+KEY_STYLE = "style"
+KEY_STYLE_PARSED = "style_parsed"
+KEY_SCHEMA_COLOR = "schema_color"
+KEY_ESC_CODES = "esc_codes"
+MAX_SIZE_DEFAULT = 4096
+
+
+class StyleCache:
+    """bounded LRU cache, keys are tuples (prefix, theme / schema, number of colors, bucket index, ...),
+    cached values are shared, so don't modify them
+    """
+
+    def __init__(self, max_size: int = MAX_SIZE_DEFAULT) -> None:
+        """constructor"""
+        self._max_size: int = max_size
+        self._cache: OrderedDict = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def __len__(self) -> int:
+        """number of cached items"""
+        return len(self._cache)
+
+    @property
+    def stats(self) -> dict:
+        """cache statistics"""
+        return {"size": len(self._cache), "max_size": self._max_size, "hits": self._hits, "misses": self._misses}
+
+    def get(self, key: tuple) -> Any:
+        """returns cached value or None"""
+        _value = self._cache.get(key)
+        if _value is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._cache.move_to_end(key)
+        return _value
+
+    def put(self, key: tuple, value: Any) -> None:
+        """adds a value (None values are not cached), drops the least recently used item if full"""
+        if value is None:
+            return
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    def get_or_create(self, key: tuple, create: Callable[[], Any]) -> Any:
+        """returns cached value, value is created and cached if missing"""
+        _value = self.get(key)
+        if _value is None:
+            _value = create()
+            self.put(key, _value)
+        return _value
+
+    def style(self, color: str = None, bgcolor: str = None, bold: bool = None) -> Style:
+        """returns a (cached) rich style, links need to be added using style.update_link"""
+        return self.get_or_create(
+            (KEY_STYLE, color, bgcolor, bold), lambda: Style(color=color, bgcolor=bgcolor, bold=bold)
+        )
+
+    def parse(self, style: str | Style) -> Style:
+        """returns a (cached) rich style parsed from a style definition string like "bold green" """
+        if isinstance(style, Style) or style is None:
+            return style
+        return self.get_or_create((KEY_STYLE_PARSED, style), lambda: Style.parse(style))
+
+    def clear(self, prefix: str = None) -> None:
+        """clears the cache or only items with given key prefix"""
+        if prefix is None:
+            self._cache = OrderedDict()
+            return
+        for _key in [_key for _key in self._cache.keys() if _key[0] == prefix]:
+            self._cache.pop(_key)
+
+
+# cache shared by all renderers
+STYLE_CACHE = StyleCache()
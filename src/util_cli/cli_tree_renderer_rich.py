@@ -22,6 +22,7 @@ from model.model_visualizer import ColorSchemaType, RichNodeDisplayInfo
 from util.tree import Tree
 from util.utils import Utils
 from util_cli.cli_color_schema import ColorSchema
+from util_cli.cli_style_cache import STYLE_CACHE
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +84,7 @@ class TreeRendererRich:
         for _index, _color in enumerate(_colors):
             self._color_dict[_index] = {_color: _invert_font_color[_index]}
             # setting default styles
-            self._color_styles[_index] = Style(color=_color, bgcolor=None, bold=False, link=None)
+            self._color_styles[_index] = STYLE_CACHE.style(color=_color, bgcolor=None, bold=False)
         _ = self._color_schema.colors(num_colors=self._color_schema.num_colors)
 
     def _set_max_level(self, max_level: int = None) -> None:
@@ -181,7 +182,10 @@ class TreeRendererRich:
             _bg_color = node_formatted.textcolor
             if node_formatted.bgcolor is not None:
                 _bg_color = node_formatted.bgcolor
-        return Style(color=_color, bgcolor=_bg_color, link=link, bold=node_formatted.bold)
+        _style = STYLE_CACHE.style(color=_color, bgcolor=_bg_color, bold=node_formatted.bold)
+        if link:
+            _style = _style.update_link(link=link)
+        return _style
 
     def _render_label(self, node_formatted: RichNodeDisplayInfo) -> Text:
         """rendering the text of displayed node, returns tuple of label as Text and style"""
@@ -225,7 +229,7 @@ class TreeRendererRich:
         """renders the format into rich format"""
 
         _label = self._render_label(node_formatted)
-        _rtree_child = rich_tree_parent.add(label=_label, guide_style=node_formatted.guidecolor)
+        _rtree_child = rich_tree_parent.add(label=_label, guide_style=STYLE_CACHE.parse(node_formatted.guidecolor))
         self._rich_tree_dict[node_id] = _rtree_child
         pass
 
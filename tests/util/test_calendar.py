@@ -91,3 +91,19 @@ def test_calendar2024_index_maps(fixture_calendar2024_index):
     assert isinstance(_week_map, dict)
     _monthweek_map = fixture_calendar2024_index.monthweek_map(index_type=IndexType.INDEX_MONTH_DAY)
     assert isinstance(_monthweek_map, dict)
+
+
+def test_calendar2016_index_maps():
+    """testing month week maps of 2016 (leap year, jan 1 in cw 53 of 2015)"""
+    _cal_index = CalendarIndex(2016)
+    _monthweek_map = _cal_index.monthweek_map(index_type=IndexType.INDEX_DAY_IN_YEAR)
+    assert _monthweek_map[1][0] == {1: 1, 2: 2, 3: 3}
+    assert _monthweek_map[12][52][31] == 366
+    assert len(_cal_index.month_map(index_type=IndexType.INDEX_DAY_IN_YEAR)[2]) == 29
+    _weeknum_map = _cal_index.weeknum_map(IndexType.INDEX_MONTH_DAY)
+    assert len(_weeknum_map) == 366
+    assert _weeknum_map[(1, 4)] == 1
+    # all maps are built once per index type
+    assert _cal_index.weeknum_map(IndexType.INDEX_MONTH_DAY) is _weeknum_map
+    _week_map = _cal_index.week_map(IndexType.INDEX_DATETIME)
+    assert _week_map[1][0] == DateTime(2016, 1, 4)
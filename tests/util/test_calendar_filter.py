@@ -1,7 +1,9 @@
 """testing the CalendarFilter Object"""
 
 import pytest
+from datetime import datetime as DateTime
 
+from util.calendar_date_index import DateIndex
 from util.calendar_filter import CalendarFilter
 from util.calendar_index import CalendarIndex, IndexType
 
@@ -87,3 +89,24 @@ def test_calendar_filter_maps(fixture_calendar2024_index: CalendarIndex, is_vali
     if is_valid:
         assert isinstance(_month_week_filter_map, dict)
         assert isinstance(_month_week_filter_map_short, dict)
+
+
+def test_date_index():
+    """testing the date index (day bitmap) of the calendar filter"""
+    _calendar_filter = CalendarFilter("20241230-20250103;20250110-20250110")
+    _date_index = _calendar_filter.date_index
+    assert isinstance(_date_index, DateIndex)
+    assert len(_date_index) == 6
+    assert DateTime(2024, 12, 31, 14, 30) in _date_index
+    assert DateTime(2025, 1, 5) not in _date_index
+    assert DateTime(2020, 1, 1) not in _date_index
+    assert _date_index.dates() == [_d for _d in _calendar_filter.datelist]
+    # range queries across years
+    assert _date_index.dates(DateTime(2025, 1, 1)) == [DateTime(2025, 1, _d) for _d in [1, 2, 3, 10]]
+    assert _date_index.count(DateTime(2024, 1, 1), DateTime(2024, 12, 31)) == 2
+    assert _date_index.count(DateTime(2026, 1, 1)) == 0
+    # bulk operations
+    _other = DateIndex(dates=[DateTime(2025, 1, 2), DateTime(2025, 1, 10), DateTime(2025, 2, 1)])
+    assert (_date_index & _other).dates() == [DateTime(2025, 1, 2), DateTime(2025, 1, 10)]
+    assert len(_date_index | _other) == 7
+    assert len(_date_index & DateIndex(dates=[DateTime(2023, 1, 1)])) == 0
@@ -78,3 +78,74 @@ def test_celltype_analyzer_primitive():
     assert stats.total == 10
     assert stats.num_number == 2
     assert stats.num == 6
+
+
+def test_celltype_analyzer_batch(fixture_celltype_dict, fixture_celltype_basemodel):
+    """batch analysis returns the same stats as analyzing object by object"""
+    _mixed = {
+        "a": {"num": 3, "s": "x", "b": True},
+        "b": {"num": None, "s": 2, "d": {"x": 1}},
+        "c": {"num": 1.5, "s": None, "b": False},
+        "d": {"num": 7, "s": "y"},
+        "e": {"num": 1.5, "s": "z", "b": True},
+        "f": {"num": 7, "s": 4},
+    }
+    for _objs in [fixture_celltype_dict, fixture_celltype_basemodel, _mixed]:
+        _analyzer = CellTypeAnalyzer()
+        for _key, _info in _objs.items():
+            _analyzer.analyze(_info, _key)
+        _batch_analyzer = CellTypeAnalyzer()
+        _batch_analyzer.analyze_batch(_objs)
+        assert _batch_analyzer.get_stats() == _analyzer.get_stats()
+    _stats = _batch_analyzer.get_stats()
+    assert _stats["num"]["key_min"] == "c"
+    assert _stats["num"]["key_max"] == "d"
+
+    # primitives, values can be passed in several batches
+    test_list = [None, "a", 2, "b", None, 8, 8, 1]
+    _analyzer = CellTypeAnalyzer()
+    for _idx, _value in enumerate(test_list):
+        _analyzer.analyze(_value, _idx)
+    _batch_analyzer = CellTypeAnalyzer()
+    _batch_analyzer.analyze_batch(test_list[:3])
+    _batch_analyzer.analyze_batch(test_list[3:], objkeys=list(range(3, len(test_list))))
+    assert _batch_analyzer.get_stats() == _analyzer.get_stats()
+
+    # column mapping
+    _batch_analyzer = CellTypeAnalyzer()
+    _batch_analyzer.analyze_columns({"num": [3, None, 1.5, 7]}, objkeys=["a", "b", "c", "d"])
+    _stats = _batch_analyzer.get_stats()["num"]
+    assert _stats["num"] == 4
+    assert _stats["num_none"] == 1
+    assert _stats["total"] == 11.5
+    assert _stats["key_min"] == "c"
+
+
+def test_celltype_analyzer_sketches():
+    """streaming sketches are updated with each analyzed value"""
+    _analyzer = CellTypeAnalyzer(sketches=True)
+    for _idx in range(20000):
+        _analyzer.analyze({"num": _idx % 1000, "s": f"s{_idx % 50}", "n": None}, _idx)
+    _batch_analyzer = CellTypeAnalyzer(sketches=True)
+    _batch_analyzer.analyze_batch([{"num": _idx % 1000, "s": f"s{_idx % 50}"} for _idx in range(20000)])
+    for _a in [_analyzer, _batch_analyzer]:
+        _sketch = _a.get_sketch("num")
+        assert abs(_sketch.quantile(0.5) - 500) < 30
+        assert abs(_sketch.quantile(0.99) - 990) < 30
+        assert abs(_sketch.distinct - 1000) < 50
+        _bins = _sketch.histogram.bins()
+        assert len(_bins) <= 32
+        assert sum([_count for _, _, _count in _bins]) == 20000
+        assert _bins[0][0] <= 0 and _bins[-1][1] > 999
+        assert abs(_a.get_sketch("s").distinct - 50) <= 2
+        assert _a.get_sketch_stats()["num"]["num"] == 20000
+    assert _analyzer.get_sketch("n").get_stats()["distinct"] == 0
+    assert CellTypeAnalyzer().get_sketch("num") is None
+
+    # ints out of float range are skipped in the histogram
+    _analyzer = CellTypeAnalyzer(sketches=True)
+    _analyzer.analyze({"num": 10**400}, 0)
+    _analyzer.analyze({"num": 5}, 1)
+    _sketch = _analyzer.get_sketch("num")
+    assert _sketch.quantile_sketch.num == 2
+    assert _sketch.histogram.num == 1
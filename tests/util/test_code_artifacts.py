@@ -8,8 +8,16 @@ import pytest
 
 from model.model_code_artifacts import ArtifactMeta
 from model.model_code_artifacts import CodeArtifactEnum as ARTIFACT
+from model.model_code_artifacts import VsCodeMeta
 from util import constants as C
-from util.code_artifacts import CodeArtifacts, CodeMetaDict, GitArtifact, VenvArtifact, VsCodeArtifact
+from util.code_artifacts import (
+    ArtifactMetaCache,
+    CodeArtifacts,
+    CodeMetaDict,
+    GitArtifact,
+    VenvArtifact,
+    VsCodeArtifact,
+)
 from util.persistence import Persistence
 from cli.bootstrap_env import CLI_LOG_LEVEL
 
@@ -92,3 +100,26 @@ def test_code_artifacts(fixture_path_testdata):
     _loaded_artifact = CodeMetaDict.model_validate(_json_dict)
     assert isinstance(_loaded_artifact, CodeMetaDict)
     pass
+
+
+def test_artifact_meta_cache(fixture_path_testdata, tmp_path):
+    """unchanged artifacts are read from the metadata cache"""
+    _f_cache = str(tmp_path / "artifact_meta_cache.json")
+    _artifact_meta = ArtifactMeta(p_root=fixture_path_testdata, max_path_depth=5, artifact_type=ARTIFACT.VSCODE)
+    _artifact = VsCodeArtifact(_artifact_meta)
+    _artifact.meta_cache = ArtifactMetaCache(_f_cache)
+    _artifact.read_content(max_workers=2)
+    _info_dict = dict(_artifact.info_dict)
+    assert len(_info_dict) > 0
+    assert _artifact.meta_cache.stats["misses"] == len(_info_dict)
+    _artifact.meta_cache.save()
+    # read again from the cache file
+    _artifact.meta_cache = ArtifactMetaCache(_f_cache)
+    _artifact.read_content()
+    assert _artifact.info_dict == _info_dict
+    assert _artifact.meta_cache.stats["hits"] == len(_info_dict)
+    # a changed file is not taken from the cache
+    _f_vscode = next(iter(_info_dict))
+    _signature = ArtifactMetaCache.get_signature([_f_vscode])
+    _signature[0][2] += 1
+    assert _artifact.meta_cache.get(ARTIFACT.VSCODE, _f_vscode, _signature, VsCodeMeta) == (False, None)
@@ -2,6 +2,8 @@
 
 import logging
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 # from unittest.mock import MagicMock
 # from copy import deepcopy
@@ -209,3 +211,36 @@ def test_get_ref(fixture_config_env, is_valid_config, config_key):
         assert isinstance(_ref, dict)
     else:
         assert _ref is None
+
+
+def test_get_file_ref_work_path(fixture_config_env, fixture_config_env_testpath):
+    """references are resolved against the work path without changing the current directory"""
+    _config_env = fixture_config_env
+    _cwd = os.getcwd()
+    _p_work = str(fixture_config_env_testpath)
+    _f_names = [_f for _f in os.listdir(_p_work) if os.path.isfile(os.path.join(_p_work, _f))]
+    _refs = [*_f_names, "p_configtest", "new_file.txt", os.path.join("invalid_path", "new_file.txt")]
+    with ThreadPoolExecutor(max_workers=4) as _executor:
+        _results = list(_executor.map(lambda _ref: _config_env.get_file_ref(_ref, work_path=_p_work), _refs * 4))
+    assert os.getcwd() == _cwd
+    _expected = [os.path.join(_p_work, _f) for _f in _f_names]
+    _expected.extend([_config_env.get_ref("P_CONFIGTEST"), os.path.join(_p_work, "new_file.txt"), None])
+    assert _results == _expected * 4
+    assert _config_env.get_config_keys("p_configtest") == ["P_CONFIGTEST"]
+
+
+def test_config_env_instance(fixture_sample_config_json, tmp_path, monkeypatch):
+    """shared instances and snapshots don't resolve the configuration again"""
+    _f_config = str(tmp_path / "config_env_sample.json")
+    shutil.copyfile(fixture_sample_config_json, _f_config)
+    ConfigEnv.clear_instances()
+    _config_env = ConfigEnv.get_instance(_f_config, snapshot=True)
+    assert ConfigEnv.get_instance(_f_config) is _config_env
+    assert os.path.isfile(ConfigEnv.get_snapshot_file(_config_env._f_config))
+    # new process: configuration is loaded from snapshot, where keys are not resolved
+    ConfigEnv.clear_instances()
+    monkeypatch.setattr(Utils, "where", lambda *args, **kwargs: pytest.fail("where was called"))
+    _config_snapshot = ConfigEnv.get_instance(_f_config, snapshot=True)
+    assert _config_snapshot is not _config_env
+    assert _config_snapshot.config == _config_env.config
+    ConfigEnv.clear_instances()
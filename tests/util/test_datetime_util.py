@@ -39,3 +39,29 @@ def test_isoweekyear():
     for y in range (2000,2020):
         week_years[y] = DTU.get_isoweekyear(y)
     assert isinstance(week_years,dict)
+
+def test_calendar_table(tmp_path):
+    """ testing the precomputed calendar table against isoweek """
+    from util.calendar_table import CalendarTable
+    CalendarTable.clear()
+    _tables = CalendarTable.get_years(2015, 2017)
+    assert list(_tables.keys()) == [2015, 2016, 2017]
+    _table = _tables[2016]
+    assert _table.num_days == 366
+    for _idx in range(_table.num_days):
+        _isoweek = DTU.isoweek(_table.get_datetime(_idx))
+        assert _table.calendar_week[_idx] == _isoweek["calendar_week"]
+        assert _table.iso_year[_idx] == _isoweek["year"]
+        assert _table.weekday[_idx] == _isoweek["weekday"]
+    assert _table.get_isoweekyear() == DTU.get_isoweekyear(2016)
+    # jan 1-3 2016 belong to cw 53 of 2015
+    assert list(_table.get_week_ranges().items())[:2] == [(0, (0, 3)), (1, (3, 10))]
+    assert _table.get_month_ranges()[2] == (31, 60)
+    _year_index = DTU.year_index(2016)
+    assert _year_index[1].holiday == "Neujahr" and _year_index[1].calendar_week == 53
+    # on disk cache
+    _f_cache = str(tmp_path / "calendar.json")
+    CalendarTable.get_years(2015, 2017, f_cache=_f_cache)
+    CalendarTable.clear()
+    assert CalendarTable.load(_f_cache) == 3
+    assert CalendarTable.get_year(2016).get_year_index() == _year_index
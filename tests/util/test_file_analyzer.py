@@ -2,6 +2,7 @@
 
 import logging
 import os
+import shutil
 import sys
 from copy import deepcopy
 
@@ -14,7 +15,9 @@ import pytest
 
 from util import constants as C
 from util.file_analyzer import FileAnalyzer, FileContentAnalyzer, FileSysObjectInfo
+from util.file_index import FileSysIndex
 from util.persistence import Persistence
+from util.string_matcher import StringMatcher
 from cli.bootstrap_env import CLI_LOG_LEVEL
 
 logger = logging.getLogger(__name__)
@@ -150,3 +153,235 @@ def test_filesys_object_info(fixture_testpath):
     assert isinstance(_paths, dict) and len(_paths) > 0
     assert isinstance(_file_dict, dict) and len(_file_dict) > 0
     assert isinstance(_files, list) and len(_files) > 0
+
+
+def test_filesys_object_info_index(fixture_testpath, tmp_path):
+    """reading objects from the persistent index, only changed directories are read again"""
+    _p_root = str(tmp_path.joinpath("test_path"))
+    shutil.copytree(fixture_testpath, _p_root)
+    _f_index = str(tmp_path.joinpath("file_index.db"))
+    _files_info = FileSysObjectInfo(_p_root)
+    _files_info_index = FileSysObjectInfo(_p_root, f_index=_f_index)
+    assert _files_info_index.path_dict == _files_info.path_dict
+    assert _files_info_index.files == _files_info.files
+    # rerun: nothing changed, nothing needs to be scanned
+    _file_index = FileSysIndex(_f_index)
+    _ = _file_index.refresh(_p_root)
+    assert _file_index.stats["dirs_scanned"] == 0
+    # add a file and delete a directory
+    _p_new = os.path.join(_p_root, "subpath1", "new_path")
+    os.makedirs(_p_new)
+    Persistence.save_txt_file(os.path.join(_p_new, "new_file.txt"), "new")
+    shutil.rmtree(os.path.join(_p_root, "subpath2"))
+    _files_info_index = FileSysObjectInfo(_p_root, f_index=_f_index)
+    assert _files_info_index.path_dict == FileSysObjectInfo(_p_root).path_dict
+    assert any(["new_file.txt" in _f for _f in _files_info_index.files])
+    _ = _file_index.refresh(_p_root)
+    assert _file_index.stats["dirs_scanned"] == 0
+
+
+def test_filesys_index_relative_root(fixture_testpath, tmp_path, monkeypatch):
+    """relative root paths are stored with their absolute path, subpaths are returned as given"""
+    _p_root = str(tmp_path.joinpath("test_path"))
+    shutil.copytree(fixture_testpath, _p_root)
+    _file_index = FileSysIndex(str(tmp_path.joinpath("file_index.db")))
+    _dirs = _file_index.refresh(_p_root)
+    monkeypatch.chdir(tmp_path)
+    _dirs_relative = _file_index.refresh("test_path")
+    assert _file_index.stats["dirs_scanned"] == 0
+    assert list(_dirs_relative.keys()) == [os.path.relpath(_p, tmp_path) for _p in _dirs.keys()]
+    assert list(_dirs_relative.values()) == list(_dirs.values())
+    # same relative path from another working directory is another root
+    _p_other = tmp_path.joinpath("other")
+    _p_other.joinpath("test_path").mkdir(parents=True)
+    monkeypatch.chdir(_p_other)
+    _dirs_other = _file_index.refresh("test_path")
+    assert _file_index.stats["dirs_scanned"] == 1
+    assert _dirs_other == {"test_path": []}
+    monkeypatch.chdir(tmp_path)
+    assert _file_index.refresh("test_path") == _dirs_relative
+    assert _file_index.stats["dirs_scanned"] == 0
+
+
+def test_string_matcher_compiled(fixture_testpath):
+    """compiled matching mode returns the same results as matching rule by rule"""
+    _rules = [
+        {C.RULE_NAME: "regex_txt", C.RULE_RULE: r"\.txt$", C.RULE_IS_REGEX: True, C.RULE_IGNORECASE: True},
+        {C.RULE_NAME: "regex_file", C.RULE_RULE: "file(\\d+)", C.RULE_IS_REGEX: True, C.RULE_IGNORECASE: False},
+        {C.RULE_NAME: "literal", C.RULE_RULE: "lorem", C.RULE_IS_REGEX: False, C.RULE_IGNORECASE: True},
+        {C.RULE_NAME: "backref", C.RULE_RULE: r"(\w)\1", C.RULE_IS_REGEX: True, C.RULE_IGNORECASE: True},
+        {
+            C.RULE_NAME: "exclude_md",
+            C.RULE_RULE: "md$",
+            C.RULE_IS_REGEX: True,
+            C.RULE_IGNORECASE: True,
+            C.RULE_INCLUDE: False,
+            C.RULE_APPLY: C.APPLY_ALL,
+        },
+    ]
+    _rules = [{**deepcopy(C.RULEDICT), **_rule} for _rule in _rules]
+    _matcher = StringMatcher(deepcopy(_rules), apply_default=C.APPLY_ANY)
+    _matcher_compiled = StringMatcher(deepcopy(_rules), apply_default=C.APPLY_ANY, compiled=True)
+    _files = FileSysObjectInfo(fixture_testpath).files
+    _num_hits = 0
+    for _file in _files:
+        _results = _matcher.find_all(_file)
+        assert _results == _matcher_compiled.find_all(_file)
+        _num_hits += len(_results)
+        assert _matcher.find_all(_file, by_rule=False) == _matcher_compiled.find_all(_file, by_rule=False)
+    assert _num_hits > 0
+
+    # conditional group references are evaluated one by one
+    _rules = [
+        {C.RULE_NAME: "group", C.RULE_RULE: "(q)", C.RULE_IS_REGEX: True},
+        {C.RULE_NAME: "conditional", C.RULE_RULE: "(x)?(?(1)y|z)", C.RULE_IS_REGEX: True},
+    ]
+    _rules = [{**deepcopy(C.RULEDICT), **_rule} for _rule in _rules]
+    _matcher = StringMatcher(deepcopy(_rules), apply_default=C.APPLY_ANY)
+    _matcher_compiled = StringMatcher(deepcopy(_rules), apply_default=C.APPLY_ANY, compiled=True)
+    assert len(_matcher.find_all("xy")) == 1
+    assert _matcher_compiled.find_all("xy") == _matcher.find_all("xy")
+
+
+def test_file_analyzer_compiled(fixture_testpath, fixture_ruledict_filename_path, fixture_ruledict_filename_lorem):
+    """file analyzer in compiled matching mode"""
+    _rule_lorem = deepcopy(fixture_ruledict_filename_lorem)
+    _rule_lorem[C.RULE_APPLY] = C.APPLY_ALL
+    _results = []
+    for _compiled in [False, True]:
+        file_matcher = FileAnalyzer(fixture_testpath, compiled=_compiled)
+        file_matcher.add_rules([deepcopy(_rule_lorem), deepcopy(fixture_ruledict_filename_path)])
+        _results.append(file_matcher.find_file_objects())
+    assert len(_results[1]) == 1
+    assert _results[0] == _results[1]
+
+
+def test_add_path_matches(fixture_testpath):
+    """path matches are only added to files within the path"""
+    _p = str(fixture_testpath)
+    _p_sub = os.path.join(_p, "subpath1")
+    _path_objects = {_p: {"rule_root": {}}, _p_sub: {"rule_sub": {}}}
+    _file_objects = {
+        os.path.join(_p_sub, "subpath11", "file11_1.txt"): {"rule_file": {}},
+        os.path.join(_p + "_other", "file.txt"): {"rule_file": {}},
+        os.path.join(_p, "subpath11", "file.txt"): {"rule_file": {}},
+    }
+    FileAnalyzer._add_path_matches(_file_objects, _path_objects)
+    _rules = [sorted(_file_info.keys()) for _file_info in _file_objects.values()]
+    assert _rules[0] == ["rule_file", "rule_root", "rule_sub"]
+    assert _rules[1] == ["rule_file"]
+    assert _rules[2] == ["rule_file", "rule_root"]
+
+
+def test_find_in_files(fixture_testpath, fixture_ruledict_file_content_all_rules, fixture_ruledict_file_content):
+    """searching multiple files in a process pool gives the same results as searching file by file"""
+    file_analyzer = FileContentAnalyzer(fixture_testpath)
+    file_analyzer.add_rules(fixture_ruledict_file_content_all_rules)
+    _rule_text = deepcopy(fixture_ruledict_file_content)
+    _rule_text[C.RULE_NAME] = "testrule_text"
+    _rule_text[C.RULE_RULE] = "lorem"
+    _rule_text[C.RULE_FIND_BY_LINE] = False
+    file_analyzer.add_rule(_rule_text)
+    _files = FileSysObjectInfo(fixture_testpath).files
+    _results = dict(file_analyzer.find_in_files(_files, max_workers=2))
+    assert len(_results) > 0
+    for _file in _files:
+        _results_file = file_analyzer.find(_file)
+        assert _results.get(_file, {}) == _results_file
+
+
+def test_find_file_content_mmap(
+    fixture_testfile_md, fixture_ruledict_file_content_all_rules, fixture_ruledict_file_content
+):
+    """scanning memory mapped file contents gives the same results as reading the lines"""
+    _rule_regex = deepcopy(fixture_ruledict_file_content)
+    _rule_regex[C.RULE_NAME] = "testrule_regex"
+    _rule_regex[C.RULE_RULE] = r"\w+or\w*"
+    _rules = [*fixture_ruledict_file_content_all_rules, _rule_regex]
+    _results = []
+    for _use_mmap in [False, True]:
+        file_analyzer = FileContentAnalyzer(use_mmap=_use_mmap)
+        file_analyzer.add_rules(deepcopy(_rules))
+        _results.append(file_analyzer.find(fixture_testfile_md))
+    assert len(_results[1]) > 1
+    assert _results[0] == _results[1]
+
+
+@pytest.mark.parametrize("line_break", ["\n", "\r\n"])
+def test_find_file_content_mmap_lines(fixture_ruledict_file_content, tmp_path, line_break):
+    """scanning memory mapped bytes matches within lines only, the same as reading the lines (also for CRLF)"""
+    _lines = [
+        "Lorem ipsum dolor",
+        "lorem",
+        "ipsum foo",
+        "",
+        "LOREM IPSUM foo  ",
+        "end lorem ipsum",
+        "Grüße aus München, schöne Größe",
+    ]
+    _f = tmp_path / "lines.txt"
+    _f.write_bytes(line_break.join(_lines).encode("utf-8"))
+    _f_empty = tmp_path / "empty.txt"
+    _f_empty.write_bytes(b"")
+    # rule, is_regex, ignorecase, use bytes regex (by line, complete text)
+    _rule_defs = [
+        ("lorem ipsum", False, True, (True, True)),
+        ("Lorem", False, False, (True, True)),
+        ("Lorem", False, True, (False, False)),
+        ("aus", False, True, (True, True)),
+        ("München", False, False, (True, True)),
+        ("grüße", False, True, (False, False)),
+        (r"lorem[ \n]+ipsum", True, True, (True, False)),
+        (r"lorem\s+ipsum", True, True, (False, False)),
+        (r"foo$", True, True, (True, True)),
+        (r"foo *$", True, False, (True, True)),
+        (r"^ipsum", True, True, (True, True)),
+        (r"ips.m", True, True, (False, False)),
+        (r"^$", True, True, (False, False)),
+    ]
+    for _rule_num, (_rule_value, _is_regex, _ignorecase, _use_bytes) in enumerate(_rule_defs):
+        for _by_line in [True, False]:
+            _rule = deepcopy(fixture_ruledict_file_content)
+            _rule[C.RULE_NAME] = f"testrule_{_rule_num}"
+            _rule[C.RULE_RULE] = _rule_value
+            _rule[C.RULE_IS_REGEX] = _is_regex
+            _rule[C.RULE_IGNORECASE] = _ignorecase
+            _rule[C.RULE_FIND_BY_LINE] = _by_line
+            file_analyzer = FileContentAnalyzer()
+            file_analyzer.add_rule(_rule)
+            _matcher = file_analyzer._get_matcher(C.RULE_FILE_CONTENT)
+            _rule_dict = _matcher.rules[_rule[C.RULE_NAME]]
+            _use_bytes_rule = _use_bytes[0] if _by_line else _use_bytes[1]
+            assert (FileContentAnalyzer._bytes_regex(_rule_dict, "utf-8") is not None) is _use_bytes_rule
+            for _file in [str(_f), str(_f_empty)]:
+                _results_lines = FileContentAnalyzer._find_content_in_file(_file, _matcher, "utf-8", True)
+                _results_mmap = FileContentAnalyzer._find_content_in_file_mmap(_file, _matcher, "utf-8", True)
+                assert _results_lines == _results_mmap, f"rule [{_rule_value}], by line [{_by_line}], [{_file}]"
+
+    # a by line rule doesn't match across lines
+    _rule = deepcopy(fixture_ruledict_file_content)
+    _rule[C.RULE_RULE] = r"lorem[ \n]+ipsum"
+    _rule[C.RULE_IS_REGEX] = True
+    _rule[C.RULE_FIND_BY_LINE] = True
+    file_analyzer = FileContentAnalyzer(use_mmap=True)
+    file_analyzer.add_rule(_rule)
+    assert list(file_analyzer.find_file_content(str(_f)).keys()) == [0, 4, 5]
+
+
+def test_find_file_content_mmap_binary(fixture_testpath, fixture_ruledict_file_content, tmp_path):
+    """binary files are skipped when scanning memory mapped file contents"""
+    _f_binary = os.path.join(fixture_testpath.parent, "sample_plant_uml", "sample.png")
+    _rule = deepcopy(fixture_ruledict_file_content)
+    _rule[C.RULE_RULE] = "."
+    file_analyzer = FileContentAnalyzer(use_mmap=True)
+    file_analyzer.add_rule(_rule)
+    assert file_analyzer.find_file_content(_f_binary) == {}
+
+    # text files with many non ascii characters are not skipped
+    _f_text = tmp_path / "non_ascii.txt"
+    _f_text.write_bytes("Grüße aus München, schöne Größe".encode("utf-8"))
+    _rule[C.RULE_RULE] = "aus"
+    file_analyzer = FileContentAnalyzer(use_mmap=True)
+    file_analyzer.add_rule(_rule)
+    assert Persistence.istextfile(str(_f_text)) is False
+    assert list(file_analyzer.find_file_content(str(_f_text)).keys()) == [0]
@@ -2,6 +2,8 @@
 
 from util.file_tree import FileTree
 from util.file_tree import ParamsFileTreeModel
+from util.tree import AGG_COUNT, AGG_MAX, AGG_MIN, AGG_SUM, Tree
+from util.utils import IS_FILE, ROOT, SIZE, TOTAL_FILES, TOTAL_SIZE
 
 
 def test_file_tree(fixture_params_find):
@@ -22,3 +24,47 @@ def test_file_subtotals(fixture_params_find):
     )
     _file_tree = FileTree(_file_tree_params)
     _file_tree._calc_total_sizes()
+    _tree_dict = _file_tree.tree_dict
+    _root_info = _tree_dict[ROOT]
+    _files = [_info for _info in _tree_dict.values() if _info.get(IS_FILE) is True]
+    # subtotals are not added up again when calculated twice
+    assert _root_info[TOTAL_SIZE] == sum([_info[SIZE] for _info in _files])
+    assert _root_info[TOTAL_FILES] == len(_files)
+    # recalculation for a single file: paths without that file have no totals any more
+    _file_id = next(_id for _id, _info in _tree_dict.items() if _info.get(IS_FILE) is True)
+    _file_tree._calc_total_sizes(leaves=[_file_id])
+    assert _root_info[TOTAL_SIZE] == _tree_dict[_file_id][SIZE]
+    assert _root_info[TOTAL_FILES] == 1
+    _paths_without_totals = [
+        _info for _info in _tree_dict.values() if _info.get(IS_FILE) is not True and TOTAL_FILES not in _info
+    ]
+    assert len(_paths_without_totals) > 0
+    assert all([TOTAL_SIZE not in _info for _info in _paths_without_totals])
+
+
+def test_tree_aggregate(fixture_test_tree):
+    """aggregating values bottom up"""
+    for _node_id, _node_info in fixture_test_tree.items():
+        _node_info["num"] = _node_id
+    _tree = Tree()
+    _tree.create_tree(fixture_test_tree, parent_field="parent")
+    _aggregates = _tree.aggregate("num", node_filter=lambda _id, _obj: _tree.is_leaf(_id))
+    assert _aggregates[8]["num"] == {AGG_COUNT: 2, AGG_SUM: 21, AGG_MIN: 10, AGG_MAX: 11}
+    assert _aggregates[1]["num"][AGG_COUNT] == 6
+    assert _aggregates[1]["num"][AGG_SUM] == 4 + 5 + 7 + 9 + 10 + 11
+    assert _aggregates[4]["num"][AGG_COUNT] == 1
+
+    # values that can't be compared are skipped for min / max
+    fixture_test_tree[5]["num"] = None
+    fixture_test_tree[11]["num"] = "eleven"
+    _tree = Tree()
+    _tree.create_tree(fixture_test_tree, parent_field="parent")
+    _aggregates = _tree.aggregate("num", node_filter=lambda _id, _obj: _tree.is_leaf(_id))
+    assert _aggregates[2]["num"] == {AGG_COUNT: 1, AGG_SUM: 4, AGG_MIN: 4, AGG_MAX: 4}
+    assert _aggregates[1]["num"][AGG_COUNT] == 5
+    assert _aggregates[1]["num"][AGG_SUM] is None
+    # nodes are aggregated bottom up: "eleven" is the first value of node 8, the numbers
+    # below node 1 are compared with the min / max of nodes 3 and 2
+    assert _aggregates[8]["num"] == {AGG_COUNT: 2, AGG_SUM: None, AGG_MIN: "eleven", AGG_MAX: "eleven"}
+    assert _aggregates[1]["num"][AGG_MIN] == 4
+    assert _aggregates[1]["num"][AGG_MAX] == 9
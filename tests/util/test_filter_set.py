@@ -396,3 +396,75 @@ def test_filter_sets_single_calendar_group(rule_matches, atomic_filter, groups,
     """testing filter sets"""
     _result = _filter_set_single_atomic_filter(atomic_filter, groups, test_object)
     assert _result.passed == rule_matches
+
+
+@pytest.mark.parametrize(
+    "rule_matches,atomic_filter,groups,test_object",
+    [
+        *atomic_filter_test_sets("TEST_OBJECT_GROUP_STR"),
+        *atomic_filter_test_sets("TEST_OBJECT_GROUP_INT"),
+        *atomic_filter_test_sets("TEST_OBJECT_GROUP_DATE"),
+        *atomic_filter_test_sets("TEST_OBJECT_GROUP_CALENDAR"),
+    ],
+)
+def test_filter_sets_single_compiled(rule_matches, atomic_filter, groups, test_object):
+    """compiled filter sets return the same results"""
+    for _include in ["include", "exclude"]:
+        _filter_set_model = FilterSetModel(
+            key="filter_set_compiled", filter_list=[atomic_filter], operator="all", include=_include
+        )
+        _filter_set = FilterSet(obj_filter=_filter_set_model)
+        _compiled = _filter_set.compile(groups)
+        assert _filter_set.compile(groups) is _compiled
+        assert _compiled(test_object) == _filter_set.filter(test_object, groups=groups)
+        if _include == "include":
+            assert _compiled(test_object) == rule_matches
+
+
+def test_filter_set_compiled(fixture_filter_set):
+    """compiled filter set with several filters"""
+    for _test_object in [13, 25, "hugo", DateTime(2025, 1, 16), {"a": 1}, None]:
+        for _groups in [None, "group1", ["group1", "group2"]]:
+            _compiled = fixture_filter_set.compile(_groups)
+            assert _compiled(_test_object) == fixture_filter_set.filter(_test_object, groups=_groups)
+
+    # invalidating a filter set also drops the compiled functions of nested filter sets
+    _filter_set_nested = FilterSet(
+        FilterSetModel(key="nested", filter_list=fixture_filter_set._filter_list, groups=["nested"])
+    )
+    _filter_set = FilterSet(FilterSetModel(key="outer", filter_list=[_filter_set_nested]))
+    _compiled = _filter_set.compile()
+    assert _compiled(13) == _filter_set.filter(13)
+    assert len(_filter_set_nested._compiled) > 0
+    _filter_set.invalidate()
+    assert len(_filter_set._compiled) == 0 and len(_filter_set_nested._compiled) == 0
+    assert _filter_set.compile() is not _compiled
+
+
+def test_filter_set_filter_many(fixture_filter_set):
+    """filtering lists and columns returns the same results as filtering object by object"""
+    _test_objects = [13, 25, "hugo", DateTime(2025, 1, 16), {"a": 1}, None]
+    for _groups in [None, "group1", ["group1", "group2"]]:
+        _expected = [fixture_filter_set.filter(_obj, groups=_groups) for _obj in _test_objects]
+        assert fixture_filter_set.filter_many(_test_objects, groups=_groups) == _expected
+
+    _numerical_filter = NumericalFilter(
+        NumericalFilterModel(key="num", value_min=10, value_max=20, attributes=["num"], groups=["g"])
+    )
+    _string_filter = StringFilter(
+        StringFilterModel(key="str", filter_strings=["xyz", "hugo"], match="exact", attributes=["s"], groups=["g"])
+    )
+    assert _numerical_filter.filter_many([5, 10, 20, 21, 15.0, "x"]) == [False, True, True, False, None, None]
+    assert _string_filter.filter_many(["xyz", "xyzz", "hugo", 3]) == [True, False, True, None]
+    _objs = [{"num": 12, "s": "hugo"}, {"num": 25, "s": "hugo"}, {"num": 12}, {"s": "x"}, {}]
+    for _operator in ["all", "any"]:
+        for _include in ["include", "exclude"]:
+            _filter_set = FilterSet(
+                FilterSetModel(
+                    key="set", filter_list=[_numerical_filter, _string_filter], operator=_operator, include=_include
+                )
+            )
+            _expected = [_filter_set.filter(_obj) for _obj in _objs]
+            assert _filter_set.filter_many(_objs) == _expected
+            _columns = {"num": [12, 25, 12, None, None], "s": ["hugo", "hugo", None, "x", None]}
+            assert _filter_set.filter_columns(_columns) == _expected
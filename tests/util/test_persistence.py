@@ -190,3 +190,54 @@ def test_find(num_entries, expected, kwargs):
                 _found = True
                 break
         assert _found is True, f"Expected [{expected}], got {_results}"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"paths": True, "files": True},
+        {"as_dict": True},
+        {"include_files": "file1", "exclude_files": "_2"},
+        {"include_paths": "subpath", "exclude_abspaths": "md$"},
+        {"max_path_depth": 1, "paths": True},
+        {"root_path_only": True},
+        {"paths_only": True, "as_dict": True},
+        {"max_num_dirs": 2, "paths": True},
+        {"max_num_files": 25, "as_dict": True},
+        {"max_num_dirs": 3, "max_path_depth": 1, "paths": True},
+    ],
+)
+def test_find_scandir_engine(kwargs):
+    """the scandir engine should return the same results as the os.walk engine"""
+    _p_testpath = os.path.join(TEST_PATH, "test_data", "test_path")
+    _results_walk = Persistence.find(p_root_paths=_p_testpath, show_progress=False, **kwargs)
+    # results are deterministic, also with file / dir limits
+    for _ in range(5):
+        _results_scandir = Persistence.find(
+            p_root_paths=_p_testpath, show_progress=False, engine="scandir", max_workers=4, **kwargs
+        )
+        assert _results_walk == _results_scandir
+    assert len(_results_scandir) > 0
+
+
+def test_find_multi():
+    """searching multiple filters in one pass should return the same results as single searches"""
+    _p_testpath = os.path.join(TEST_PATH, "test_data", "test_path")
+    _p_subpath = os.path.join(_p_testpath, "subpath1")
+    _filters = {
+        "tuple": {"paths": True, "files": True},
+        "dict": {"as_dict": True, "p_root_paths": [_p_subpath, _p_testpath]},
+        "files": {"include_files": "file1", "exclude_files": "_2"},
+        "paths": {"include_paths": "subpath", "exclude_abspaths": "md$", "paths": True, "files": False},
+        "depth": {"max_path_depth": 1, "paths": True},
+        "root": {"root_path_only": True},
+        "paths_only": {"paths_only": True, "as_dict": True, "max_path_depth": 0},
+        "max_files": {"max_num_files": 5},
+    }
+    for _filter in _filters.values():
+        _filter.setdefault("p_root_paths", _p_testpath)
+        _filter["show_progress"] = False
+    _results = Persistence.find_multi(_filters)
+    assert list(_results.keys()) == list(_filters.keys())
+    for _key, _filter in _filters.items():
+        assert _results[_key] == Persistence.find(**_filter), f"Filter [{_key}] differs"
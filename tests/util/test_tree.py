@@ -1,8 +1,11 @@
 """Unit Tests for the Constants Class"""
 
+import io
 import logging
 from util.tree import Tree
 from util.tree_filtered import TreeFiltered
+from util.tree_compact import CompactTree
+from util.tree_markup import TreeMarkup
 from model.model_tree import TreeNodeModel
 from cli.bootstrap_env import CLI_LOG_LEVEL
 
@@ -104,3 +107,105 @@ def test_filtered_tree(fixture_test_tree):
     assert _node_filtered is not None, "Node should be found as filter is switched off"
     _node_filtered = _filtered_tree.get_node(3)
     assert _node_filtered is not None, "Node should be found as filter is switched off"
+
+
+def test_tree_cached_views(fixture_test_tree):
+    """cached views are invalidated when the filter changes"""
+    _filtered_tree = TreeFiltered(filter_type="exclude")
+    _filtered_tree.create_tree(fixture_test_tree, parent_field="parent")
+    _hierarchy = _filtered_tree.hierarchy
+    assert len(_hierarchy) == 11
+    # cached views are returned for the same version
+    assert _filtered_tree.hierarchy is _hierarchy
+    assert len(_filtered_tree.get_leaves()) == 6
+    assert len(_filtered_tree.get_all_children(1)) == 10
+    _version = _filtered_tree.version
+    _intervals = _filtered_tree._get_intervals()
+    _filtered_tree.add_filter(3)
+    assert _filtered_tree.version > _version
+    # the interval index doesn't depend on filters
+    assert _filtered_tree._get_intervals() is _intervals
+    assert len(_filtered_tree.hierarchy) == 4
+    assert len(_filtered_tree.get_leaves()) == 2
+    assert len(_filtered_tree.get_all_children(1)) == 3
+    _filtered_tree.is_active = False
+    assert len(_filtered_tree.hierarchy) == 11
+    _filtered_tree.is_active = True
+    _filtered_tree.remove_filter(3)
+    assert len(_filtered_tree.get_all_children(1)) == 10
+
+
+def test_compact_tree(fixture_test_tree):
+    """compact tree returns the same results as the default tree"""
+    _tree = Tree()
+    _tree.create_tree(fixture_test_tree, parent_field="parent")
+    _compact_tree = CompactTree()
+    _compact_tree.create_tree(fixture_test_tree, parent_field="parent")
+    assert _compact_tree.root_id == _tree.root_id
+    assert _compact_tree.max_level == _tree.max_level
+    # nodes are only created on access
+    assert len(_compact_tree._hierarchy_nodes_dict) == 0
+    assert _compact_tree.get_leaves() == _tree.get_leaves()
+    for _node_id in _tree.hierarchy.keys():
+        assert _compact_tree.get_children(_node_id) == _tree.get_children(_node_id)
+        assert _compact_tree.get_all_children(_node_id) == _tree.get_all_children(_node_id)
+        assert _compact_tree.get_predecessors(_node_id) == _tree.get_predecessors(_node_id)
+        assert _compact_tree.get_siblings(_node_id) == _tree.get_siblings(_node_id)
+        assert _compact_tree.is_leaf(_node_id) == _tree.is_leaf(_node_id)
+    assert len(_compact_tree._hierarchy_nodes_dict) == 0
+    _node = _compact_tree.get_node(8)
+    assert isinstance(_node, TreeNodeModel)
+    assert _node.children == _tree.get_node(8).children
+    assert _node.level == _tree.get_node(8).level
+    assert _compact_tree.get_node(99) is None
+    assert _compact_tree.get_nested_dict() == _tree.get_nested_dict()
+
+
+def test_tree_intervals(fixture_test_tree):
+    """subtree and ancestor queries using the interval index"""
+    for _tree in [Tree(), CompactTree()]:
+        _tree.create_tree(fixture_test_tree, parent_field="parent")
+        assert _tree.get_subtree_size(1) == 10
+        assert _tree.get_subtree_size(6) == 5
+        assert _tree.get_subtree_size(10) == 0
+        assert _tree.get_subtree(3) == [6, 7, 8, 10, 11, 9]
+        assert _tree.get_subtree(3, only_leaves=True) == [7, 10, 11, 9]
+        assert sorted(_tree.get_subtree(1)) == sorted(_tree.get_all_children(1))
+        assert _tree.is_descendant(10, 3)
+        assert not _tree.is_descendant(3, 3)
+        assert not _tree.is_descendant(4, 3)
+        assert _tree.is_descendant(99, 1) is None
+    _filtered_tree = TreeFiltered(filter_type="exclude")
+    _filtered_tree.create_tree(fixture_test_tree, parent_field="parent")
+    _filtered_tree.add_filter(6)
+    assert _filtered_tree.filtered_nodes == {6: {7, 8, 9, 10, 11}}
+    assert _filtered_tree.get_subtree(3) == []
+    assert _filtered_tree.get_node(10) is None
+
+
+def test_tree_markup(fixture_tree: Tree):
+    """streamed markup is the same as markup with joined children"""
+
+    class TreeMarkupJoined(TreeMarkup):
+        """joins children node by node"""
+
+        def join_rendered_children(self, rendered_children: list) -> str:
+            return "\n".join(rendered_children)
+
+    # streaming doesn't render the whole tree
+    _markup = TreeMarkup(fixture_tree)
+    _writer = io.StringIO()
+    _markup.write(_writer)
+    assert _markup._rendered_tree is None
+    _rendered = _markup.rendered
+    assert _writer.getvalue() == _rendered
+    assert _rendered.startswith("{")
+    assert _rendered.endswith("\n}")
+    # 5 inner nodes and 6 leaves
+    assert _rendered.count("{") == _rendered.count("}") == 5
+    assert _rendered.count("[") == 6
+    assert "".join(_markup.iter_chunks()) == _rendered
+    assert TreeMarkupJoined(fixture_tree).rendered == _rendered
+    _writer = io.StringIO()
+    TreeMarkupJoined(fixture_tree).write(_writer)
+    assert _writer.getvalue() == _rendered
@@ -7,6 +7,7 @@ import pytest
 
 from util import constants as C
 from util.matrix_list import MatrixList
+from util.path_resolver import IS_WIN, PathResolver
 from util.utils import Utils
 
 
@@ -22,6 +23,35 @@ def test_where(_cmd):
     assert os.path.isfile(_cmd)
 
 
+def test_path_resolver(tmp_path):
+    """executables are found in PATH order, index is cached and renewed if a PATH dir changes"""
+    _ext = ".exe" if IS_WIN else ""
+    _dirs = [tmp_path / "bin1", tmp_path / "bin2"]
+    for _dir in _dirs:
+        _dir.mkdir()
+        _f = _dir / f"mycmd{_ext}"
+        _f.write_text("")
+        _f.chmod(0o755)
+    _path_env = os.pathsep.join([str(_dir) for _dir in _dirs])
+    _f_cache = str(tmp_path / "path_cache.json")
+    PathResolver.clear()
+    _cmds = PathResolver.where("mycmd", path_env=_path_env, f_cache=_f_cache)
+    assert _cmds == [str(_dir / f"mycmd{_ext}") for _dir in _dirs]
+    assert os.path.isfile(_f_cache)
+    assert PathResolver.which("mycmd", re_prefered="bin2", path_env=_path_env, f_cache=_f_cache) == _cmds[1]
+    assert PathResolver.where("othercmd", path_env=_path_env, f_cache=_f_cache) == []
+    # index is read from disk cache
+    PathResolver.clear()
+    assert PathResolver.where("mycmd", path_env=_path_env, f_cache=_f_cache) == _cmds
+    # adding an executable changes the directory modification time
+    _f = _dirs[0] / f"othercmd{_ext}"
+    _f.write_text("")
+    _f.chmod(0o755)
+    os.utime(_dirs[0], ns=(0, os.stat(_dirs[0]).st_mtime_ns + 1))
+    assert PathResolver.where("othercmd", path_env=_path_env, f_cache=_f_cache) == [str(_f)]
+    PathResolver.clear()
+
+
 def test_get_python():
     """the get_python usually will select the Python associated with the VENV"""
     # to assert it we need to replace the quotes again ...
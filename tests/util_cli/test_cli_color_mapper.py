@@ -37,3 +37,32 @@ def test_ansi2rgb():
     """test the ansi code calculation"""
     for _code in range(256):
         assert ColorMapper._ansi2rgb(_code) == ColorMapper.ansi2rgb(_code)
+
+
+def test_rgb2code_nearest():
+    """test the nearest color code against all colors"""
+    _color_mapper = ColorMapper()
+    _values = list(range(0, 256, 17)) + [7, 8, 13, 94, 96, 238, 240]
+    for _r in _values:
+        for _g in _values:
+            for _b in [0, 13, 95, 114, 115, 240, 255]:
+                _rgb = (_r, _g, _b)
+                _dists = [sum([(_c - _v) ** 2 for _c, _v in zip(_rgb, RGB_COLORS[_code])]) for _code in range(16, 256)]
+                _code = ColorMapper.rgb2code_nearest(_rgb)
+                assert _dists[_code - 16] == min(_dists), f"{_rgb} has nearer color than {_code}"
+    # exact colors
+    for _code in range(16, 256):
+        assert RGB_COLORS[ColorMapper.rgb2code_nearest(RGB_COLORS[_code])] == RGB_COLORS[_code]
+    assert _color_mapper.nearest_codes([(255, 0, 0), "#ff0000", "#ff01", (300, 0, 0)]) == [196, 196, None, None]
+    assert _color_mapper.nearest_codes([(255, 0, 0)], base_colors=True) == [9]
+
+
+def test_convert_many():
+    """test bulk conversion against single conversion"""
+    _color_mapper = ColorMapper()
+    _values = [12, RGB_COLORS[10], HEX_COLORS[20], COLOR_NAMES[100], HEX_COLORS[20], [1, 2, 3], "abcd"]
+    for _to in [HEX, CODE, NAME, RGB]:
+        assert _color_mapper.convert_many(_values, _to) == [_color_mapper.convert(_v, _to) for _v in _values]
+    # reverse lookups return the first code as list.index
+    assert _color_mapper.hex2code(HEX_COLORS[196]) == HEX_COLORS.index(HEX_COLORS[196])
+    assert _color_mapper.rgb2code([0, 0, 0]) is None
@@ -46,3 +46,24 @@ def test_color_schema_model_dump(fixture_color_schema):
     # get it as dict
     _all_color_schemas_dict = _all_color_schemas.model_dump()
     assert isinstance(_all_color_schemas_dict, dict)
+
+
+def test_color_schema_style_cache(fixture_color_schema):
+    """schema colors and styles are served from the shared style cache"""
+    from util_cli.cli_style_cache import KEY_SCHEMA_COLOR, STYLE_CACHE, StyleCache
+
+    _color_schema = fixture_color_schema
+    STYLE_CACHE.clear(KEY_SCHEMA_COLOR)
+    _color = _color_schema.color(index=2, num_colors=5, schema="blues")
+    _hits = STYLE_CACHE.stats["hits"]
+    assert _color_schema.color(index=2, num_colors=5, schema="blues") == _color
+    assert STYLE_CACHE.stats["hits"] == _hits + 1
+    assert STYLE_CACHE.style(color="red") is STYLE_CACHE.style(color="red")
+    assert STYLE_CACHE.parse("bold green") is STYLE_CACHE.parse("bold green")
+    # least recently used item is dropped
+    _cache = StyleCache(max_size=2)
+    _cache.put(("a",), 1)
+    _cache.put(("b",), 2)
+    assert _cache.get(("a",)) == 1
+    _cache.put(("c",), 3)
+    assert len(_cache) == 2 and _cache.get(("b",)) is None and _cache.get(("a",)) == 1